@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Reports the shared and private memory of worker processes forked after
+building a large synthetic schema, with and without ``Schema.freeze()``.
+
+Linux only (reads /proc/<pid>/smaps_rollup).
+
+    python bin/measure_fork_memory.py --types 3000 --workers 4
+"""
+
+import argparse
+import gc
+import os
+
+from graphene import Field, Int, Interface, List, ObjectType, Schema, String
+
+QUERY = """
+{
+    __schema { types { name fields { name type { name } } } }
+    last { name value items }
+}
+"""
+
+
+def build_schema(type_count):
+    class Named(Interface):
+        name = String()
+
+    types = [
+        type(
+            f"Type{index}",
+            (ObjectType,),
+            {
+                "Meta": type("Meta", (), {"interfaces": (Named,)}),
+                "value": Int(),
+                "items": List(String),
+            },
+        )
+        for index in range(type_count)
+    ]
+    query = type(
+        "Query",
+        (ObjectType,),
+        {
+            "last": Field(types[-1]),
+            "resolve_last": lambda root, info: {
+                "name": "last",
+                "value": 1,
+                "items": ["a"],
+            },
+        },
+    )
+    return Schema(query, types=types)
+
+
+def read_memory(pid):
+    """Returns the shared and private memory of a process, in kB."""
+    memory = {}
+    with open(f"/proc/{pid}/smaps_rollup") as smaps:
+        for line in smaps:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                memory[parts[0].rstrip(":")] = int(parts[1])
+    shared = memory.get("Shared_Clean", 0) + memory.get("Shared_Dirty", 0)
+    private = memory.get("Private_Clean", 0) + memory.get("Private_Dirty", 0)
+    return shared, private
+
+
+def run_worker(schema, requests, ready, done):
+    for _ in range(requests):
+        result = schema.execute(QUERY)
+        assert not result.errors, result.errors
+    # Let a few collections run, as they do in long running workers
+    for _ in range(3):
+        gc.collect()
+    os.write(ready, b"x")
+    os.read(done, 1)
+    os._exit(0)
+
+
+def measure(type_count, worker_count, requests, freeze):
+    schema = build_schema(type_count)
+    if freeze:
+        schema.freeze()
+
+    workers = []
+    for _ in range(worker_count):
+        ready_read, ready_write = os.pipe()
+        done_read, done_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            run_worker(schema, requests, ready_write, done_read)
+        workers.append((pid, ready_read, done_write))
+
+    results = []
+    for pid, ready_read, done_write in workers:
+        os.read(ready_read, 1)
+        results.append(read_memory(pid))
+        os.write(done_write, b"x")
+        os.waitpid(pid, 0)
+
+    if freeze:
+        gc.unfreeze()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--types", type=int, default=3000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.types} types, {args.workers} workers, {args.requests} requests")
+    print(f"{'mode':<10}{'worker':>8}{'shared kB':>12}{'private kB':>12}")
+    for freeze in (False, True):
+        mode = "freeze" if freeze else "no freeze"
+        results = measure(args.types, args.workers, args.requests, freeze)
+        for index, (shared, private) in enumerate(results):
+            print(f"{mode:<10}{index:>8}{shared:>12}{private:>12}")
+        average_private = sum(private for _shared, private in results) // len(results)
+        print(f"{mode:<10}{'average':>8}{'':>12}{average_private:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from .pyutils.version import get_version
 from .relay import (
     BaseGlobalIDType,
     ClientIDMutation,
+    CompactGlobalIDType,
     Connection,
     ConnectionField,
     DefaultGlobalIDType,
@@ -59,6 +60,7 @@ __all__ = [
     "BaseGlobalIDType",
     "Boolean",
     "ClientIDMutation",
+    "CompactGlobalIDType",
     "Connection",
     "ConnectionField",
     "Context",
@@ -0,0 +1,4 @@
+from .compiled import CompiledExecutionContext, QueryPlan
+from .trivial import TrivialFieldExecutionContext
+
+__all__ = ["CompiledExecutionContext", "QueryPlan", "TrivialFieldExecutionContext"]
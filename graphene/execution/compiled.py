@@ -0,0 +1,399 @@
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from math import isfinite
+from uuid import UUID
+
+from graphql import (
+    BREAK,
+    ExecutionContext,
+    GraphQLBoolean,
+    GraphQLFloat,
+    GraphQLID,
+    GraphQLInt,
+    GraphQLString,
+    ListValueNode,
+    ObjectValueNode,
+    Undefined,
+    VariableNode,
+    Visitor,
+    is_abstract_type,
+    is_leaf_type,
+    is_list_type,
+    is_non_null_type,
+    located_error,
+    visit,
+)
+from graphql.execution.execute import assume_not_awaitable, get_field_def
+from graphql.execution.values import get_argument_values
+from graphql.pyutils import is_iterable
+from graphql.type.scalars import GRAPHQL_MAX_INT, GRAPHQL_MIN_INT
+
+from .trivial import TRIVIAL_FIELD_GETTER, TrivialFieldExecutionContext
+
+
+def serialize_builtin_int(value):
+    if type(value) is int and GRAPHQL_MIN_INT <= value <= GRAPHQL_MAX_INT:
+        return value
+    return Undefined
+
+
+def serialize_builtin_float(value):
+    if type(value) is float and isfinite(value):
+        return value
+    return Undefined
+
+
+def serialize_builtin_string(value):
+    if type(value) is str:
+        return value
+    return Undefined
+
+
+def serialize_builtin_boolean(value):
+    if type(value) is bool:
+        return value
+    return Undefined
+
+
+# Fast serializers for the built-in scalars, returning Undefined for the values
+# that need the full `serialize` of the type (coercion or errors).
+builtin_serializers = {
+    GraphQLInt: serialize_builtin_int,
+    GraphQLFloat: serialize_builtin_float,
+    GraphQLString: serialize_builtin_string,
+    GraphQLID: serialize_builtin_string,
+    GraphQLBoolean: serialize_builtin_boolean,
+}
+
+
+class VariableDirectivesVisitor(Visitor):
+    """Finds if any directive (such as @skip or @include) depends on variables."""
+
+    def __init__(self):
+        super().__init__()
+        self.found = False
+
+    def enter_directive(self, node, *_args):
+        if any(contains_variables(argument.value) for argument in node.arguments):
+            self.found = True
+            return BREAK
+
+
+def contains_variables(value_node):
+    if isinstance(value_node, VariableNode):
+        return True
+    if isinstance(value_node, ListValueNode):
+        return any(contains_variables(value) for value in value_node.values)
+    if isinstance(value_node, ObjectValueNode):
+        return any(contains_variables(field.value) for field in value_node.fields)
+    return False
+
+
+# The argument values which can be shared by all the executions of a plan:
+# mutable values (lists, input objects...) are coerced on every execution, so
+# the resolvers can't leak state between requests.
+IMMUTABLE_ARGUMENT_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    Decimal,
+    date,
+    time,
+    UUID,
+    Enum,
+)
+
+
+def are_immutable_arguments(args):
+    return all(isinstance(value, IMMUTABLE_ARGUMENT_TYPES) for value in args.values())
+
+
+class FieldPlan(object):
+    __slots__ = ("field_def", "return_type", "args", "complete", "get_value")
+
+    def __init__(self, field_def, return_type, args, complete):
+        self.field_def = field_def
+        self.return_type = return_type
+        # The arguments are None when they depend on the variables of the operation
+        self.args = args
+        self.complete = complete
+        # Getter of the value of trivial fields, which skip their resolver
+        self.get_value = field_def.extensions.get(TRIVIAL_FIELD_GETTER)
+
+
+class QueryPlan(object):
+    """
+    The compiled execution plan of a validated document.
+
+    The plan is filled in the first time each part of the document is executed,
+    and reused by every later execution of the same document: it keeps the
+    fields collected for every selection set and concrete type, the field
+    definitions (with the resolvers bound by the TypeMap), the immutable
+    arguments that don't depend on variables and a specialized completion function for every
+    return type, with inlined serializers for the built-in scalars.
+    """
+
+    def __init__(self, schema, document):
+        self.schema = schema
+        # Keeping a reference to the document keeps the ids of its nodes, used
+        # as keys of the plan, stable.
+        self.document = document
+        visitor = VariableDirectivesVisitor()
+        visit(document, visitor)
+        self.static_selections = not visitor.found
+        self.subfields = {}
+        self.fields = {}
+        self.completers = {}
+        self.execution_context_class = type(
+            "CompiledExecutionContext", (CompiledExecutionContext,), {"plan": self}
+        )
+
+    def get_field_plan(self, parent_type, field_nodes):
+        key = (parent_type, id(field_nodes[0]))
+        try:
+            return self.fields[key]
+        except KeyError:
+            pass
+        field_node = field_nodes[0]
+        field_def = get_field_def(self.schema, parent_type, field_node)
+        if field_def is None:
+            field_plan = None
+        else:
+            args = None
+            if not any(
+                contains_variables(argument.value) for argument in field_node.arguments
+            ):
+                try:
+                    args = get_argument_values(field_def, field_node)
+                except Exception:
+                    # Let the error be raised (and located) on execution
+                    args = None
+                if args is not None and not are_immutable_arguments(args):
+                    args = None
+            field_plan = FieldPlan(
+                field_def, field_def.type, args, self.get_completer(field_def.type)
+            )
+        self.fields[key] = field_plan
+        return field_plan
+
+    def get_completer(self, return_type):
+        key = id(return_type)
+        completer = self.completers.get(key)
+        if completer is None:
+            completer = self.completers[key] = self.compile_completer(return_type)
+        return completer
+
+    def compile_completer(self, return_type):
+        if is_non_null_type(return_type):
+            return compile_non_null_completer(self.get_completer(return_type.of_type))
+        if is_list_type(return_type):
+            return compile_list_completer(
+                return_type, self.get_completer(return_type.of_type)
+            )
+        if is_leaf_type(return_type):
+            return compile_leaf_completer(return_type)
+        if is_abstract_type(return_type):
+            return compile_abstract_completer(return_type)
+        return compile_object_completer(return_type)
+
+
+def compile_non_null_completer(complete_inner):
+    def complete_non_null(context, field_nodes, info, path, result):
+        completed = complete_inner(context, field_nodes, info, path, result)
+        if completed is None:
+            raise TypeError(
+                "Cannot return null for non-nullable field"
+                f" {info.parent_type.name}.{info.field_name}."
+            )
+        return completed
+
+    return complete_non_null
+
+
+def compile_leaf_completer(return_type):
+    complete_leaf_value = ExecutionContext.complete_leaf_value
+    serialize_builtin = builtin_serializers.get(return_type)
+
+    if serialize_builtin is None:
+
+        def complete_leaf(context, field_nodes, info, path, result):
+            if isinstance(result, Exception):
+                raise result
+            if result is None or result is Undefined:
+                return None
+            return complete_leaf_value(return_type, result)
+
+        return complete_leaf
+
+    def complete_builtin_leaf(context, field_nodes, info, path, result):
+        serialized = serialize_builtin(result)
+        if serialized is not Undefined:
+            return serialized
+        if isinstance(result, Exception):
+            raise result
+        if result is None or result is Undefined:
+            return None
+        return complete_leaf_value(return_type, result)
+
+    return complete_builtin_leaf
+
+
+def compile_object_completer(return_type):
+    def complete_object(context, field_nodes, info, path, result):
+        if isinstance(result, Exception):
+            raise result
+        if result is None or result is Undefined:
+            return None
+        return context.complete_object_value(
+            return_type, field_nodes, info, path, result
+        )
+
+    return complete_object
+
+
+def compile_abstract_completer(return_type):
+    def complete_abstract(context, field_nodes, info, path, result):
+        if isinstance(result, Exception):
+            raise result
+        if result is None or result is Undefined:
+            return None
+        return context.complete_abstract_value(
+            return_type, field_nodes, info, path, result
+        )
+
+    return complete_abstract
+
+
+def compile_list_completer(return_type, complete_item):
+    def complete_list(context, field_nodes, info, path, result):
+        if isinstance(result, Exception):
+            raise result
+        if result is None or result is Undefined:
+            return None
+        if not is_iterable(result) or context.is_awaitable is not assume_not_awaitable:
+            # Async iterables and possibly awaitable items are completed by
+            # the generic executor
+            return context.complete_list_value(
+                return_type, field_nodes, info, path, result
+            )
+
+        item_type = return_type.of_type
+        add_key = path.add_key
+        handle_field_error = context.handle_field_error
+        completed_results = []
+        append_result = completed_results.append
+        for index, item in enumerate(result):
+            item_path = add_key(index, None)
+            try:
+                append_result(
+                    complete_item(context, field_nodes, info, item_path, item)
+                )
+            except Exception as raw_error:
+                error = located_error(raw_error, field_nodes, item_path.as_list())
+                handle_field_error(error, item_type, item_path)
+                append_result(None)
+        return completed_results
+
+    return complete_list
+
+
+class CompiledExecutionContext(TrivialFieldExecutionContext):
+    """
+    An execution context running an operation through a `QueryPlan`.
+
+    The plan is bound to the subclasses created by `QueryPlan`, use
+    ``plan.execution_context_class`` as the ``execution_context_class`` of the
+    execution.
+    """
+
+    plan = None  # type: QueryPlan
+
+    def collect_subfields(self, return_type, field_nodes):
+        plan = self.plan
+        if not plan.static_selections:
+            return super().collect_subfields(return_type, field_nodes)
+        key = (
+            (return_type, id(field_nodes[0]))
+            if len(field_nodes) == 1
+            else tuple((return_type, *map(id, field_nodes)))
+        )
+        sub_field_nodes = plan.subfields.get(key)
+        if sub_field_nodes is None:
+            sub_field_nodes = plan.subfields[key] = super().collect_subfields(
+                return_type, field_nodes
+            )
+        return sub_field_nodes
+
+    def complete_value(self, return_type, field_nodes, info, path, result):
+        return self.plan.get_completer(return_type)(
+            self, field_nodes, info, path, result
+        )
+
+    def execute_field(self, parent_type, source, field_nodes, path):
+        field_plan = self.plan.get_field_plan(parent_type, field_nodes)
+        if field_plan is None:
+            return Undefined
+
+        field_def = field_plan.field_def
+        if field_plan.get_value is not None and not self.middleware_manager:
+            return self.execute_trivial_field(
+                field_def, field_plan.get_value, parent_type, source, field_nodes, path
+            )
+
+        return_type = field_plan.return_type
+        complete = field_plan.complete
+        resolve_fn = field_def.resolve or self.field_resolver
+
+        if self.middleware_manager:
+            resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+
+        info = self.build_resolve_info(field_def, field_nodes, parent_type, path)
+
+        try:
+            args = field_plan.args
+            if args is None:
+                args = get_argument_values(
+                    field_def, field_nodes[0], self.variable_values
+                )
+
+            result = resolve_fn(source, info, **args)
+
+            if self.is_awaitable(result):
+
+                async def await_result():
+                    try:
+                        completed = complete(
+                            self, field_nodes, info, path, await result
+                        )
+                        if self.is_awaitable(completed):
+                            return await completed
+                        return completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+
+                return await_result()
+
+            completed = complete(self, field_nodes, info, path, result)
+            if self.is_awaitable(completed):
+
+                async def await_completed():
+                    try:
+                        return await completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+
+                return await_completed()
+
+            return completed
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
@@ -0,0 +1,222 @@
+from graphql import ExecutionContext
+from pytest import mark
+
+from graphene import (
+    Date,
+    Enum,
+    Field,
+    Float,
+    InputObjectType,
+    ID,
+    Int,
+    Interface,
+    List,
+    NonNull,
+    ObjectType,
+    Schema,
+    String,
+    Union,
+)
+from graphene.types.datetime import datetime
+
+from ..compiled import CompiledExecutionContext, QueryPlan
+
+
+class Episode(Enum):
+    NEWHOPE = 4
+    EMPIRE = 5
+
+
+class Character(Interface):
+    id = ID(required=True)
+    name = String()
+
+
+class Human(ObjectType):
+    class Meta:
+        interfaces = (Character,)
+
+    home_planet = String()
+    height = Float()
+
+
+class Droid(ObjectType):
+    class Meta:
+        interfaces = (Character,)
+
+    primary_function = String()
+
+
+class SearchResult(Union):
+    class Meta:
+        types = (Human, Droid)
+
+
+class Container(ObjectType):
+    x = Int()
+    y = String()
+    required = NonNull(Int)
+    born = Date()
+    episode = Field(Episode)
+    items = List(Int)
+
+
+HUMANS = [Human(id=str(i), name=f"Human {i}", height=1.5 + i) for i in range(3)]
+DROIDS = [Droid(id="d1", name="R2-D2", primary_function="Astromech")]
+
+
+class Query(ObjectType):
+    hero = Field(Character, episode=Episode())
+    search = List(SearchResult)
+    containers = List(Container, first=Int())
+    error = String()
+    required_error = Field(NonNull(Container))
+
+    def resolve_hero(root, info, episode=None):
+        return DROIDS[0] if episode == Episode.EMPIRE else HUMANS[0]
+
+    def resolve_search(root, info):
+        return HUMANS + DROIDS
+
+    def resolve_containers(root, info, first=None):
+        containers = [
+            Container(
+                x=i,
+                y=str(i),
+                required=None if i == 2 else i,
+                born=datetime.date(2020, 1, i + 1),
+                episode=Episode.NEWHOPE,
+                items=[i, 2.0, "3"],
+            )
+            for i in range(4)
+        ]
+        return containers[:first] if first is not None else containers
+
+    def resolve_error(root, info):
+        raise Exception("Something went wrong")
+
+    def resolve_required_error(root, info):
+        return None
+
+
+schema = Schema(Query, types=[Human, Droid])
+compiled_schema = Schema(Query, types=[Human, Droid], compile_queries=True)
+
+QUERIES = [
+    ("{ hero { id name } }", None),
+    ("{ hero(episode: EMPIRE) { id name ... on Droid { primaryFunction } } }", None),
+    (
+        """
+        query Hero($episode: Episode) {
+            hero(episode: $episode) { __typename id ...HumanFields }
+        }
+        fragment HumanFields on Human { homePlanet height }
+        """,
+        {"episode": "EMPIRE"},
+    ),
+    (
+        """
+        {
+            search {
+                __typename
+                ... on Character { name }
+                ... on Human { height }
+                ... on Droid { primaryFunction }
+            }
+        }
+        """,
+        None,
+    ),
+    ("{ containers { x y born episode items } }", None),
+    ("{ containers { x required } }", None),
+    (
+        "query C($first: Int, $skip: Boolean!) "
+        "{ containers(first: $first) { x y @skip(if: $skip) } }",
+        {"first": 2, "skip": True},
+    ),
+    (
+        "query C($first: Int, $skip: Boolean!) "
+        "{ containers(first: $first) { x y @skip(if: $skip) } }",
+        {"first": 1, "skip": False},
+    ),
+    ("{ error requiredError { x } }", None),
+]
+
+
+@mark.parametrize("query,variables", QUERIES)
+def test_compiled_execution_matches_execute(query, variables):
+    expected = schema.execute(query, variables=variables)
+    for _ in range(2):
+        result = compiled_schema.execute(query, variables=variables)
+        assert result == expected
+        assert [error.formatted for error in result.errors or []] == [
+            error.formatted for error in expected.errors or []
+        ]
+
+
+@mark.asyncio
+@mark.parametrize("query,variables", QUERIES)
+async def test_compiled_execution_async_matches_execute(query, variables):
+    expected = await schema.execute_async(query, variables=variables)
+    for _ in range(2):
+        result = await compiled_schema.execute_async(query, variables=variables)
+        assert result == expected
+
+
+def test_compiled_execution_reuses_plan():
+    query = "{ containers { x y } }"
+    compiled_schema.execute(query)
+    cached = compiled_schema.document_cache.get((query, ()))
+    plan = cached.plan
+    assert isinstance(plan, QueryPlan)
+    assert plan.static_selections
+    assert issubclass(plan.execution_context_class, CompiledExecutionContext)
+    assert plan.subfields and plan.fields
+
+    compiled_schema.execute(query)
+    assert compiled_schema.document_cache.get((query, ())).plan is plan
+
+
+def test_compiled_execution_uses_given_execution_context_class():
+    class MyExecutionContext(ExecutionContext):
+        pass
+
+    result = compiled_schema.execute(
+        "{ hero { name } }", execution_context_class=MyExecutionContext
+    )
+    assert result.data == {"hero": {"name": "Human 0"}}
+
+
+def test_compiled_execution_with_middleware():
+    def upper_middleware(next, root, info, **args):
+        result = next(root, info, **args)
+        return result.upper() if isinstance(result, str) else result
+
+    query = "{ hero { name } }"
+    expected = schema.execute(query, middleware=[upper_middleware])
+    result = compiled_schema.execute(query, middleware=[upper_middleware])
+    assert result == expected
+    assert result.data == {"hero": {"name": "HUMAN 0"}}
+
+
+def test_compiled_mutable_arguments_are_not_shared():
+    class ItemsInput(InputObjectType):
+        ids = List(Int)
+
+    class MutatingQuery(ObjectType):
+        ids = List(Int, ids=List(Int))
+        items = List(Int, input=ItemsInput())
+
+        def resolve_ids(root, info, ids):
+            ids.append(99)
+            return ids
+
+        def resolve_items(root, info, input):
+            input.ids.append(99)
+            return input.ids
+
+    schema = Schema(MutatingQuery, compile_queries=True)
+    for _ in range(3):
+        result = schema.execute("{ ids(ids: [1]) items(input: { ids: [2] }) }")
+        assert not result.errors
+        assert result.data == {"ids": [1, 99], "items": [2, 99]}
@@ -0,0 +1,131 @@
+from pytest import mark
+
+from graphene import Enum, Field, Int, List, NonNull, ObjectType, Schema, String
+
+from ..trivial import TRIVIAL_FIELD_GETTER, TrivialFieldExecutionContext
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+
+
+class Container(ObjectType):
+    x = Int()
+    y = String(default_value="default")
+    required = NonNull(Int)
+    color = Field(Color)
+    computed = String()
+    custom = String(resolver=lambda root, info: "custom")
+    inner = Field(lambda: Container)
+    items = List(Int)
+
+    def resolve_computed(root, info):
+        return "computed"
+
+
+class DictContainer(ObjectType):
+    class Meta:
+        root_kind = "dict"
+
+    x = Int()
+
+
+class Query(ObjectType):
+    containers = List(Container)
+    dict_containers = List(DictContainer)
+
+    def resolve_containers(root, info):
+        return [
+            Container(x=1, required=1, color=Color.RED, inner=Container(x=2)),
+            {"x": "2", "required": 2, "color": 2},
+            Container(x="invalid", required=3),
+            Container(x=ValueError("Invalid x"), required=None),
+        ]
+
+    def resolve_dict_containers(root, info):
+        return [{"x": 1}, {}]
+
+
+schema = Schema(Query)
+trivial_schema = Schema(Query, elide_trivial_resolvers=True)
+
+QUERY = """
+{
+    containers {
+        x y required color computed custom items
+        inner { x required }
+    }
+    dictContainers { x }
+}
+"""
+
+
+def get_field(schema, type_name, field_name):
+    return schema.graphql_schema.get_type(type_name).fields[field_name]
+
+
+def test_trivial_fields_are_marked():
+    for field_name in ("x", "y", "required", "color"):
+        assert (
+            TRIVIAL_FIELD_GETTER
+            in get_field(trivial_schema, "Container", field_name).extensions
+        )
+    # Fields with resolvers or non leaf types are not trivial
+    for field_name in ("computed", "custom", "inner", "items"):
+        assert (
+            TRIVIAL_FIELD_GETTER
+            not in get_field(trivial_schema, "Container", field_name).extensions
+        )
+    # Fields are only marked when the option is set
+    assert TRIVIAL_FIELD_GETTER not in get_field(schema, "Container", "x").extensions
+
+
+def test_trivial_fields_execution_matches_execute():
+    expected = schema.execute(QUERY)
+    assert expected.errors
+    result = trivial_schema.execute(QUERY)
+    assert result == expected
+    assert [error.formatted for error in result.errors] == [
+        error.formatted for error in expected.errors
+    ]
+
+
+@mark.asyncio
+async def test_trivial_fields_async_execution_matches_execute():
+    expected = await schema.execute_async(QUERY)
+    result = await trivial_schema.execute_async(QUERY)
+    assert result == expected
+
+
+def test_trivial_fields_compiled_execution_matches_execute():
+    compiled_schema = Schema(Query, elide_trivial_resolvers=True, compile_queries=True)
+    expected = schema.execute(QUERY)
+    for _ in range(2):
+        assert compiled_schema.execute(QUERY) == expected
+
+
+def test_trivial_fields_skip_resolve_info():
+    built = []
+
+    class CountingExecutionContext(TrivialFieldExecutionContext):
+        def build_resolve_info(self, field_def, field_nodes, parent_type, path):
+            built.append(field_nodes[0].name.value)
+            return super().build_resolve_info(field_def, field_nodes, parent_type, path)
+
+    result = trivial_schema.execute(
+        "{ dictContainers { x } }", execution_context_class=CountingExecutionContext
+    )
+    assert result.data == {"dictContainers": [{"x": 1}, {"x": None}]}
+    assert built == ["dictContainers"]
+
+
+def test_trivial_fields_with_middleware():
+    def double_middleware(next, root, info, **args):
+        result = next(root, info, **args)
+        return result * 2 if isinstance(result, int) else result
+
+    result = trivial_schema.execute(
+        "{ dictContainers { x } }", middleware=[double_middleware]
+    )
+    assert result.data == {"dictContainers": [{"x": 2}, {"x": None}]}
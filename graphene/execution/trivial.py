@@ -0,0 +1,75 @@
+from graphql import ExecutionContext, Undefined, is_non_null_type, located_error
+from graphql.execution.execute import get_field_def
+
+# Key of the GraphQLField extensions holding the getter of trivial fields
+TRIVIAL_FIELD_GETTER = "graphene_trivial_field_getter"
+
+
+class TrivialFieldExecutionContext(ExecutionContext):
+    """
+    An execution context reading trivial fields directly from their parent value.
+
+    Trivial fields are the scalar and enum fields resolved by the default
+    resolver, marked by the TypeMap when the Schema is created with
+    ``elide_trivial_resolvers=True``. They are resolved without building a
+    `ResolveInfo` or calling through the resolver, unless middleware is used.
+    """
+
+    def execute_field(self, parent_type, source, field_nodes, path):
+        field_def = get_field_def(self.schema, parent_type, field_nodes[0])
+        if field_def is None:
+            return Undefined
+        get_value = field_def.extensions.get(TRIVIAL_FIELD_GETTER)
+        if get_value is None or self.middleware_manager:
+            return super().execute_field(parent_type, source, field_nodes, path)
+        return self.execute_trivial_field(
+            field_def, get_value, parent_type, source, field_nodes, path
+        )
+
+    def execute_trivial_field(
+        self, field_def, get_value, parent_type, source, field_nodes, path
+    ):
+        return_type = field_def.type
+        try:
+            result = get_value(source)
+            if self.is_awaitable(result):
+
+                async def await_result():
+                    try:
+                        return self.complete_trivial_value(
+                            return_type, parent_type, field_nodes, await result
+                        )
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type, path)
+                        return None
+
+                return await_result()
+
+            return self.complete_trivial_value(
+                return_type, parent_type, field_nodes, result
+            )
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type, path)
+            return None
+
+    def complete_trivial_value(self, return_type, parent_type, field_nodes, result):
+        """Same as `complete_value` for (non-null) leaf types, without `info`."""
+        if isinstance(result, Exception):
+            raise result
+
+        if is_non_null_type(return_type):
+            completed = self.complete_trivial_value(
+                return_type.of_type, parent_type, field_nodes, result
+            )
+            if completed is None:
+                raise TypeError(
+                    "Cannot return null for non-nullable field"
+                    f" {parent_type.name}.{field_nodes[0].name.value}."
+                )
+            return completed
+
+        if result is None or result is Undefined:
+            return None
+        return self.complete_leaf_value(return_type, result)
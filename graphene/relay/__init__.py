@@ -1,8 +1,15 @@
 from .node import Node, is_node, GlobalID
 from .mutation import ClientIDMutation
-from .connection import Connection, ConnectionField, PageInfo
+from .connection import (
+    Connection,
+    ConnectionField,
+    KeysetConnectionField,
+    LazySource,
+    PageInfo,
+)
 from .id_type import (
     BaseGlobalIDType,
+    CompactGlobalIDType,
     DefaultGlobalIDType,
     SimpleGlobalIDType,
     UUIDGlobalIDType,
@@ -11,10 +18,13 @@ from .id_type import (
 __all__ = [
     "BaseGlobalIDType",
     "ClientIDMutation",
+    "CompactGlobalIDType",
     "Connection",
     "ConnectionField",
     "DefaultGlobalIDType",
     "GlobalID",
+    "KeysetConnectionField",
+    "LazySource",
     "Node",
     "PageInfo",
     "SimpleGlobalIDType",
@@ -1,9 +1,16 @@
+import json
 import re
-from collections.abc import Iterable
+from asyncio import gather
+from collections.abc import Iterable, Iterator, Mapping
 from functools import partial
+from inspect import isawaitable, signature
+from itertools import islice
 from typing import Type
 
-from graphql_relay import connection_from_array
+from graphql_relay import connection_from_array, connection_from_array_slice
+from graphql_relay.connection.array_connection import get_offset_with_default
+from graphql_relay.utils import base64, unbase64
+from graphql.language import FieldNode, FragmentSpreadNode
 
 from ..types import Boolean, Enum, Int, Interface, List, NonNull, Scalar, String, Union
 from ..types.field import Field
@@ -80,8 +87,100 @@ def page_info_adapter(startCursor, endCursor, hasPreviousPage, hasNextPage):
     )
 
 
+def takes_no_arguments(function):
+    try:
+        signature(function).bind()
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def count_exact(iterable):
+    """
+    Counts the items of a connection: using the count of a `LazySource` (or
+    fetching all of its items if it has no count), the ``count()`` method
+    without arguments of query objects (such as Django QuerySets) or `len`.
+    The count of iterators is unknown (None), as they were consumed by the
+    pagination.
+    """
+    if isinstance(iterable, LazySource):
+        count = iterable.get_count()
+        if count is None and not isinstance(iterable.source, Iterator):
+            count = maybe_thenable(iterable.fetch(0), len)
+        return count
+    if not isinstance(iterable, (list, tuple)):
+        count = getattr(iterable, "count", None)
+        # Sequences (such as ranges) have a count(value) method
+        if callable(count) and takes_no_arguments(count):
+            return count()
+    return len(iterable)
+
+
+def capped_counter(max_count):
+    """
+    Returns a counter counting at most `max_count` items, fetching only that
+    many items from the sources that can be sliced.
+    """
+
+    def count_capped(iterable):
+        if isinstance(iterable, LazySource):
+            count = iterable.get_count()
+            if count is not None:
+                return min(count, max_count)
+            if isinstance(iterable.source, Iterator):
+                return None
+            return maybe_thenable(iterable.fetch(0, max_count), len)
+        return len(iterable[:max_count])
+
+    return count_capped
+
+
+def resolve_total_count(counter, root, info):
+    # Counted along with the edges (see connection_resolver)
+    total_count = getattr(root, "total_count", None)
+    if total_count is not None:
+        return total_count
+    iterable = getattr(root, "iterable", None)
+    if iterable is None:
+        return None
+    return counter(iterable)
+
+
+def is_field_selected(info, names):
+    """
+    Check if one of the fields `names` is selected on the value being
+    resolved, directly or in fragments.
+    """
+    selection_sets = [field_node.selection_set for field_node in info.field_nodes]
+    while selection_sets:
+        selection_set = selection_sets.pop()
+        if selection_set is None:
+            continue
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                if selection.name.value in names:
+                    return True
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = info.fragments.get(selection.name.value)
+                if fragment:
+                    selection_sets.append(fragment.selection_set)
+            else:
+                selection_sets.append(selection.selection_set)
+    return False
+
+
+async def gather_connection_count(connection, count):
+    if isawaitable(count):
+        connection, count = await gather(connection, count)
+    else:
+        connection = await connection
+    connection.total_count = count
+    return connection
+
+
 class ConnectionOptions(ObjectTypeOptions):
     node = None
+    counter = None
 
 
 class Connection(ObjectType):
@@ -90,7 +189,14 @@ class Connection(ObjectType):
 
     @classmethod
     def __init_subclass_with_meta__(
-        cls, node=None, name=None, strict_types=False, _meta=None, **options
+        cls,
+        node=None,
+        name=None,
+        strict_types=False,
+        total_count=False,
+        counter=None,
+        _meta=None,
+        **options,
     ):
         if not _meta:
             _meta = ConnectionOptions(cls)
@@ -126,6 +232,14 @@ class Connection(ObjectType):
                 description="Contains the nodes in this connection.",
             )
 
+        if (total_count or counter) and "total_count" not in _meta.fields:
+            _meta.counter = counter or count_exact
+            _meta.fields["total_count"] = Field(
+                Int,
+                description="The total number of items in the connection.",
+                resolver=partial(resolve_total_count, _meta.counter),
+            )
+
         return super(Connection, cls).__init_subclass_with_meta__(
             _meta=_meta, **options
         )
@@ -137,6 +251,181 @@ def connection_adapter(cls, edges, pageInfo):
     return cls(edges=edges, page_info=pageInfo)
 
 
+def set_iterable(iterable, connection):
+    connection.iterable = iterable
+    return connection
+
+
+def set_total_count(total_count, connection):
+    connection.total_count = total_count
+    return connection
+
+
+class LazySource(object):
+    """
+    A lazy source of the items of a connection, of which only the items of the
+    requested page (plus one, to know if there is a next page) are fetched.
+
+    The `source` is either a callable taking an ``offset`` and a ``limit`` (None
+    for no limit) and returning the items (or an awaitable of them), an object
+    supporting slicing (such as a Django ``QuerySet`` or an SQLAlchemy
+    ``Query``) or an iterator.
+
+    The total number of items is only needed to paginate backwards from the end
+    of the connection (``last`` without ``before``): `count` (a number or a
+    callable returning it, or an awaitable of it) is used if given, otherwise
+    the source is consumed until its end.
+
+    Unlike with lists, an ``after`` cursor past the end of a source without
+    `count` is not ignored but gives an empty page.
+    """
+
+    def __init__(self, source, count=None):
+        self.source = source
+        self.count = count
+
+    def get_count(self):
+        return self.count() if callable(self.count) else self.count
+
+    def fetch(self, start, end=None):
+        """
+        Returns the items from `start` to `end` (excluded, None for no end), or
+        an awaitable of them if the source is asynchronous.
+        """
+        source = self.source
+        if isinstance(source, Iterator):
+            return list(islice(source, start, end))
+        if callable(source):
+            return maybe_thenable(
+                source(start, None if end is None else end - start), list
+            )
+        return list(source[start:end])
+
+
+def run_steps(steps, value=None):
+    """
+    Runs a generator yielding values or awaitables, sending back the values
+    (awaited if needed) and returning the value it returns. Returns an
+    awaitable of it once one of the yielded values is an awaitable.
+    """
+    try:
+        while True:
+            value = steps.send(value)
+            if isawaitable(value):
+                return run_steps_async(steps, value)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_steps_async(steps, value):
+    try:
+        while True:
+            value = steps.send(await value if isawaitable(value) else value)
+    except StopIteration as stop:
+        return stop.value
+
+
+def paginate_lazy_source(lazy_source, args, connection_type, edge_type, page_info_type):
+    """
+    Yields the count and the fetches of the items of a `LazySource` needed for
+    the page described by `args` (see `run_steps`), and returns the connection.
+    """
+    before = args.get("before")
+    after = args.get("after")
+    first = args.get("first")
+    last = args.get("last")
+    for name, value in (("first", first), ("last", last)):
+        if isinstance(value, int) and value < 0:
+            raise ValueError(f"Argument '{name}' must be a non-negative integer.")
+    after_offset = get_offset_with_default(after, -1)
+    before_offset = get_offset_with_default(before, -1)
+    backwards = isinstance(last, int) and not isinstance(first, int)
+    is_iterator = isinstance(lazy_source.source, Iterator)
+
+    def get_bounds(length):
+        # Like with lists, the cursors outside of the source are ignored
+        # when its length is known
+        start = 0
+        if after_offset >= 0 and (length is None or after_offset < length):
+            start = after_offset + 1
+        end = length
+        if before_offset >= 0 and (length is None or before_offset < length):
+            end = before_offset
+        if isinstance(first, int):
+            end = start + first if end is None else min(end, start + first)
+        return start, end
+
+    # The total number of items is needed to paginate backwards
+    length = (yield lazy_source.get_count()) if backwards else None
+    while True:
+        start, end = get_bounds(length)
+        page_start = start
+        if backwards and end is not None and (length is not None or not is_iterator):
+            page_start = max(start, end - last)
+
+        # Fetch an extra item to know if there is a next page
+        fetch_end = None if end is None else end + (1 if isinstance(first, int) else 0)
+        items = (
+            (yield lazy_source.fetch(page_start, fetch_end))
+            if fetch_end != page_start
+            else []
+        )
+
+        if (
+            not items
+            and after_offset >= 0
+            and length is None
+            and lazy_source.count is not None
+            and not is_iterator
+        ):
+            # The after cursor may be past the end of the source
+            length = yield lazy_source.get_count()
+            if length is not None and after_offset >= length:
+                continue
+        break
+
+    if backwards and length is None and page_start > start and len(items) < last:
+        # The before cursor is past the end of the source: fetch the items
+        # preceding the last one, in windows of increasing size
+        size = last
+        while not items and page_start > start:
+            window_start = max(start, page_start - size)
+            items = yield lazy_source.fetch(window_start, page_start)
+            page_start = window_start
+            size *= 2
+        if items and len(items) < last and page_start > start:
+            window_start = max(start, page_start + len(items) - last)
+            items = (yield lazy_source.fetch(window_start, page_start)) + items
+            page_start = window_start
+
+    return connection_from_array_slice(
+        items,
+        args,
+        slice_start=page_start,
+        array_length=page_start + len(items) if length is None else length,
+        array_slice_length=len(items),
+        connection_type=connection_type,
+        edge_type=edge_type,
+        page_info_type=page_info_type,
+    )
+
+
+def connection_from_lazy_source(
+    lazy_source, args, connection_type, edge_type, page_info_type
+):
+    """
+    Creates a connection from a `LazySource`, fetching only the items needed
+    for the page described by `args` and delegating the pagination itself to
+    `connection_from_array_slice`. Returns an awaitable of the connection if
+    the source or its count are asynchronous.
+    """
+    return run_steps(
+        paginate_lazy_source(
+            lazy_source, args, connection_type, edge_type, page_info_type
+        )
+    )
+
+
 class IterableConnectionField(Field):
     def __init__(self, type_, *args, **kwargs):
         kwargs.setdefault("before", String())
@@ -168,6 +457,21 @@ class IterableConnectionField(Field):
         if isinstance(resolved, connection_type):
             return resolved
 
+        if isinstance(resolved, Iterator):
+            # Iterators (such as generators) can't be measured, only the items
+            # of the page are consumed
+            resolved = LazySource(resolved)
+
+        if isinstance(resolved, LazySource):
+            connection = connection_from_lazy_source(
+                resolved,
+                args,
+                connection_type=partial(connection_adapter, connection_type),
+                edge_type=connection_type.Edge,
+                page_info_type=page_info_adapter,
+            )
+            return maybe_thenable(connection, partial(set_iterable, resolved))
+
         assert isinstance(resolved, Iterable), (
             f"Resolved value from the connection field has to be an iterable or instance of {connection_type}. "
             f'Received "{resolved}"'
@@ -182,6 +486,15 @@ class IterableConnectionField(Field):
         connection.iterable = resolved
         return connection
 
+    @classmethod
+    def resolve_connection_and_count(cls, connection_type, args, counter, resolved):
+        connection = cls.resolve_connection(connection_type, args, resolved)
+        if not isawaitable(connection):
+            # The count is resolved by the totalCount field
+            return connection
+        # Count the items while the page is fetched
+        return gather_connection_count(connection, counter(resolved))
+
     @classmethod
     def connection_resolver(cls, resolver, connection_type, root, info, **args):
         resolved = resolver(root, info, **args)
@@ -189,7 +502,13 @@ class IterableConnectionField(Field):
         if isinstance(connection_type, NonNull):
             connection_type = connection_type.of_type
 
-        on_resolve = partial(cls.resolve_connection, connection_type, args)
+        counter = getattr(connection_type._meta, "counter", None)
+        if counter and is_field_selected(info, ("totalCount", "total_count")):
+            on_resolve = partial(
+                cls.resolve_connection_and_count, connection_type, args, counter
+            )
+        else:
+            on_resolve = partial(cls.resolve_connection, connection_type, args)
         return maybe_thenable(resolved, on_resolve)
 
     def wrap_resolve(self, parent_resolver):
@@ -198,3 +517,138 @@ class IterableConnectionField(Field):
 
 
 ConnectionField = IterableConnectionField
+
+KEYSET_CURSOR_PREFIX = "keyset:"
+PAGINATION_ARGUMENTS = ("before", "after", "first", "last")
+
+
+def encode_keyset_cursor(values):
+    """Returns the opaque cursor of the given sort key values."""
+    return base64(
+        KEYSET_CURSOR_PREFIX
+        + json.dumps(list(values), separators=(",", ":"), default=str)
+    )
+
+
+def decode_keyset_cursor(cursor):
+    """Returns the tuple of sort key values of a cursor from `encode_keyset_cursor`."""
+    try:
+        decoded = unbase64(cursor)
+        if decoded.startswith(KEYSET_CURSOR_PREFIX):
+            values = json.loads(decoded[len(KEYSET_CURSOR_PREFIX) :])
+            if isinstance(values, list):
+                return tuple(values)
+    except ValueError:
+        pass
+    raise ValueError(f'Invalid cursor "{cursor}".')
+
+
+class KeysetConnectionField(IterableConnectionField):
+    """
+    A connection field paginated by the values of its sort keys rather than
+    by offsets, so the resolver can seek the page using an index.
+
+    The resolver gets the ``after`` and ``before`` arguments decoded as tuples
+    of the sort key values (the values of the `sort_keys` attributes of the
+    nodes, or the result of `sort_keys` if it is a callable), and returns the
+    nodes in sort order following ``after`` (or, when paginating with ``last``,
+    in reverse sort order preceding ``before``). Only ``first + 1`` (or
+    ``last + 1``) nodes are taken from the result, slicing it if it supports
+    slicing, the extra node telling if there is another page.
+
+    The sort key values are encoded as JSON, the values of other types (such as
+    dates) being decoded as strings.
+
+    As the result of the resolver only holds the nodes following the cursor,
+    it isn't counted: the ``totalCount`` of the connection (if any) is the
+    result of `count`, called with the root, the info and the arguments of the
+    field other than the pagination ones when the field is selected, or None.
+    """
+
+    def __init__(self, type_, *args, sort_keys=("id",), count=None, **kwargs):
+        if isinstance(sort_keys, str):
+            sort_keys = (sort_keys,)
+        self.sort_keys = sort_keys
+        self.count = count
+        super(KeysetConnectionField, self).__init__(type_, *args, **kwargs)
+
+    def get_cursor(self, node):
+        sort_keys = self.sort_keys
+        if callable(sort_keys):
+            values = sort_keys(node)
+        elif isinstance(node, Mapping):
+            values = [node.get(key) for key in sort_keys]
+        else:
+            values = [getattr(node, key, None) for key in sort_keys]
+        return encode_keyset_cursor(values)
+
+    def resolve_keyset_connection(self, connection_type, args, resolved):
+        if isinstance(resolved, connection_type):
+            return resolved
+
+        assert isinstance(resolved, Iterable), (
+            f"Resolved value from the connection field has to be an iterable or instance of {connection_type}. "
+            f'Received "{resolved}"'
+        )
+        first = args.get("first")
+        last = args.get("last")
+        for name, value in (("first", first), ("last", last)):
+            if isinstance(value, int) and value < 0:
+                raise ValueError(f"Argument '{name}' must be a non-negative integer.")
+
+        limit = first if isinstance(first, int) else last
+        if limit is None:
+            nodes = list(resolved)
+        elif hasattr(resolved, "__getitem__") and not isinstance(resolved, list):
+            nodes = list(resolved[: limit + 1])
+        else:
+            nodes = list(islice(resolved, limit + 1))
+
+        has_more = limit is not None and len(nodes) > limit
+        if has_more:
+            nodes = nodes[:limit]
+        backwards = limit is not None and not isinstance(first, int)
+        if backwards:
+            nodes.reverse()
+
+        edge_type = connection_type.Edge
+        edges = [edge_type(node=node, cursor=self.get_cursor(node)) for node in nodes]
+        connection = connection_type(
+            edges=edges,
+            page_info=PageInfo(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=backwards and has_more,
+                has_next_page=not backwards and has_more,
+            ),
+        )
+        return connection
+
+    def keyset_connection_resolver(self, resolver, connection_type, root, info, **args):
+        if isinstance(connection_type, NonNull):
+            connection_type = connection_type.of_type
+
+        resolver_args = dict(args)
+        for name in ("after", "before"):
+            if args.get(name) is not None:
+                resolver_args[name] = decode_keyset_cursor(args[name])
+        resolved = resolver(root, info, **resolver_args)
+
+        on_resolve = partial(self.resolve_keyset_connection, connection_type, args)
+        connection = maybe_thenable(resolved, on_resolve)
+        if self.count and is_field_selected(info, ("totalCount", "total_count")):
+            count = self.count(
+                root,
+                info,
+                **{
+                    name: value
+                    for name, value in args.items()
+                    if name not in PAGINATION_ARGUMENTS
+                },
+            )
+            return maybe_thenable(connection, partial(set_total_count, count))
+        return connection
+
+    def wrap_resolve(self, parent_resolver):
+        resolver = super(IterableConnectionField, self).wrap_resolve(parent_resolver)
+        return partial(self.keyset_connection_resolver, resolver, self.type)
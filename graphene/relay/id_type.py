@@ -1,10 +1,53 @@
-from graphql_relay import from_global_id, to_global_id
+from base64 import urlsafe_b64decode
+from binascii import b2a_base64
+
+from graphql import GraphQLID
+from graphql_relay import from_global_id
 
 from ..types import ID, UUID
 from ..types.base import BaseType
 
 from typing import Type
 
+# The encoders of the global IDs of each node type, see `get_global_id_encoder`
+global_id_encoders = {}
+
+
+def get_global_id_encoder(_type):
+    """
+    Returns a function encoding the ids of the `_type` nodes to the base64
+    encoded "<node type name>:<node id>" global IDs.
+
+    The base64 encoding of the largest part of the prefix made of whole 3 bytes
+    blocks doesn't depend on the id, and is encoded only once.
+    """
+    prefix = f"{_type}:".encode("utf-8")
+    aligned = len(prefix) - len(prefix) % 3
+    encoded_prefix = b2a_base64(prefix[:aligned], newline=False).decode("ascii")
+    rest = prefix[aligned:]
+
+    def encode_global_id(_id):
+        id_type = type(_id)
+        if id_type is int:
+            raw = rest + b"%d" % _id
+        elif id_type is str:
+            raw = rest + _id.encode("utf-8")
+        else:
+            raw = rest + GraphQLID.serialize(_id).encode("utf-8")
+        return encoded_prefix + b2a_base64(raw, newline=False).decode("ascii")
+
+    global_id_encoders[_type] = encode_global_id
+    return encode_global_id
+
+
+def serialize_id(_id):
+    id_type = type(_id)
+    if id_type is str:
+        return _id
+    if id_type is int:
+        return str(_id)
+    return GraphQLID.serialize(_id)
+
 
 class BaseGlobalIDType:
     """
@@ -47,7 +90,9 @@ class DefaultGlobalIDType(BaseGlobalIDType):
 
     @classmethod
     def to_global_id(cls, _type, _id):
-        return to_global_id(_type, _id)
+        # Same as graphql_relay's to_global_id, with the type prefix encoded once
+        encode = global_id_encoders.get(_type) or get_global_id_encoder(_type)
+        return encode(_id)
 
 
 class SimpleGlobalIDType(BaseGlobalIDType):
@@ -85,3 +130,107 @@ class UUIDGlobalIDType(BaseGlobalIDType):
     @classmethod
     def to_global_id(cls, _type, _id):
         return _id
+
+
+def encode_varint(value):
+    if value < 0x80:
+        return bytes((value,))
+    if value < 0x4000:
+        return bytes(((value & 0x7F) | 0x80, value >> 7))
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def decode_varint(data, position=0):
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+# Tags of the node ids in compact global IDs
+COMPACT_INT_ID = 0
+COMPACT_STR_ID = 1
+COMPACT_INT_TAG = bytes((COMPACT_INT_ID,))
+COMPACT_STR_TAG = bytes((COMPACT_STR_ID,))
+
+URLSAFE_BASE64 = bytes.maketrans(b"+/", b"-_")
+
+
+class CompactGlobalIDType(BaseGlobalIDType):
+    """
+    Compact global ID type: url-safe base64 (without padding) of the number of
+    the node type in `type_ids` followed by the node id, as a varint if it is a
+    non-negative integer (or the decimal string of one).
+
+    `type_ids` maps the names of the node types to their numbers, and has to be
+    set by subclasses. The numbers must never change, or the IDs already given
+    to clients will point to other types.
+    """
+
+    graphene_type = ID
+    type_ids = None  # type: dict
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.type_ids is None:
+            return
+        cls.type_names = {type_id: _type for _type, type_id in cls.type_ids.items()}
+        assert len(cls.type_names) == len(
+            cls.type_ids
+        ), f"The type_ids of {cls.__name__} must be unique."
+        assert all(
+            isinstance(type_id, int) and type_id >= 0 for type_id in cls.type_names
+        ), f"The type_ids of {cls.__name__} must be non-negative integers."
+        cls._prefixes = {
+            _type: encode_varint(type_id) for _type, type_id in cls.type_ids.items()
+        }
+
+    @classmethod
+    def resolve_global_id(cls, info, global_id):
+        try:
+            data = urlsafe_b64decode(global_id + "=" * (-len(global_id) % 4))
+            type_id, position = decode_varint(data)
+            _type = cls.type_names.get(type_id)
+            if _type is None:
+                raise ValueError("Unknown type")
+            tag = data[position]
+            if tag == COMPACT_INT_ID:
+                _id, position = decode_varint(data, position + 1)
+                if position != len(data):
+                    raise ValueError("Unexpected data after the id")
+                return _type, str(_id)
+            if tag == COMPACT_STR_ID:
+                return _type, data[position + 1 :].decode("utf-8")
+            raise ValueError("Unknown id format")
+        except Exception as e:
+            raise Exception(f'Unable to parse global ID "{global_id}". {e}')
+
+    @classmethod
+    def to_global_id(cls, _type, _id):
+        try:
+            prefix = cls._prefixes[_type]
+        except KeyError:
+            raise Exception(f'Type "{_type}" has no id in {cls.__name__}.type_ids.')
+        if type(_id) is not int:
+            _id = serialize_id(_id)
+            if _id.isdecimal() and _id.isascii() and str(int(_id)) == _id:
+                _id = int(_id)
+        if type(_id) is int and _id >= 0:
+            data = prefix + COMPACT_INT_TAG + encode_varint(_id)
+        else:
+            data = prefix + COMPACT_STR_TAG + str(_id).encode("utf-8")
+        return (
+            b2a_base64(data, newline=False)
+            .rstrip(b"=")
+            .translate(URLSAFE_BASE64)
+            .decode("ascii")
+        )
@@ -1,8 +1,11 @@
+from asyncio import gather
+from collections.abc import Mapping
 from functools import partial
-from inspect import isclass
+from inspect import isawaitable, isclass
 
-from ..types import Field, Interface, ObjectType
+from ..types import Field, Interface, List, NonNull, ObjectType
 from ..types.interface import InterfaceOptions
+from ..types.schema import get_node_registry
 from ..types.utils import get_type
 from .id_type import BaseGlobalIDType, DefaultGlobalIDType
 
@@ -50,6 +53,22 @@ class GlobalID(Field):
             parent_type_name=self.parent_type_name,
         )
 
+    def wrap_resolve_for_type(self, parent_resolver, parent_type):
+        if type(self).wrap_resolve is not GlobalID.wrap_resolve:
+            # Subclasses customizing wrap_resolve keep resolving with it
+            return self.wrap_resolve(parent_resolver)
+        # The field of an ObjectType always resolves with that ObjectType as
+        # info.parent_type, so its name is bound when building the schema.
+        parent_type_name = self.parent_type_name
+        if parent_type_name is None and issubclass(parent_type, ObjectType):
+            parent_type_name = parent_type._meta.name
+        return partial(
+            self.id_resolver,
+            parent_resolver,
+            self.node,
+            parent_type_name=parent_type_name,
+        )
+
 
 class NodeField(Field):
     def __init__(self, node, type_=False, **kwargs):
@@ -71,6 +90,27 @@ class NodeField(Field):
         return partial(self.node_type.node_resolver, get_type(self.field_type))
 
 
+class NodesField(Field):
+    def __init__(self, node, type_=False, **kwargs):
+        assert issubclass(node, Node), "NodesField can only operate in Nodes"
+        self.node_type = node
+        self.field_type = type_
+        global_id_type = node._meta.global_id_type
+
+        super(NodesField, self).__init__(
+            # If we don't specify a type, the field type will be the node interface
+            NonNull(List(type_ or node)),
+            ids=NonNull(
+                List(NonNull(global_id_type.graphene_type)),
+                description="The IDs of the objects",
+            ),
+            **kwargs,
+        )
+
+    def wrap_resolve(self, parent_resolver):
+        return partial(self.node_type.nodes_resolver, get_type(self.field_type))
+
+
 class AbstractNode(Interface):
     class Meta:
         abstract = True
@@ -101,35 +141,117 @@ class Node(AbstractNode):
     def Field(cls, *args, **kwargs):  # noqa: N802
         return NodeField(cls, *args, **kwargs)
 
+    @classmethod
+    def NodesField(cls, *args, **kwargs):  # noqa: N802
+        return NodesField(cls, *args, **kwargs)
+
     @classmethod
     def node_resolver(cls, only_type, root, info, id):
         return cls.get_node_from_global_id(info, id, only_type=only_type)
 
+    @classmethod
+    def nodes_resolver(cls, only_type, root, info, ids):
+        return cls.get_nodes_from_global_ids(info, ids, only_type=only_type)
+
     @classmethod
     def get_node_from_global_id(cls, info, global_id, only_type=None):
+        node_type, _id = cls.get_node_type(info, global_id, only_type)
+
+        if node_type.get_node:
+            return node_type.get_node(info, _id)
+
+    @classmethod
+    def get_nodes_from_global_ids(cls, info, global_ids, only_type=None):
+        """
+        Returns the nodes of a list of global IDs, in the same order.
+
+        The IDs are grouped by type, and the ``get_nodes(info, ids)`` of each
+        type (returning a list of the nodes in the order of the ids, or a
+        mapping of the ids to their nodes) is called once, falling back to
+        calling ``get_node(info, id)`` for each ID. The nodes which can't be
+        fetched are replaced by their error.
+        """
+        nodes = [None] * len(global_ids)
+        batches = {}
+        for index, global_id in enumerate(global_ids):
+            try:
+                node_type, _id = cls.get_node_type(info, global_id, only_type)
+                if node_type.get_nodes:
+                    indexes, ids = batches.setdefault(node_type, ([], []))
+                    indexes.append(index)
+                    ids.append(_id)
+                elif node_type.get_node:
+                    nodes[index] = node_type.get_node(info, _id)
+            except Exception as error:
+                nodes[index] = error
+
+        pending = []
+        for node_type, (indexes, ids) in batches.items():
+            try:
+                batch = node_type.get_nodes(info, ids)
+            except Exception as error:
+                batch = [error] * len(ids)
+            if isawaitable(batch):
+                pending.append((indexes, ids, batch))
+            else:
+                set_batch_nodes(nodes, indexes, ids, batch)
+
+        if not pending:
+            return nodes
+
+        async def await_batches():
+            batches = await gather(
+                *(batch for _indexes, _ids, batch in pending), return_exceptions=True
+            )
+            for (indexes, ids, _batch), batch in zip(pending, batches):
+                if isinstance(batch, Exception):
+                    batch = [batch] * len(ids)
+                set_batch_nodes(nodes, indexes, ids, batch)
+            return nodes
+
+        return await_batches()
+
+    @classmethod
+    def get_node_type(cls, info, global_id, only_type=None):
+        """
+        Returns the NodeType (the ObjectType with its get_node and get_nodes
+        hooks, from the node registry built with the schema) and the ID of the
+        node of a global ID.
+        """
         _type, _id = cls.resolve_global_id(info, global_id)
 
-        graphene_type = info.schema.get_type(_type)
-        if graphene_type is None:
+        node_type = get_node_registry(info.schema).get(_type)
+        if node_type is None:
             raise Exception(f'Relay Node "{_type}" not found in schema')
 
-        graphene_type = graphene_type.graphene_type
-
         if only_type:
             assert (
-                graphene_type == only_type
+                node_type.graphene_type == only_type
             ), f"Must receive a {only_type._meta.name} id."
 
         # We make sure the ObjectType implements the "Node" interface
-        if cls not in graphene_type._meta.interfaces:
+        if cls not in node_type.interfaces:
             raise Exception(
                 f'ObjectType "{_type}" does not implement the "{cls}" interface.'
             )
 
-        get_node = getattr(graphene_type, "get_node", None)
-        if get_node:
-            return get_node(info, _id)
+        return node_type, _id
 
     @classmethod
     def to_global_id(cls, type_, id):
         return cls._meta.global_id_type.to_global_id(type_, id)
+
+
+def set_batch_nodes(nodes, indexes, ids, batch):
+    if isinstance(batch, Mapping):
+        batch = [batch.get(_id) for _id in ids]
+    else:
+        batch = list(batch)
+        if len(batch) != len(ids):
+            error = TypeError(
+                "get_nodes must return a list with the same length as the ids, "
+                f"or a mapping. Received {len(batch)} nodes for {len(ids)} ids."
+            )
+            batch = [error] * len(ids)
+    for index, node in zip(indexes, batch):
+        nodes[index] = node
@@ -1,6 +1,8 @@
 import re
+from itertools import count as count_from
 
-from pytest import raises
+from graphql_relay import offset_to_cursor
+from pytest import mark, raises
 
 from ...types import Argument, Field, Int, List, NonNull, ObjectType, Schema, String
 from ..connection import (
@@ -8,6 +10,7 @@ from ..connection import (
     ConnectionField,
     PageInfo,
     ConnectionOptions,
+    LazySource,
     get_edge_class,
 )
 from ..node import Node
@@ -316,3 +319,152 @@ def test_connectionfield_strict_types():
 
     node_field = edges_list_element_type.of_type._meta.fields["node"]
     assert isinstance(node_field.type, NonNull)
+
+
+class LetterConnection(Connection):
+    class Meta:
+        node = String
+
+
+LETTERS = list("ABCDEFGHIJ")
+
+PAGINATION_ARGS = [
+    {},
+    {"first": 0},
+    {"first": 3},
+    {"first": 10},
+    {"first": 20},
+    {"last": 3},
+    {"last": 20},
+    {"first": 3, "after": offset_to_cursor(2)},
+    {"first": 3, "after": offset_to_cursor(7)},
+    {"first": 3, "before": offset_to_cursor(2)},
+    {"first": 5, "last": 2},
+    {"first": 5, "last": 2, "after": offset_to_cursor(6)},
+    {"last": 3, "before": offset_to_cursor(5)},
+    {"last": 3, "before": offset_to_cursor(2)},
+    {"last": 3, "after": offset_to_cursor(4)},
+    {"last": 3, "after": offset_to_cursor(4), "before": offset_to_cursor(9)},
+    {"after": offset_to_cursor(4), "before": offset_to_cursor(8)},
+    {"after": "invalid", "first": 2},
+]
+
+
+def resolve_connection(resolved, args):
+    connection = ConnectionField.resolve_connection(LetterConnection, args, resolved)
+    return (
+        [(edge.node, edge.cursor) for edge in connection.edges],
+        connection.page_info,
+    )
+
+
+def sliceable_source(fetched):
+    class Sliceable:
+        def __getitem__(self, item):
+            fetched.append((item.start, item.stop))
+            return LETTERS[item]
+
+    return Sliceable()
+
+
+def callable_source(fetched):
+    def fetch(offset, limit):
+        fetched.append((offset, limit))
+        return LETTERS[offset:] if limit is None else LETTERS[offset : offset + limit]
+
+    return fetch
+
+
+@mark.parametrize("args", PAGINATION_ARGS)
+@mark.parametrize("make_source", [sliceable_source, callable_source])
+@mark.parametrize("count", [None, len(LETTERS), lambda: len(LETTERS)])
+def test_lazy_source_matches_list(args, make_source, count):
+    fetched = []
+    lazy_source = LazySource(make_source(fetched), count=count)
+    assert resolve_connection(lazy_source, args) == resolve_connection(LETTERS, args)
+    assert len(fetched) <= 1
+
+
+@mark.parametrize("args", PAGINATION_ARGS)
+def test_iterator_matches_list(args):
+    assert resolve_connection(iter(LETTERS), args) == resolve_connection(LETTERS, args)
+
+
+def test_lazy_source_fetches_only_the_page():
+    fetched = []
+    lazy_source = LazySource(callable_source(fetched))
+    edges, page_info = resolve_connection(
+        lazy_source, {"first": 2, "after": offset_to_cursor(3)}
+    )
+    assert [node for node, _cursor in edges] == ["E", "F"]
+    assert page_info.has_next_page
+    assert fetched == [(4, 3)]
+
+    # Paginating backwards from the end uses the count
+    fetched = []
+    counted = []
+    lazy_source = LazySource(
+        callable_source(fetched), count=lambda: counted.append(1) or 10
+    )
+    edges, page_info = resolve_connection(lazy_source, {"last": 2})
+    assert [node for node, _cursor in edges] == ["I", "J"]
+    assert page_info.has_previous_page
+    assert fetched == [(8, 2)]
+    assert counted == [1]
+
+
+PAST_THE_END_ARGS = [
+    {"last": 3, "before": offset_to_cursor(12)},
+    {"last": 3, "before": offset_to_cursor(40)},
+    {"last": 20, "before": offset_to_cursor(12)},
+    {"last": 3, "after": offset_to_cursor(8), "before": offset_to_cursor(40)},
+    {"first": 3, "before": offset_to_cursor(12)},
+]
+
+
+@mark.parametrize("args", PAST_THE_END_ARGS)
+@mark.parametrize("make_source", [sliceable_source, callable_source])
+@mark.parametrize("count", [None, len(LETTERS)])
+def test_lazy_source_cursors_past_the_end(args, make_source, count):
+    lazy_source = LazySource(make_source([]), count=count)
+    assert resolve_connection(lazy_source, args) == resolve_connection(LETTERS, args)
+
+
+@mark.parametrize(
+    "args",
+    [
+        {"first": 3, "after": offset_to_cursor(20)},
+        {"last": 3, "after": offset_to_cursor(20)},
+    ],
+)
+@mark.parametrize("make_source", [sliceable_source, callable_source])
+def test_lazy_source_after_the_end(args, make_source):
+    # Like with lists, cursors after the end are ignored when there is a count
+    lazy_source = LazySource(make_source([]), count=len(LETTERS))
+    assert resolve_connection(lazy_source, args) == resolve_connection(LETTERS, args)
+
+    # Without count, they give an empty page
+    edges, _page_info = resolve_connection(LazySource(make_source([])), args)
+    assert edges == []
+
+
+def test_lazy_source_last_before_the_end_without_count():
+    items = list(range(7))
+    edges, page_info = resolve_connection(
+        LazySource(items), {"last": 3, "before": offset_to_cursor(9)}
+    )
+    assert [node for node, _cursor in edges] == [4, 5, 6]
+    assert page_info.has_previous_page
+
+
+def test_infinite_iterator():
+    edges, page_info = resolve_connection(count_from(), {"first": 3})
+    assert [node for node, _cursor in edges] == [0, 1, 2]
+    assert page_info.has_next_page
+
+
+def test_lazy_source_negative_arguments():
+    with raises(ValueError, match="Argument 'first' must be a non-negative integer."):
+        resolve_connection(LazySource(LETTERS), {"first": -1})
+    with raises(ValueError, match="Argument 'last' must be a non-negative integer."):
+        resolve_connection(LazySource(LETTERS), {"last": -1})
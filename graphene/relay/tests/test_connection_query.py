@@ -1,9 +1,22 @@
-from pytest import mark
+from asyncio import sleep
+from collections import deque
+
+from pytest import mark, raises
 
 from graphql_relay.utils import base64
 
-from ...types import ObjectType, Schema, String
-from ..connection import Connection, ConnectionField, PageInfo
+from ...types import Int, ObjectType, Schema, String
+from ..connection import (
+    Connection,
+    ConnectionField,
+    KeysetConnectionField,
+    LazySource,
+    PageInfo,
+    capped_counter,
+    count_exact,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
 from ..node import Node
 
 letter_chars = ["A", "B", "C", "D", "E"]
@@ -284,3 +297,398 @@ async def test_connection_async():
             "pageInfo": {"hasPreviousPage": False, "hasNextPage": True},
         }
     }
+
+
+class KeysetLetter(ObjectType):
+    letter = String()
+    rank = Int()
+
+
+class KeysetLetterConnection(Connection):
+    class Meta:
+        node = KeysetLetter
+
+
+keyset_letters = [
+    KeysetLetter(letter=letter, rank=rank % 2)
+    for rank, letter in enumerate(letter_chars)
+]
+keyset_letters.sort(key=lambda letter: (letter.rank, letter.letter))
+
+keyset_resolver_calls = []
+
+
+class KeysetQuery(ObjectType):
+    letters = KeysetConnectionField(
+        KeysetLetterConnection, sort_keys=("rank", "letter")
+    )
+    async_letters = KeysetConnectionField(
+        KeysetLetterConnection, sort_keys=lambda letter: [letter.letter]
+    )
+
+    def resolve_letters(self, info, after=None, before=None, first=None, last=None):
+        keyset_resolver_calls.append((after, before))
+        result = [
+            letter
+            for letter in keyset_letters
+            if (after is None or (letter.rank, letter.letter) > after)
+            and (before is None or (letter.rank, letter.letter) < before)
+        ]
+        if last is not None and first is None:
+            result.reverse()
+        return result
+
+    async def resolve_async_letters(self, info, **args):
+        return sorted(keyset_letters, key=lambda letter: letter.letter)
+
+
+keyset_schema = Schema(KeysetQuery)
+
+KEYSET_QUERY = """
+query Letters($first: Int, $last: Int, $after: String, $before: String) {
+    letters(first: $first, last: $last, after: $after, before: $before) {
+        edges { node { letter } cursor }
+        pageInfo { hasPreviousPage hasNextPage startCursor endCursor }
+    }
+}
+"""
+
+
+def keyset_page(**variables):
+    result = keyset_schema.execute(KEYSET_QUERY, variables=variables)
+    assert not result.errors
+    connection = result.data["letters"]
+    letters = "".join(edge["node"]["letter"] for edge in connection["edges"])
+    return letters, connection["pageInfo"]
+
+
+def test_keyset_cursors():
+    cursor = encode_keyset_cursor([1, "B"])
+    assert decode_keyset_cursor(cursor) == (1, "B")
+    with raises(ValueError, match="Invalid cursor"):
+        decode_keyset_cursor("invalid")
+    with raises(ValueError, match="Invalid cursor"):
+        decode_keyset_cursor(base64("arrayconnection:1"))
+
+
+def test_keyset_connection_forwards():
+    keyset_resolver_calls.clear()
+    letters, page_info = keyset_page(first=2)
+    assert letters == "AC"
+    assert page_info["hasNextPage"] and not page_info["hasPreviousPage"]
+    assert decode_keyset_cursor(page_info["endCursor"]) == (0, "C")
+
+    letters, page_info = keyset_page(first=2, after=page_info["endCursor"])
+    assert letters == "EB"
+    assert page_info["hasNextPage"]
+
+    letters, page_info = keyset_page(first=2, after=page_info["endCursor"])
+    assert letters == "D"
+    assert not page_info["hasNextPage"]
+    assert keyset_resolver_calls == [(None, None), ((0, "C"), None), ((1, "B"), None)]
+
+
+def test_keyset_connection_backwards():
+    letters, page_info = keyset_page(last=2)
+    assert letters == "BD"
+    assert page_info["hasPreviousPage"] and not page_info["hasNextPage"]
+
+    letters, page_info = keyset_page(last=2, before=page_info["startCursor"])
+    assert letters == "CE"
+    assert page_info["hasPreviousPage"]
+
+    letters, page_info = keyset_page(last=5, before=page_info["startCursor"])
+    assert letters == "A"
+    assert not page_info["hasPreviousPage"]
+
+
+def test_keyset_connection_all():
+    letters, page_info = keyset_page()
+    assert letters == "ACEBD"
+    assert not page_info["hasNextPage"] and not page_info["hasPreviousPage"]
+
+
+def test_keyset_connection_invalid_cursor():
+    result = keyset_schema.execute(KEYSET_QUERY, variables={"after": "invalid"})
+    assert result.errors[0].message == 'Invalid cursor "invalid".'
+
+
+def test_keyset_connection_slices_result():
+    sliced = []
+
+    class Sliceable:
+        def __getitem__(self, item):
+            sliced.append(item)
+            return keyset_letters[item]
+
+        def __iter__(self):
+            raise AssertionError("The whole result should not be iterated")
+
+    class SliceQuery(ObjectType):
+        letters = KeysetConnectionField(KeysetLetterConnection, sort_keys="letter")
+
+        def resolve_letters(self, info, **args):
+            return Sliceable()
+
+    result = Schema(SliceQuery).execute("{ letters(first: 2) { edges { cursor } } }")
+    assert not result.errors
+    assert sliced == [slice(None, 3)]
+    assert [
+        decode_keyset_cursor(edge["cursor"]) for edge in result.data["letters"]["edges"]
+    ] == [("A",), ("C",)]
+
+
+@mark.asyncio
+async def test_keyset_connection_async():
+    result = await keyset_schema.execute_async(
+        "{ asyncLetters(first: 2) { edges { node { letter } cursor } } }"
+    )
+    assert not result.errors
+    edges = result.data["asyncLetters"]["edges"]
+    assert [edge["node"]["letter"] for edge in edges] == ["A", "B"]
+    assert decode_keyset_cursor(edges[1]["cursor"]) == ("B",)
+
+
+count_calls = []
+
+
+class CountedLetters:
+    def __init__(self, items):
+        self.items = list(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, item):
+        return self.items[item]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def count(self):
+        count_calls.append(len(self.items))
+        return len(self.items)
+
+
+class CountedLetterConnection(Connection):
+    class Meta:
+        node = Letter
+        total_count = True
+
+
+async def count_async(iterable):
+    return len(iterable)
+
+
+class CappedLetterConnection(Connection):
+    class Meta:
+        node = Letter
+        counter = capped_counter(3)
+
+
+class AsyncCountLetterConnection(Connection):
+    class Meta:
+        node = Letter
+        counter = count_async
+
+
+fetch_events = []
+
+
+async def fetch_letters(offset, limit):
+    fetch_events.append("fetch started")
+    await sleep(0)
+    fetch_events.append("fetch done")
+    return list(letters.values())[offset : None if limit is None else offset + limit]
+
+
+async def count_letters():
+    fetch_events.append("count started")
+    await sleep(0)
+    fetch_events.append("count done")
+    return len(letters)
+
+
+class CountQuery(ObjectType):
+    letters = ConnectionField(CountedLetterConnection)
+    lazy_letters = ConnectionField(CountedLetterConnection)
+    capped_letters = ConnectionField(CappedLetterConnection)
+    async_count_letters = ConnectionField(AsyncCountLetterConnection)
+    async_lazy_letters = ConnectionField(CountedLetterConnection)
+
+    def resolve_letters(self, info, **args):
+        return CountedLetters(letters.values())
+
+    def resolve_lazy_letters(self, info, **args):
+        return LazySource(list(letters.values()), count=lambda: 42)
+
+    def resolve_capped_letters(self, info, **args):
+        return list(letters.values())
+
+    def resolve_async_count_letters(self, info, **args):
+        return list(letters.values())
+
+    async def resolve_async_lazy_letters(self, info, **args):
+        return LazySource(fetch_letters, count=count_letters)
+
+
+count_schema = Schema(CountQuery)
+
+
+def test_connection_total_count():
+    assert "totalCount" not in schema.graphql_schema.get_type("LetterConnection").fields
+    count_calls.clear()
+
+    result = count_schema.execute(
+        "{ letters(first: 2) { totalCount edges { node { letter } } } }"
+    )
+    assert not result.errors
+    assert result.data["letters"]["totalCount"] == 5
+    assert count_calls == [5]
+
+
+def test_connection_total_count_only_when_selected():
+    count_calls.clear()
+    result = count_schema.execute("{ letters(first: 2) { edges { cursor } } }")
+    assert not result.errors
+    assert count_calls == []
+
+
+def test_connection_total_count_counters():
+    result = count_schema.execute(
+        "{ lazyLetters(first: 1) { totalCount } cappedLetters { totalCount } }"
+    )
+    assert not result.errors
+    assert result.data == {
+        "lazyLetters": {"totalCount": 42},
+        "cappedLetters": {"totalCount": 3},
+    }
+
+
+@mark.asyncio
+async def test_connection_total_count_async():
+    result = await count_schema.execute_async(
+        "{ asyncCountLetters(first: 1) { totalCount edges { node { letter } } } }"
+    )
+    assert not result.errors
+    assert result.data == {
+        "asyncCountLetters": {
+            "totalCount": 5,
+            "edges": [{"node": {"letter": "A"}}],
+        }
+    }
+
+
+@mark.asyncio
+async def test_connection_total_count_concurrent_with_page():
+    fetch_events.clear()
+    result = await count_schema.execute_async(
+        """
+        {
+            asyncLazyLetters(first: 2) { ...Count edges { node { letter } } }
+        }
+        fragment Count on CountedLetterConnection { totalCount }
+        """
+    )
+    assert not result.errors
+    assert result.data == {
+        "asyncLazyLetters": {
+            "totalCount": 5,
+            "edges": [{"node": {"letter": "A"}}, {"node": {"letter": "B"}}],
+        }
+    }
+    assert fetch_events == [
+        "fetch started",
+        "count started",
+        "fetch done",
+        "count done",
+    ]
+
+
+@mark.asyncio
+async def test_connection_async_lazy_source_without_total_count():
+    fetch_events.clear()
+    result = await count_schema.execute_async(
+        "{ asyncLazyLetters(last: 2) { edges { node { letter } } } }"
+    )
+    assert not result.errors
+    assert result.data == {
+        "asyncLazyLetters": {
+            "edges": [{"node": {"letter": "D"}}, {"node": {"letter": "E"}}]
+        }
+    }
+    # The count is only used to paginate from the end
+    assert fetch_events == [
+        "count started",
+        "count done",
+        "fetch started",
+        "fetch done",
+    ]
+
+
+def test_count_exact_sequences():
+    assert count_exact(range(5)) == 5
+    assert count_exact(deque("abc")) == 3
+    assert count_exact(CountedLetters("ab")) == 2
+
+
+class CountedKeysetLetterConnection(Connection):
+    class Meta:
+        node = KeysetLetter
+        total_count = True
+
+
+keyset_count_calls = []
+
+
+def count_keyset_letters(root, info, **args):
+    keyset_count_calls.append(args)
+    return len(keyset_letters)
+
+
+def resolve_keyset_letters(root, info, after=None, **args):
+    return [
+        letter
+        for letter in keyset_letters
+        if after is None or (letter.rank, letter.letter) > after
+    ]
+
+
+class CountedKeysetQuery(ObjectType):
+    letters = KeysetConnectionField(
+        CountedKeysetLetterConnection,
+        sort_keys=("rank", "letter"),
+        count=count_keyset_letters,
+        resolver=resolve_keyset_letters,
+    )
+    uncounted_letters = KeysetConnectionField(
+        CountedKeysetLetterConnection,
+        sort_keys=("rank", "letter"),
+        resolver=resolve_keyset_letters,
+    )
+
+
+def test_keyset_connection_total_count():
+    schema = Schema(CountedKeysetQuery)
+    keyset_count_calls.clear()
+    query = """
+    query Letters($after: String) {
+        letters(first: 2, after: $after) { totalCount pageInfo { endCursor } }
+        uncountedLetters(first: 2, after: $after) { totalCount }
+    }
+    """
+    result = schema.execute(query)
+    assert not result.errors
+    assert result.data["letters"]["totalCount"] == 5
+    # The result of the resolver only holds the nodes after the cursor
+    assert result.data["uncountedLetters"]["totalCount"] is None
+
+    after = result.data["letters"]["pageInfo"]["endCursor"]
+    result = schema.execute(query, variables={"after": after})
+    assert not result.errors
+    assert result.data["letters"]["totalCount"] == 5
+    assert keyset_count_calls == [{}, {}]
+
+    result = schema.execute("{ letters(first: 2) { edges { cursor } } }")
+    assert not result.errors
+    assert keyset_count_calls == [{}, {}]
@@ -1,9 +1,18 @@
 import re
+from functools import partial
 from uuid import uuid4
 
 from graphql import graphql_sync
-
-from ..id_type import BaseGlobalIDType, SimpleGlobalIDType, UUIDGlobalIDType
+from graphql_relay import to_global_id
+from pytest import mark, raises
+
+from ..id_type import (
+    BaseGlobalIDType,
+    CompactGlobalIDType,
+    DefaultGlobalIDType,
+    SimpleGlobalIDType,
+    UUIDGlobalIDType,
+)
 from ..node import Node
 from ...types import Int, ObjectType, Schema, String
 
@@ -323,3 +332,101 @@ class TestIncompleteCustomGlobalID:
         assert result.errors is not None
         assert len(result.errors) == 1
         assert result.errors[0].path == ["user"]
+
+
+class ShipIDType(CompactGlobalIDType):
+    type_ids = {"Ship": 1, "Faction": 2, "Émoji": 300}
+
+
+GLOBAL_IDS = [
+    ("Ship", 1),
+    ("Ship", "1"),
+    ("Ship", 0),
+    ("Ship", 2**70),
+    ("Faction", -5),
+    ("Faction", "abc"),
+    ("Faction", "007"),
+    ("Faction", ""),
+    ("Émoji", "ünïcode:with:colons"),
+]
+
+
+@mark.parametrize("_type,_id", GLOBAL_IDS)
+def test_default_global_id_matches_graphql_relay(_type, _id):
+    global_id = DefaultGlobalIDType.to_global_id(_type, _id)
+    assert global_id == to_global_id(_type, _id)
+    assert DefaultGlobalIDType.resolve_global_id(None, global_id) == (_type, str(_id))
+
+
+@mark.parametrize("_type,_id", GLOBAL_IDS)
+def test_compact_global_id_round_trip(_type, _id):
+    global_id = ShipIDType.to_global_id(_type, _id)
+    assert re.match(r"^[\w-]+$", global_id)
+    assert ShipIDType.resolve_global_id(None, global_id) == (_type, str(_id))
+
+
+def test_compact_global_id_is_compact():
+    assert ShipIDType.to_global_id("Ship", 1) == "AQAB"
+    assert len(ShipIDType.to_global_id("Ship", 123456)) < len(
+        DefaultGlobalIDType.to_global_id("Ship", 123456)
+    )
+
+
+def test_compact_global_id_errors():
+    with raises(Exception, match='Type "Unknown" has no id in ShipIDType.type_ids.'):
+        ShipIDType.to_global_id("Unknown", 1)
+    for global_id in ("", "invalid!", "CQAB", "AQAB" + "AA", "AQ"):
+        with raises(Exception, match="Unable to parse global ID"):
+            ShipIDType.resolve_global_id(None, global_id)
+
+    with raises(AssertionError, match="must be unique"):
+
+        class DuplicateIDType(CompactGlobalIDType):
+            type_ids = {"Ship": 1, "Faction": 1}
+
+
+def test_compact_global_id_in_schema():
+    class ShipNode(Node):
+        class Meta:
+            global_id_type = ShipIDType
+
+    class Ship(ObjectType):
+        class Meta:
+            interfaces = [ShipNode]
+
+        name = String()
+
+        @classmethod
+        def get_node(cls, info, id):
+            return Ship(id=int(id), name=f"Ship {id}")
+
+    class RootQuery(ObjectType):
+        ship = ShipNode.Field(Ship)
+
+    schema = Schema(query=RootQuery, types=[Ship])
+    global_id = ShipIDType.to_global_id("Ship", 42)
+    result = schema.execute('{ ship(id: "%s") { id name } }' % global_id)
+    assert not result.errors
+    assert result.data == {"ship": {"id": global_id, "name": "Ship 42"}}
+
+
+def encode_global_ids(to_global_id, ids):
+    return [to_global_id("Ship", _id) for _id in ids]
+
+
+BENCHMARK_IDS = range(10000)
+
+
+def test_graphql_relay_to_global_id_benchmark(benchmark):
+    benchmark(partial(encode_global_ids, to_global_id, BENCHMARK_IDS))
+
+
+def test_default_global_id_type_benchmark(benchmark):
+    global_ids = benchmark(
+        partial(encode_global_ids, DefaultGlobalIDType.to_global_id, BENCHMARK_IDS)
+    )
+    assert global_ids == encode_global_ids(to_global_id, BENCHMARK_IDS)
+
+
+def test_compact_global_id_type_benchmark(benchmark):
+    benchmark(partial(encode_global_ids, ShipIDType.to_global_id, BENCHMARK_IDS))
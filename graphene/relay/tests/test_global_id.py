@@ -1,6 +1,6 @@
 from graphql_relay import to_global_id
 
-from ...types import ID, NonNull, ObjectType, String
+from ...types import ID, NonNull, ObjectType, Schema, String
 from ...types.definitions import GrapheneObjectType
 from ..node import GlobalID, Node
 
@@ -56,3 +56,41 @@ def test_global_id_allows_setting_customer_parent_type():
     id_resolver = gid.wrap_resolve(lambda *_: my_id)
     my_global_id = id_resolver(None, None)
     assert my_global_id == to_global_id(User._meta.name, my_id)
+
+
+def test_global_id_binds_object_type_parent_type():
+    my_id = "1"
+    gid = GlobalID()
+    id_resolver = gid.wrap_resolve_for_type(lambda *_: my_id, User)
+    my_global_id = id_resolver(None, None)
+    assert my_global_id == to_global_id(User._meta.name, my_id)
+
+
+def test_global_id_of_interface_defaults_to_info_parent_type():
+    my_id = "1"
+    gid = GlobalID()
+    id_resolver = gid.wrap_resolve_for_type(lambda *_: my_id, CustomNode)
+    my_global_id = id_resolver(None, Info(User))
+    assert my_global_id == to_global_id(User._meta.name, my_id)
+
+
+def test_global_id_subclass_wrap_resolve():
+    class CustomGlobalID(GlobalID):
+        def wrap_resolve(self, parent_resolver):
+            return lambda root, info, **args: "custom"
+
+    class CustomUser(ObjectType):
+        class Meta:
+            interfaces = [Node]
+
+        id = CustomGlobalID()
+
+    class Query(ObjectType):
+        user = NonNull(CustomUser)
+
+        def resolve_user(root, info):
+            return CustomUser(id="1")
+
+    result = Schema(Query).execute("{ user { id } }")
+    assert not result.errors
+    assert result.data == {"user": {"id": "custom"}}
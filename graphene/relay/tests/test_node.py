@@ -2,8 +2,10 @@ import re
 from textwrap import dedent
 
 from graphql_relay import to_global_id
+from pytest import mark
 
 from ...types import ObjectType, Schema, String
+from ...types.schema import NodeType, get_node_registry
 from ..node import Node, is_node
 
 
@@ -101,6 +103,16 @@ def test_node_requesting_unknown_type():
     assert executed.data == {"node": None}
 
 
+def test_node_registry():
+    node_registry = get_node_registry(schema.graphql_schema)
+    assert node_registry["MyNode"] == NodeType(
+        MyNode, MyNode.get_node, None, frozenset([Node])
+    )
+    assert node_registry["RootQuery"] == NodeType(RootQuery, None, None, frozenset())
+    assert "Node" not in node_registry
+    assert get_node_registry(schema.graphql_schema) is node_registry
+
+
 def test_node_query_incorrect_id():
     executed = schema.execute(
         '{ node(id:"%s") { ... on MyNode { name } } }' % "something:2"
@@ -217,3 +229,128 @@ def test_str_schema():
         '''
         ).strip()
     )
+
+
+batch_calls = []
+
+
+class BatchedNode(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    name = String()
+
+    @staticmethod
+    def get_nodes(info, ids):
+        batch_calls.append(("BatchedNode", ids))
+        return [
+            BatchedNode(name=id) if id != "missing" else ValueError("Missing node")
+            for id in ids
+        ]
+
+
+class MappedNode(ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    name = String()
+
+    @staticmethod
+    async def get_nodes(info, ids):
+        batch_calls.append(("MappedNode", ids))
+        return {id: MappedNode(name=id) for id in ids if id != "missing"}
+
+
+class NodesQuery(ObjectType):
+    nodes = Node.NodesField()
+    only_batched_nodes = Node.NodesField(BatchedNode)
+
+
+nodes_schema = Schema(
+    query=NodesQuery, types=[MyNode, MyOtherNode, BatchedNode, MappedNode]
+)
+
+NODES_QUERY = """
+query Nodes($ids: [ID!]!) {
+    nodes(ids: $ids) {
+        ... on MyNode { name }
+        ... on BatchedNode { name }
+        ... on MappedNode { name }
+    }
+}
+"""
+
+
+def test_nodes_field_type():
+    field = nodes_schema.graphql_schema.query_type.fields["nodes"]
+    assert str(field.type) == "[Node]!"
+    assert str(field.args["ids"].type) == "[ID!]!"
+
+
+def test_nodes_query_batches_by_type():
+    batch_calls.clear()
+    ids = [
+        to_global_id("BatchedNode", "a"),
+        to_global_id("MyNode", "1"),
+        to_global_id("BatchedNode", "b"),
+        to_global_id("BatchedNode", "missing"),
+        "invalid",
+        to_global_id("Unknown", "1"),
+    ]
+    executed = nodes_schema.execute(NODES_QUERY, variables={"ids": ids})
+    assert executed.data == {
+        "nodes": [
+            {"name": "a"},
+            {"name": "1"},
+            {"name": "b"},
+            None,
+            None,
+            None,
+        ]
+    }
+    assert [(error.path, error.message) for error in executed.errors] == [
+        (["nodes", 3], "Missing node"),
+        (
+            ["nodes", 4],
+            'Unable to parse global ID "invalid". Make sure it is a base64 encoded'
+            ' string in the format: "TypeName:id". Exception message: Invalid Global ID',
+        ),
+        (["nodes", 5], 'Relay Node "Unknown" not found in schema'),
+    ]
+    assert batch_calls == [("BatchedNode", ["a", "b", "missing"])]
+
+
+@mark.asyncio
+async def test_nodes_query_async_batches():
+    batch_calls.clear()
+    ids = [
+        to_global_id("MappedNode", "x"),
+        to_global_id("BatchedNode", "a"),
+        to_global_id("MappedNode", "missing"),
+        to_global_id("MappedNode", "y"),
+    ]
+    executed = await nodes_schema.execute_async(NODES_QUERY, variables={"ids": ids})
+    assert not executed.errors
+    assert executed.data == {
+        "nodes": [
+            {"name": "x"},
+            {"name": "a"},
+            None,
+            {"name": "y"},
+        ]
+    }
+    assert batch_calls == [
+        ("BatchedNode", ["a"]),
+        ("MappedNode", ["x", "missing", "y"]),
+    ]
+
+
+def test_nodes_query_only_type():
+    executed = nodes_schema.execute(
+        "query Nodes($ids: [ID!]!) { onlyBatchedNodes(ids: $ids) { name } }",
+        variables={
+            "ids": [to_global_id("BatchedNode", "a"), to_global_id("MyNode", "1")]
+        },
+    )
+    assert executed.data == {"onlyBatchedNodes": [{"name": "a"}, None]}
+    assert executed.errors[0].message == "Must receive a BatchedNode id."
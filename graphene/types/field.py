@@ -131,6 +131,14 @@ class Field(MountedType):
 
         return self.resolver or parent_resolver
 
+    def wrap_resolve_for_type(self, parent_resolver, parent_type):
+        """
+        Wraps the function resolver of the field of the given parent_type
+        (ObjectType or Interface) when building the schema, using wrap_resolve
+        by default.
+        """
+        return self.wrap_resolve(parent_resolver)
+
     def wrap_subscribe(self, parent_subscribe):
         """
         Wraps a function subscribe, using the ObjectType subscribe_{FIELD_NAME}
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from .base import BaseOptions, BaseType, BaseTypeMeta
 from .field import Field
 from .interface import Interface
+from .resolver import ROOT_KINDS, infer_root_kind
 from .utils import yank_fields_from_attrs
 
 from dataclasses import make_dataclass, field
@@ -15,6 +16,7 @@ if TYPE_CHECKING:
 class ObjectTypeOptions(BaseOptions):
     fields = None  # type: Dict[str, Field]
     interfaces = ()  # type: Iterable[Type[Interface]]
+    root_kind = None  # type: str
 
 
 class ObjectTypeMeta(BaseTypeMeta):
@@ -105,6 +107,11 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
         default_resolver (any Callable resolver): Override the default resolver for this
             type. Defaults to graphene default resolver which returns an attribute or dictionary
             key with the same name as the field.
+        root_kind (str): Declares that the parent values of this type are always ``"dict"``
+            (fields are read by key), ``"attr"`` objects (fields are read as attributes) or
+            ``"tuple"`` (fields are read by position, in declaration order), so the schema can
+            use a resolver specialized for them instead of the default resolver. Inferred as
+            ``"attr"`` or ``"dict"`` from ``possible_types`` when not set.
         fields (Dict[str, graphene.Field]): Dictionary of field name to Field. Not recommended to
             use (prefer class attributes).
 
@@ -126,6 +133,7 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
         interfaces=(),
         possible_types=(),
         default_resolver=None,
+        root_kind=None,
         _meta=None,
         **options,
     ):
@@ -140,6 +148,9 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
             fields.update(interface._meta.fields)
         for base in reversed(cls.__mro__):
             fields.update(yank_fields_from_attrs(base.__dict__, _as=Field))
+        assert (
+            root_kind is None or root_kind in ROOT_KINDS
+        ), f"{cls.__name__}.Meta.root_kind must be one of {ROOT_KINDS}, received {root_kind!r}."
         assert not (possible_types and cls.is_type_of), (
             f"{cls.__name__}.Meta.possible_types will cause type collision with {cls.__name__}.is_type_of. "
             "Please use one or other."
@@ -153,6 +164,7 @@ class ObjectType(BaseType, metaclass=ObjectTypeMeta):
             _meta.interfaces = interfaces
         _meta.possible_types = possible_types
         _meta.default_resolver = default_resolver
+        _meta.root_kind = root_kind or infer_root_kind(possible_types)
 
         super(ObjectType, cls).__init_subclass_with_meta__(_meta=_meta, **options)
 
@@ -1,3 +1,6 @@
+from collections.abc import Mapping
+
+
 def attr_resolver(attname, default_value, root, info, **args):
     return getattr(root, attname, default_value)
 
@@ -22,3 +25,77 @@ def set_default_resolver(resolver):
 
 def get_default_resolver():
     return default_resolver
+
+
+# Resolvers specialized for the kind of root values of an ObjectType. They are
+# created once per field and resolve the value with a single call.
+
+
+def get_attr_field_resolver(attname, default_value, index=None):
+    def resolve_attr(root, info, **args):
+        return getattr(root, attname, default_value)
+
+    return resolve_attr
+
+
+def get_dict_field_resolver(attname, default_value, index=None):
+    def resolve_key(root, info, **args):
+        return root.get(attname, default_value)
+
+    return resolve_key
+
+
+def get_tuple_field_resolver(attname, default_value, index=None):
+    def resolve_item(root, info, **args):
+        return root[index]
+
+    return resolve_item
+
+
+field_resolver_factories = {
+    "attr": get_attr_field_resolver,
+    "dict": get_dict_field_resolver,
+    "tuple": get_tuple_field_resolver,
+}
+
+ROOT_KINDS = tuple(field_resolver_factories)
+
+
+def infer_root_kind(possible_types):
+    """
+    Infers the kind of root values ("dict" or "attr") of an ObjectType from its
+    `possible_types`, if they all agree.
+    """
+    if not possible_types:
+        return None
+    if all(issubclass(type_, Mapping) for type_ in possible_types):
+        if all(issubclass(type_, dict) for type_ in possible_types):
+            return "dict"
+        return None
+    if not any(issubclass(type_, (Mapping, tuple)) for type_ in possible_types):
+        return "attr"
+    return None
+
+
+def get_field_resolver(root_kind, attname, default_value, index=None):
+    return field_resolver_factories[root_kind](attname, default_value, index)
+
+
+# Getters reading the value of a field from its root alone, used by the
+# execution contexts that skip the resolver of trivial fields.
+
+
+def get_field_getter(root_kind, attname, default_value, index=None):
+    if root_kind == "dict":
+        return lambda root: root.get(attname, default_value)
+    if root_kind == "attr":
+        return lambda root: getattr(root, attname, default_value)
+    if root_kind == "tuple":
+        return lambda root: root[index]
+
+    def get_dict_or_attr(root):
+        if isinstance(root, dict):
+            return root.get(attname, default_value)
+        return getattr(root, attname, default_value)
+
+    return get_dict_or_attr
@@ -1,17 +1,29 @@
+from contextlib import nullcontext
 from enum import Enum as PyEnum
+import gc
 import inspect
 from functools import partial
+from threading import Lock
+from types import SimpleNamespace
+from typing import Callable, Dict, FrozenSet, NamedTuple, Optional
+from weakref import WeakKeyDictionary
 
 from graphql import (
     default_type_resolver,
+    execute,
+    get_nullable_type,
+    execute_sync,
     get_introspection_query,
-    graphql,
-    graphql_sync,
     introspection_types,
+    is_abstract_type,
+    is_leaf_type,
     parse,
     print_schema,
+    specified_rules,
     subscribe,
     validate,
+    validate_schema,
+    DocumentNode,
     ExecutionResult,
     GraphQLArgument,
     GraphQLBoolean,
@@ -27,8 +39,19 @@ from graphql import (
     GraphQLObjectType,
     GraphQLSchema,
     GraphQLString,
+    Source,
 )
 
+from ..execution.compiled import QueryPlan
+from ..execution.trivial import TRIVIAL_FIELD_GETTER, TrivialFieldExecutionContext
+from ..utils.dataloader import DataLoaderRegistry, run_in_event_loop
+from ..utils.document_cache import CachedDocument, DocumentCache
+from ..utils.persisted_queries import get_persisted_query
+from ..utils.schema_snapshot import (
+    THUNK_ATTRIBUTES,
+    load_schema_snapshot,
+    save_schema_snapshot,
+)
 from ..utils.str_converters import to_camel_case
 from ..utils.get_unbound_function import get_unbound_function
 from .definitions import (
@@ -46,7 +69,12 @@ from .field import Field
 from .inputobjecttype import InputObjectType
 from .interface import Interface
 from .objecttype import ObjectType
-from .resolver import get_default_resolver
+from .resolver import (
+    dict_or_attr_resolver,
+    get_default_resolver,
+    get_field_getter,
+    get_field_resolver,
+)
 from .scalars import ID, Boolean, Float, Int, Scalar, String
 from .structures import List, NonNull
 from .union import Union
@@ -79,6 +107,86 @@ def is_type_of_from_possible_types(possible_types, root, _info):
     return isinstance(root, possible_types)
 
 
+NODE_REGISTRY = "graphene_node_registry"
+
+
+class NodeType(NamedTuple):
+    """An ObjectType of the schema, with its node hooks and interfaces."""
+
+    graphene_type: type
+    get_node: Optional[Callable]
+    get_nodes: Optional[Callable]
+    interfaces: FrozenSet[type]
+
+
+def get_node_registry(graphql_schema):
+    """
+    Returns the ObjectTypes of the schema by name, built once and stored in
+    the extensions of the schema.
+    """
+    node_registry = graphql_schema.extensions.get(NODE_REGISTRY)
+    if node_registry is None:
+        node_registry = graphql_schema.extensions[NODE_REGISTRY] = {
+            name: NodeType(
+                graphql_type.graphene_type,
+                getattr(graphql_type.graphene_type, "get_node", None),
+                getattr(graphql_type.graphene_type, "get_nodes", None),
+                frozenset(graphql_type.graphene_type._meta.interfaces),
+            )
+            for name, graphql_type in graphql_schema.type_map.items()
+            if isinstance(graphql_type, GrapheneObjectType)
+        }
+    return node_registry
+
+
+# The resolve_{name} and subscribe_{name} functions of the fields of the
+# graphene types, shared by all the schemas built from them.
+own_field_functions_cache: "WeakKeyDictionary[type, Dict[str, Callable]]" = (
+    WeakKeyDictionary()
+)
+field_functions_cache: "WeakKeyDictionary[type, Dict[str, Callable]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_own_field_functions(graphene_type):
+    """
+    Returns the resolve and subscribe functions of the fields of a type,
+    defined in its class, by function name.
+    """
+    try:
+        return own_field_functions_cache[graphene_type]
+    except KeyError:
+        pass
+    functions = {}
+    for name in graphene_type._meta.fields:
+        for func_name in (f"resolve_{name}", f"subscribe_{name}"):
+            function = getattr(graphene_type, func_name, None)
+            if function:
+                # Only if is not decorated with classmethod
+                functions[func_name] = get_unbound_function(function)
+    own_field_functions_cache[graphene_type] = functions
+    return functions
+
+
+def get_field_functions(graphene_type):
+    """
+    Returns the resolve and subscribe functions of the fields of an ObjectType
+    by function name. The functions not defined in the ObjectType class are
+    looked up in its interfaces, in order.
+    """
+    try:
+        return field_functions_cache[graphene_type]
+    except KeyError:
+        pass
+    functions = {}
+    for interface in reversed(graphene_type._meta.interfaces):
+        functions.update(get_own_field_functions(interface))
+    functions.update(get_own_field_functions(graphene_type))
+    field_functions_cache[graphene_type] = functions
+    return functions
+
+
 # We use this resolver for subscriptions
 def identity_resolve(root, info, **arguments):
     return root
@@ -92,6 +200,8 @@ class TypeMap(dict):
         subscription=None,
         types=None,
         auto_camelcase=True,
+        elide_trivial_resolvers=False,
+        profiler=None,
     ):
         assert_valid_root_type(query)
         assert_valid_root_type(mutation)
@@ -102,6 +212,8 @@ class TypeMap(dict):
             assert is_graphene_type(type_)
 
         self.auto_camelcase = auto_camelcase
+        self.elide_trivial_resolvers = elide_trivial_resolvers
+        self.profiler = profiler
 
         create_graphql_type = self.add_type
 
@@ -125,23 +237,31 @@ class TypeMap(dict):
         graphql_type = self.get(name)
         if graphql_type:
             return graphql_type
-        if issubclass(graphene_type, ObjectType):
-            graphql_type = self.create_objecttype(graphene_type)
-        elif issubclass(graphene_type, InputObjectType):
-            graphql_type = self.create_inputobjecttype(graphene_type)
-        elif issubclass(graphene_type, Interface):
-            graphql_type = self.create_interface(graphene_type)
-        elif issubclass(graphene_type, Scalar):
-            graphql_type = self.create_scalar(graphene_type)
-        elif issubclass(graphene_type, Enum):
-            graphql_type = self.create_enum(graphene_type)
-        elif issubclass(graphene_type, Union):
-            graphql_type = self.construct_union(graphene_type)
-        else:
-            raise TypeError(f"Expected Graphene type, but received: {graphene_type}.")
+        with self.profile("create", name):
+            if issubclass(graphene_type, ObjectType):
+                graphql_type = self.create_objecttype(graphene_type)
+            elif issubclass(graphene_type, InputObjectType):
+                graphql_type = self.create_inputobjecttype(graphene_type)
+            elif issubclass(graphene_type, Interface):
+                graphql_type = self.create_interface(graphene_type)
+            elif issubclass(graphene_type, Scalar):
+                graphql_type = self.create_scalar(graphene_type)
+            elif issubclass(graphene_type, Enum):
+                graphql_type = self.create_enum(graphene_type)
+            elif issubclass(graphene_type, Union):
+                graphql_type = self.construct_union(graphene_type)
+            else:
+                raise TypeError(
+                    f"Expected Graphene type, but received: {graphene_type}."
+                )
         self[name] = graphql_type
         return graphql_type
 
+    def profile(self, phase, type_name=None):
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.measure(phase, type_name)
+
     @staticmethod
     def create_scalar(graphene_type):
         # We have a mapping to the original GraphQL types
@@ -301,10 +421,14 @@ class TypeMap(dict):
         return name
 
     def create_fields_for_type(self, graphene_type, is_input_type=False):
+        with self.profile("fields", graphene_type._meta.name):
+            return self.build_fields_for_type(graphene_type, is_input_type)
+
+    def build_fields_for_type(self, graphene_type, is_input_type=False):
         create_graphql_type = self.add_type
 
         fields = {}
-        for name, field in graphene_type._meta.fields.items():
+        for index, (name, field) in enumerate(graphene_type._meta.fields.items()):
             if isinstance(field, Dynamic):
                 field = get_field_as(field.get_type(self), _as=Field)
                 if not field:
@@ -336,6 +460,7 @@ class TypeMap(dict):
                     )
                 )
 
+                default_resolver = root_kind = None
                 # If we are in a subscription, we use (by default) an
                 # identity-based resolver for the root, rather than the
                 # default resolver for objects/dicts.
@@ -345,19 +470,39 @@ class TypeMap(dict):
                     default_resolver = (
                         graphene_type._meta.default_resolver or get_default_resolver()
                     )
-                    field_default_resolver = partial(
-                        default_resolver, name, field.default_value
-                    )
+                    root_kind = graphene_type._meta.root_kind
+                    if root_kind and default_resolver is dict_or_attr_resolver:
+                        field_default_resolver = get_field_resolver(
+                            root_kind, name, field.default_value, index
+                        )
+                    else:
+                        field_default_resolver = partial(
+                            default_resolver, name, field.default_value
+                        )
                 else:
                     field_default_resolver = None
 
-                resolve = field.wrap_resolve(
+                resolve = field.wrap_resolve_for_type(
                     self.get_function_for_type(
                         graphene_type, f"resolve_{name}", name, field.default_value
                     )
-                    or field_default_resolver
+                    or field_default_resolver,
+                    graphene_type,
                 )
 
+                extensions = None
+                if (
+                    self.elide_trivial_resolvers
+                    and resolve is field_default_resolver
+                    and default_resolver is dict_or_attr_resolver
+                    and is_leaf_type(get_nullable_type(field_type))
+                ):
+                    extensions = {
+                        TRIVIAL_FIELD_GETTER: get_field_getter(
+                            root_kind, name, field.default_value, index
+                        )
+                    }
+
                 _field = GraphQLField(
                     field_type,
                     args=args,
@@ -365,6 +510,7 @@ class TypeMap(dict):
                     subscribe=subscribe,
                     deprecation_reason=field.deprecation_reason,
                     description=field.description,
+                    extensions=extensions,
                 )
             field_name = field.name or self.get_name(name)
             fields[field_name] = _field
@@ -374,22 +520,7 @@ class TypeMap(dict):
         """Gets a resolve or subscribe function for a given ObjectType"""
         if not issubclass(graphene_type, ObjectType):
             return
-        resolver = getattr(graphene_type, func_name, None)
-        if not resolver:
-            # If we don't find the resolver in the ObjectType class, then try to
-            # find it in each of the interfaces
-            interface_resolver = None
-            for interface in graphene_type._meta.interfaces:
-                if name not in interface._meta.fields:
-                    continue
-                interface_resolver = getattr(interface, func_name, None)
-                if interface_resolver:
-                    break
-            resolver = interface_resolver
-
-        # Only if is not decorated with classmethod
-        if resolver:
-            return get_unbound_function(resolver)
+        return get_field_functions(graphene_type).get(func_name)
 
     def resolve_type(self, resolve_type_func, type_name, root, info, _type):
         type_ = resolve_type_func(root, info)
@@ -420,6 +551,26 @@ class Schema:
             and @skip) [GraphQLIncludeDirective, GraphQLSkipDirective].
         auto_camelcase (bool): Fieldnames will be transformed in Schema's TypeMap from snake_case
             to camelCase (preferred by GraphQL standard). Default True.
+        document_cache_size (int, optional): When set, parsed and validated documents are kept
+            in a LRU cache of this size, keyed by the query text and validation rules, so
+            repeated queries skip parsing and validation. Default None (no cache).
+        persisted_queries (PersistedQueryStore, optional): Store used to execute queries by their
+            sha256 hash, following the Automatic Persisted Queries protocol. When set, a document
+            cache is always used so hash hits skip parsing and validation.
+        compile_queries (bool): Execute the cached documents through a compiled `QueryPlan`,
+            which keeps the collected fields, field definitions, static arguments and
+            specialized value completion of the document across executions. A document cache
+            is always used when set. Default False.
+        elide_trivial_resolvers (bool): Scalar and enum fields resolved by the default resolver are
+            read directly from their parent value (dictionary key or attribute) during execution,
+            without building a `ResolveInfo` or calling the resolver. Default False.
+        lazy (bool): Defer building the types and the `GraphQLSchema` until the schema is first
+            used (executing an operation, looking up or printing a type), so creating the schema
+            is free for processes which don't use it. Errors in the type definitions are then
+            raised on first use; call `validate` to build and validate the schema eagerly.
+            Default False.
+        build_profiler (SchemaBuildProfiler, optional): Records the time spent and the memory
+            blocks allocated building the schema, per phase and per type. Default None.
     """
 
     def __init__(
@@ -430,21 +581,173 @@ class Schema:
         types=None,
         directives=None,
         auto_camelcase=True,
+        document_cache_size=None,
+        persisted_queries=None,
+        compile_queries=False,
+        elide_trivial_resolvers=False,
+        lazy=False,
+        build_profiler=None,
     ):
+        self._graphql_schema = None
+        self._build_lock = Lock()
+        self._field_names = {}
         self.query = query
         self.mutation = mutation
         self.subscription = subscription
-        type_map = TypeMap(
-            query, mutation, subscription, types, auto_camelcase=auto_camelcase
+        self._types = types
+        self._directives = directives
+        self._auto_camelcase = auto_camelcase
+        if (
+            persisted_queries is not None or compile_queries
+        ) and not document_cache_size:
+            document_cache_size = DocumentCache.DEFAULT_MAX_SIZE
+        self.document_cache = (
+            DocumentCache(document_cache_size) if document_cache_size else None
         )
-        self.graphql_schema = GraphQLSchema(
-            type_map.query,
-            type_map.mutation,
-            type_map.subscription,
-            type_map.types,
-            directives,
+        self.persisted_queries = persisted_queries
+        self.compile_queries = compile_queries
+        self.elide_trivial_resolvers = elide_trivial_resolvers
+        self.build_profiler = build_profiler
+        if not lazy:
+            self.build()
+
+    @property
+    def graphql_schema(self):
+        if self._graphql_schema is None:
+            self.build()
+        return self._graphql_schema
+
+    @graphql_schema.setter
+    def graphql_schema(self, graphql_schema):
+        self._graphql_schema = graphql_schema
+        # The cached documents were validated against the previous schema
+        self._field_names = {}
+        if self.document_cache is not None:
+            self.document_cache.clear()
+
+    def build(self):
+        """Build the types and the `GraphQLSchema` of the schema, if not built yet."""
+        if self._graphql_schema is not None:
+            return
+        # Threads racing on a lazy schema wait for the first one to build it
+        with self._build_lock:
+            if self._graphql_schema is not None:
+                return
+            profiler = self.build_profiler
+            with profiler.measure("type_map") if profiler else nullcontext():
+                type_map = TypeMap(
+                    self.query,
+                    self.mutation,
+                    self.subscription,
+                    self._types,
+                    auto_camelcase=self._auto_camelcase,
+                    elide_trivial_resolvers=self.elide_trivial_resolvers,
+                    profiler=profiler,
+                )
+            with profiler.measure("schema") if profiler else nullcontext():
+                graphql_schema = GraphQLSchema(
+                    type_map.query,
+                    type_map.mutation,
+                    type_map.subscription,
+                    type_map.types,
+                    self._directives,
+                )
+                get_node_registry(graphql_schema)
+            if profiler:
+                with profiler.measure("validation"):
+                    validate_schema(graphql_schema)
+            self._graphql_schema = graphql_schema
+
+    def validate(self):
+        """Build the schema and validate it.
+        Returns:
+            The list of `GraphQLError` of the schema, empty if it is valid.
+        """
+        return validate_schema(self.graphql_schema)
+
+    def freeze(self):
+        """Build the schema and freeze it, before forking worker processes.
+        All the lazy parts of the schema (fields, interfaces and possible types thunks, enum
+        values lookups, subtypes and validation) are computed, and `gc.freeze` moves all the
+        objects of the process to the permanent generation of the garbage collector. The
+        collections of the workers then don't write to the pages of the schema, which stay
+        shared with the parent process.
+        """
+        graphql_schema = self.graphql_schema
+        for graphql_type in graphql_schema.type_map.values():
+            for name in ("fields", "interfaces", "types", "_value_lookup"):
+                if hasattr(type(graphql_type), name):
+                    getattr(graphql_type, name)
+            # Drop the thunks, and the TypeMap partials they reference
+            for thunk, cached in THUNK_ATTRIBUTES.items():
+                if cached in graphql_type.__dict__:
+                    setattr(graphql_type, thunk, graphql_type.__dict__[cached])
+            if is_abstract_type(graphql_type):
+                for possible_type in graphql_schema.get_possible_types(graphql_type):
+                    graphql_schema.is_sub_type(graphql_type, possible_type)
+        validate_schema(graphql_schema)
+        get_node_registry(graphql_schema)
+        gc.collect()
+        gc.freeze()
+
+    def save_snapshot(self, path):
+        """Build the schema and save a snapshot of it to path.
+        The snapshot references the types and resolvers by their import path, so they
+        must be defined at the module level. The resolvers which can't be referenced
+        (lambdas, closures...) are rebuilt when the snapshot is loaded.
+        Args:
+            path (str): Path of the snapshot file, replaced atomically.
+        """
+        save_schema_snapshot(
+            path,
+            self.graphql_schema,
+            {
+                "query": self.query,
+                "mutation": self.mutation,
+                "subscription": self.subscription,
+                "types": self._types,
+                "directives": self._directives,
+                "auto_camelcase": self._auto_camelcase,
+                "elide_trivial_resolvers": self.elide_trivial_resolvers,
+            },
         )
 
+    @classmethod
+    def load_snapshot(cls, path, **options):
+        """Load a schema from a snapshot saved by `save_snapshot`, without building it.
+        Args:
+            path (str): Path of the snapshot file.
+            **options: The `document_cache_size`, `persisted_queries` and `compile_queries`
+                options of the schema.
+        Returns:
+            The `Schema`, or None if there is no snapshot at path or if it is stale (the
+            source of one of the modules it references changed since it was saved).
+        """
+        snapshot = load_schema_snapshot(path)
+        if snapshot is None:
+            return None
+        graphql_schema, schema_options, rebuild_fields = snapshot
+        schema = cls(**schema_options, **options, lazy=True)
+        if rebuild_fields:
+            type_map = TypeMap(
+                auto_camelcase=schema._auto_camelcase,
+                elide_trivial_resolvers=schema.elide_trivial_resolvers,
+            )
+            rebuilt_types = {}
+            for type_name, field_name in rebuild_fields:
+                graphql_type = graphql_schema.type_map[type_name]
+                if type_name not in rebuilt_types:
+                    rebuilt_types[type_name] = type_map.create_fields_for_type(
+                        graphql_type.graphene_type
+                    )
+                field = graphql_type.fields[field_name]
+                rebuilt_field = rebuilt_types[type_name][field_name]
+                field.resolve = rebuilt_field.resolve
+                field.subscribe = rebuilt_field.subscribe
+                field.extensions = rebuilt_field.extensions
+        schema._graphql_schema = graphql_schema
+        return schema
+
     def __str__(self):
         return print_schema(self.graphql_schema)
 
@@ -461,12 +764,159 @@ class Schema:
             return _type.graphene_type
         return _type
 
+    def get_field_names(self, type_name):
+        """Get the GraphQL names of the fields of a type, by their Python name.
+        The inverse mapping renames the keys of the input data of the type to their Python
+        name, for example with `graphene.utils.str_converters.rename_keys`.
+        Args:
+            type_name (str): Name of the ObjectType, Interface or InputObjectType.
+        Returns:
+            A dict mapping the Python names of the fields to their GraphQL names.
+        """
+        try:
+            return self._field_names[type_name]
+        except KeyError:
+            pass
+        graphql_type = self.graphql_schema.get_type(type_name)
+        if graphql_type is None:
+            raise KeyError(f'Type "{type_name}" not found in the Schema')
+        if isinstance(graphql_type, GrapheneInputObjectType):
+            field_names = {
+                field.out_name or name: name
+                for name, field in graphql_type.fields.items()
+            }
+        elif isinstance(graphql_type, (GrapheneObjectType, GrapheneInterfaceType)):
+            graphql_fields = graphql_type.fields
+            field_names = {}
+            for name, field in graphql_type.graphene_type._meta.fields.items():
+                graphql_name = getattr(field, "name", None) or (
+                    to_camel_case(name) if self._auto_camelcase else name
+                )
+                if graphql_name in graphql_fields:
+                    field_names[name] = graphql_name
+        else:
+            raise TypeError(f'Type "{type_name}" has no fields.')
+        self._field_names[type_name] = field_names
+        return field_names
+
     def lazy(self, _type):
         return lambda: self.get_type(_type)
 
-    def execute(self, *args, **kwargs):
+    def get_document(self, request_string, validation_rules=None):
+        """Parse and validate a GraphQL request against the schema.
+        When the schema has a document cache, the result is looked up in (and stored to)
+        the cache, keyed by the query text and the validation rules.
+        Args:
+            request_string (str, Source or DocumentNode): GraphQL request to prepare.
+            validation_rules (List[ASTValidationRule], optional): Validation rules to run
+                in addition to the rules specified by the GraphQL spec.
+        Returns:
+            A ``(document, errors)`` tuple. ``document`` is None if the request could not
+            be parsed, ``errors`` is a (possibly empty) list of `GraphQLError`.
+        """
+        cached = self._get_cached_document(request_string, validation_rules)
+        return cached.document, cached.errors
+
+    def get_request_document(
+        self, request_string, validation_rules=None, extensions=None
+    ):
+        """Same as `get_document`, but resolving persisted queries from the request
+        ``extensions`` first.
+        """
+        cached = self._get_cached_document(request_string, validation_rules, extensions)
+        return cached.document, cached.errors
+
+    def _get_cached_document(
+        self, request_string, validation_rules=None, extensions=None
+    ):
+        if extensions:
+            request_string, errors = get_persisted_query(
+                self.persisted_queries, request_string, extensions
+            )
+            if errors:
+                return CachedDocument(None, errors)
+
+        schema_validation_errors = validate_schema(self.graphql_schema)
+        if schema_validation_errors:
+            return CachedDocument(None, schema_validation_errors)
+
+        rules = tuple(validation_rules) if validation_rules else ()
+        cache = self.document_cache
+        if cache is None or isinstance(request_string, DocumentNode):
+            return CachedDocument(*self._parse_and_validate(request_string, rules))
+
+        body = (
+            request_string.body
+            if isinstance(request_string, Source)
+            else request_string
+        )
+        cache_key = (
+            body,
+            tuple(getattr(rule, "document_cache_key", rule) for rule in rules),
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        document, errors = self._parse_and_validate(request_string, rules)
+        if document is None:
+            # Syntax errors are not cached
+            return CachedDocument(document, errors)
+        plan = (
+            QueryPlan(self.graphql_schema, document)
+            if self.compile_queries and not errors
+            else None
+        )
+        return cache.set(cache_key, document, errors, plan)
+
+    def _get_execute_kwargs(self, cached, kwargs):
+        if not kwargs.get("execution_context_class"):
+            if cached.plan is not None:
+                kwargs["execution_context_class"] = cached.plan.execution_context_class
+            elif self.elide_trivial_resolvers:
+                kwargs["execution_context_class"] = TrivialFieldExecutionContext
+        return kwargs
+
+    @staticmethod
+    def _attach_dataloaders(kwargs, dataloaders):
+        if isinstance(dataloaders, DataLoaderRegistry):
+            registry = dataloaders
+        elif dataloaders:
+            registry = DataLoaderRegistry()
+        else:
+            return None
+        context = kwargs.get("context_value")
+        if context is None:
+            kwargs["context_value"] = SimpleNamespace(dataloaders=registry)
+        elif isinstance(context, dict):
+            context["dataloaders"] = registry
+        else:
+            context.dataloaders = registry
+        return registry
+
+    def _parse_and_validate(self, request_string, rules):
+        if isinstance(request_string, DocumentNode):
+            document = request_string
+        else:
+            try:
+                document = parse(request_string)
+            except GraphQLError as error:
+                return None, [error]
+        if rules:
+            rules = (*specified_rules, *rules)
+        return document, validate(self.graphql_schema, document, rules or None)
+
+    def execute(
+        self,
+        request_string=None,
+        *args,
+        validation_rules=None,
+        extensions=None,
+        run_event_loop=False,
+        dataloaders=None,
+        **kwargs,
+    ):
         """Execute a GraphQL query on the schema.
-        Use the `graphql_sync` function from `graphql-core` to provide the result
+        Use the `execute_sync` function from `graphql-core` to provide the result
         for a query string. Most of the time this method will be called by one of the Graphene
         :ref:`Integrations` via a web request.
         Args:
@@ -485,31 +935,75 @@ class Schema:
                 defined in `graphql-core`.
             execution_context_class (ExecutionContext, optional): The execution context class
                 to use when resolving queries and mutations.
+            validation_rules (List[ASTValidationRule], optional): Additional validation rules
+                (for example ``depth_limit_validator``) to run alongside the default ones.
+            extensions (dict, optional): The ``extensions`` of the GraphQL request. A
+                ``persistedQuery`` extension executes the query by its sha256 hash, in which case
+                ``request_string`` may be omitted. Requires ``persisted_queries`` on the Schema.
+            run_event_loop (bool, optional): Run the resolvers returning awaitables (such as
+                the loads of a ``SyncDataLoader``) on a private event loop, instead of failing
+                when the execution doesn't complete synchronously.
+            dataloaders (bool or DataLoaderRegistry, optional): Attach a ``DataLoaderRegistry``
+                to the context, as its ``dataloaders`` attribute (or key), and close it once
+                the operation is done.
         Returns:
             :obj:`ExecutionResult` containing any data and errors for the operation.
         """
         kwargs = normalize_execute_kwargs(kwargs)
-        return graphql_sync(self.graphql_schema, *args, **kwargs)
+        request_string = kwargs.pop("request_string", request_string)
+        cached = self._get_cached_document(request_string, validation_rules, extensions)
+        if cached.errors:
+            return ExecutionResult(data=None, errors=cached.errors)
+        kwargs = self._get_execute_kwargs(cached, kwargs)
+        registry = self._attach_dataloaders(kwargs, dataloaders)
+        try:
+            if run_event_loop:
+                return run_in_event_loop(
+                    execute, self.graphql_schema, cached.document, *args, **kwargs
+                )
+            return execute_sync(self.graphql_schema, cached.document, *args, **kwargs)
+        finally:
+            if registry is not None:
+                registry.close()
 
-    async def execute_async(self, *args, **kwargs):
+    async def execute_async(
+        self,
+        request_string=None,
+        *args,
+        validation_rules=None,
+        extensions=None,
+        dataloaders=None,
+        **kwargs,
+    ):
         """Execute a GraphQL query on the schema asynchronously.
-        Same as `execute`, but uses `graphql` instead of `graphql_sync`.
+        Same as `execute`, but uses `execute` instead of `execute_sync`.
         """
         kwargs = normalize_execute_kwargs(kwargs)
-        return await graphql(self.graphql_schema, *args, **kwargs)
-
-    async def subscribe(self, query, *args, **kwargs):
-        """Execute a GraphQL subscription on the schema asynchronously."""
-        # Do parsing
+        request_string = kwargs.pop("request_string", request_string)
+        cached = self._get_cached_document(request_string, validation_rules, extensions)
+        if cached.errors:
+            return ExecutionResult(data=None, errors=cached.errors)
+        kwargs = self._get_execute_kwargs(cached, kwargs)
+        registry = self._attach_dataloaders(kwargs, dataloaders)
         try:
-            document = parse(query)
-        except GraphQLError as error:
-            return ExecutionResult(data=None, errors=[error])
+            result = execute(self.graphql_schema, cached.document, *args, **kwargs)
+            if inspect.isawaitable(result):
+                return await result
+            return result
+        finally:
+            if registry is not None:
+                registry.close()
 
-        # Do validation
-        validation_errors = validate(self.graphql_schema, document)
-        if validation_errors:
-            return ExecutionResult(data=None, errors=validation_errors)
+    async def subscribe(
+        self, query=None, *args, validation_rules=None, extensions=None, **kwargs
+    ):
+        """Execute a GraphQL subscription on the schema asynchronously."""
+        # Do parsing and validation
+        document, errors = self.get_request_document(
+            query, validation_rules, extensions
+        )
+        if errors:
+            return ExecutionResult(data=None, errors=errors)
 
         # Execute the query
         kwargs = normalize_execute_kwargs(kwargs)
@@ -524,6 +1018,8 @@ class Schema:
 
 def normalize_execute_kwargs(kwargs):
     """Replace alias names in keyword arguments for graphql()"""
+    if "source" in kwargs and "request_string" not in kwargs:
+        kwargs["request_string"] = kwargs.pop("source")
     if "root" in kwargs and "root_value" not in kwargs:
         kwargs["root_value"] = kwargs.pop("root")
     if "context" in kwargs and "context_value" not in kwargs:
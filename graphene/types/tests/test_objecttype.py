@@ -225,6 +225,28 @@ def test_objecttype_with_possible_types():
             possible_types = (dict,)
 
     assert MyObjectType._meta.possible_types == (dict,)
+    assert MyObjectType._meta.root_kind == "dict"
+
+
+def test_objecttype_with_root_kind():
+    class MyObjectType(ObjectType):
+        class Meta:
+            root_kind = "tuple"
+
+    assert MyObjectType._meta.root_kind == "tuple"
+
+
+def test_objecttype_with_invalid_root_kind_should_raise():
+    with raises(AssertionError) as excinfo:
+
+        class MyObjectType(ObjectType):
+            class Meta:
+                root_kind = "list"
+
+    assert str(excinfo.value) == (
+        "MyObjectType.Meta.root_kind must be one of ('attr', 'dict', 'tuple'), "
+        "received 'list'."
+    )
 
 
 def test_objecttype_with_possible_types_and_is_type_of_should_raise():
@@ -8,6 +8,7 @@ from graphql import (
     execute,
     parse,
 )
+from pytest import mark
 
 from ..context import Context
 from ..dynamic import Dynamic
@@ -497,3 +498,97 @@ def test_default_as_kwarg_to_NonNull():
 
     assert not result.errors
     assert result.data == expected
+
+
+def test_query_root_kind():
+    class Container(ObjectType):
+        class Meta:
+            root_kind = "tuple"
+
+        x = Int()
+        y = String(default_value="unused")
+
+    class DictContainer(ObjectType):
+        class Meta:
+            root_kind = "dict"
+
+        x = Int()
+        y = String(default_value="default")
+
+    class Query(ObjectType):
+        containers = List(Container)
+        dict_containers = List(DictContainer)
+
+        def resolve_containers(self, info):
+            return [(1, "a"), (2, "b")]
+
+        def resolve_dict_containers(self, info):
+            return [{"x": 1, "y": "a"}, {"x": 2}]
+
+    test_schema = Schema(Query)
+    result = test_schema.execute("{ containers { x y } dictContainers { x y } }")
+    assert not result.errors
+    assert result.data == {
+        "containers": [{"x": 1, "y": "a"}, {"x": 2, "y": "b"}],
+        "dictContainers": [{"x": 1, "y": "a"}, {"x": 2, "y": "default"}],
+    }
+
+
+def big_list_of_containers_schema(dicts=False, meta_options=None, **schema_options):
+    """
+    Returns a schema listing 10000 containers (ObjectType instances, or dicts)
+    of 4 fields, and the expected data of the query of all their fields.
+    """
+
+    class Container(ObjectType, **(meta_options or {})):
+        x = Int()
+        y = Int()
+        z = Int()
+        o = Int()
+
+    items = [{"x": x, "y": x, "z": x, "o": x} for x in range(10000)]
+    big_container_list = items if dicts else [Container(**item) for item in items]
+
+    class Query(ObjectType):
+        all_containers = List(Container)
+
+        def resolve_all_containers(self, info):
+            return big_container_list
+
+    return Schema(Query, **schema_options), {"allContainers": items}
+
+
+@mark.parametrize(
+    "schema_options",
+    [{}, {"elide_trivial_resolvers": True}, {"compile_queries": True}],
+    ids=["default_resolvers", "trivial_fields", "compiled"],
+)
+def test_big_list_of_containers_schema_options_query_benchmark(
+    benchmark, schema_options
+):
+    hello_schema, expected = big_list_of_containers_schema(**schema_options)
+
+    big_list_query = partial(hello_schema.execute, "{ allContainers { x, y, z, o } }")
+    result = benchmark(big_list_query)
+    assert not result.errors
+    assert result.data == expected
+
+
+def test_big_list_of_dicts_multiple_fields_query_benchmark(benchmark):
+    hello_schema, expected = big_list_of_containers_schema(dicts=True)
+
+    big_list_query = partial(hello_schema.execute, "{ allContainers { x, y, z, o } }")
+    result = benchmark(big_list_query)
+    assert not result.errors
+    assert result.data == expected
+
+
+def test_big_list_of_dicts_multiple_fields_root_kind_query_benchmark(benchmark):
+    hello_schema, expected = big_list_of_containers_schema(
+        dicts=True, meta_options={"root_kind": "dict"}
+    )
+
+    big_list_query = partial(hello_schema.execute, "{ allContainers { x, y, z, o } }")
+    result = benchmark(big_list_query)
+    assert not result.errors
+    assert result.data == expected
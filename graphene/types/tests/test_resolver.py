@@ -1,8 +1,13 @@
+from collections import OrderedDict, namedtuple
+from functools import partial
+
 from ..resolver import (
     attr_resolver,
     dict_resolver,
     dict_or_attr_resolver,
     get_default_resolver,
+    get_field_resolver,
+    infer_root_kind,
     set_default_resolver,
 )
 
@@ -56,3 +61,34 @@ def test_set_default_resolver_workd():
     assert get_default_resolver() == dict_resolver
 
     set_default_resolver(default_resolver)
+
+
+def test_get_field_resolver():
+    resolver = get_field_resolver("attr", "attr", None)
+    assert resolver(demo_obj, info) == "value"
+    assert get_field_resolver("attr", "attr2", "default")(demo_obj, info) == "default"
+
+    resolver = get_field_resolver("dict", "attr", None)
+    assert resolver(demo_dict, info) == "value"
+    assert get_field_resolver("dict", "attr2", "default")(demo_dict, info) == "default"
+
+    resolver = get_field_resolver("tuple", "attr", None, index=1)
+    assert resolver(("other", "value"), info) == "value"
+
+
+def test_infer_root_kind():
+    assert infer_root_kind(()) is None
+    assert infer_root_kind((dict, OrderedDict)) == "dict"
+    assert infer_root_kind((demo_obj,)) == "attr"
+    assert infer_root_kind((namedtuple("Demo", "attr"),)) is None
+    assert infer_root_kind((dict, demo_obj)) is None
+
+
+def test_default_resolver_per_field_benchmark(benchmark):
+    resolver = partial(dict_or_attr_resolver, "attr", None)
+    benchmark(lambda: [resolver(demo_dict, info) for _ in range(1000)])
+
+
+def test_dict_field_resolver_per_field_benchmark(benchmark):
+    resolver = get_field_resolver("dict", "attr", None)
+    benchmark(lambda: [resolver(demo_dict, info) for _ in range(1000)])
@@ -1,13 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
+import gc
 from textwrap import dedent
+from threading import Barrier
+from time import sleep
 
-from pytest import raises
+from pytest import mark, raises
 
 from graphql.type import GraphQLObjectType, GraphQLSchema
 
 from ..field import Field
+from ..inputobjecttype import InputObjectType
+from ..interface import Interface
 from ..objecttype import ObjectType
 from ..scalars import String
 from ..schema import Schema
+from .utils import create_big_schema_types
 
 
 class MyOtherType(ObjectType):
@@ -72,3 +79,247 @@ def test_schema_requires_query_type():
     assert len(result.errors) == 1
     error = result.errors[0]
     assert error.message == "Query root type must be provided."
+
+
+def test_schema_document_cache():
+    schema = Schema(Query, document_cache_size=2)
+    cache = schema.document_cache
+
+    for _ in range(3):
+        result = schema.execute("{ inner { field } }", root={"inner": {"field": "a"}})
+        assert not result.errors
+        assert result.data == {"inner": {"field": "a"}}
+
+    assert (cache.hits, cache.misses, cache.size) == (2, 1, 1)
+
+    schema.execute("{ inner { __typename } }")
+    schema.execute("{ __typename }")
+    assert cache.evictions == 1
+    assert ("{ inner { field } }", ()) not in cache
+
+
+def test_schema_document_cache_validation_errors():
+    schema = Schema(Query, document_cache_size=10)
+
+    for _ in range(2):
+        result = schema.execute("{ unknown }")
+        assert (
+            result.errors[0].message == "Cannot query field 'unknown' on type 'Query'."
+        )
+    assert schema.document_cache.hits == 1
+
+    # Syntax errors are not cached
+    result = schema.execute("{ inner")
+    assert result.errors[0].message.startswith("Syntax Error")
+    assert schema.document_cache.size == 1
+
+
+def test_schema_document_cache_validation_rules():
+    from ...validation import depth_limit_validator
+
+    schema = Schema(Query, document_cache_size=10)
+    query = "{ inner { field } }"
+    depth_limit = depth_limit_validator(max_depth=0)
+
+    assert not schema.execute(query).errors
+    result = schema.execute(query, validation_rules=[depth_limit])
+    assert (
+        result.errors[0].message == "'anonymous' exceeds maximum operation depth of 0."
+    )
+    result = schema.execute(query, validation_rules=[depth_limit])
+    assert (
+        result.errors[0].message == "'anonymous' exceeds maximum operation depth of 0."
+    )
+    assert not schema.execute(query).errors
+
+    cache = schema.document_cache
+    assert (cache.hits, cache.misses, cache.size) == (2, 2, 2)
+
+
+def test_schema_document_cache_validation_rules_built_per_request():
+    from ...validation import depth_limit_validator
+
+    schema = Schema(Query, document_cache_size=10)
+    query = "{ inner { field } }"
+
+    for _ in range(3):
+        result = schema.execute(
+            query, validation_rules=[depth_limit_validator(max_depth=0)]
+        )
+        assert result.errors
+    schema.execute(query, validation_rules=[depth_limit_validator(max_depth=1)])
+
+    cache = schema.document_cache
+    assert (cache.hits, cache.misses, cache.size) == (2, 2, 2)
+
+
+def test_schema_execute_source():
+    schema = Schema(Query)
+    result = schema.execute(
+        source="{ inner { field } }", root={"inner": {"field": "a"}}
+    )
+    assert result.data == {"inner": {"field": "a"}}
+
+
+def test_schema_validation_rules_without_cache():
+    from ...validation import DisableIntrospection
+
+    schema = Schema(Query)
+    assert schema.document_cache is None
+    result = schema.execute("{ __schema { types { name } } }")
+    assert not result.errors
+    result = schema.execute(
+        "{ __schema { types { name } } }", validation_rules=[DisableIntrospection]
+    )
+    assert result.errors[0].message == (
+        "Cannot query '__schema': introspection is disabled."
+    )
+
+
+def test_schema_lazy():
+    schema = Schema(Query, lazy=True)
+    assert schema._graphql_schema is None
+    assert schema.MyOtherType == MyOtherType
+    graphql_schema = schema.graphql_schema
+    assert graphql_schema.query_type.graphene_type is Query
+    schema.build()
+    assert schema.graphql_schema is graphql_schema
+
+
+def test_schema_lazy_execute():
+    schema = Schema(Query, lazy=True)
+    result = schema.execute("{ inner { field } }", root_value={"inner": {}})
+    assert not result.errors
+    assert result.data == {"inner": {"field": None}}
+
+
+def test_schema_lazy_type_errors_raised_on_first_use():
+    class InvalidQuery(ObjectType):
+        invalid = Field(object)
+
+    schema = Schema(InvalidQuery, lazy=True)
+    with raises(TypeError):
+        str(schema)
+
+
+def test_schema_set_graphql_schema():
+    schema = Schema(Query, lazy=True)
+    graphql_schema = Schema(MyOtherType).graphql_schema
+    schema.graphql_schema = graphql_schema
+    assert schema.graphql_schema is graphql_schema
+    assert schema.MyOtherType == MyOtherType
+
+
+def test_schema_validate():
+    assert Schema(Query, lazy=True).validate() == []
+    errors = Schema(lazy=True).validate()
+    assert [error.message for error in errors] == ["Query root type must be provided."]
+
+
+@mark.parametrize("type_count", [1000, 5000])
+def test_big_schema_build_benchmark(benchmark, type_count):
+    query, types = create_big_schema_types(type_count)
+    schema = benchmark.pedantic(
+        lambda: Schema(query, types=types), rounds=3, warmup_rounds=1
+    )
+    assert len(schema.graphql_schema.type_map) > type_count
+
+
+@mark.parametrize("type_count", [1000, 5000])
+def test_big_schema_lazy_build_benchmark(benchmark, type_count):
+    query, types = create_big_schema_types(type_count)
+
+    def build_on_first_access():
+        schema = Schema(query, types=types, lazy=True)
+        return schema.graphql_schema
+
+    graphql_schema = benchmark.pedantic(
+        build_on_first_access, rounds=3, warmup_rounds=1
+    )
+    assert len(graphql_schema.type_map) > type_count
+
+
+def test_schema_freeze():
+    class Named(Interface):
+        name = String()
+
+    class Person(ObjectType):
+        class Meta:
+            interfaces = (Named,)
+
+    class PersonQuery(ObjectType):
+        named = Field(Named)
+
+        def resolve_named(root, info):
+            return Person(name="Alice")
+
+    schema = Schema(PersonQuery, types=[Person], lazy=True)
+    try:
+        schema.freeze()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    graphql_schema = schema.graphql_schema
+    person_type = graphql_schema.get_type("Person")
+    assert person_type._fields is person_type.fields
+    assert person_type._interfaces is person_type.interfaces
+    assert graphql_schema._sub_type_map == {"Named": {"Person"}}
+    assert graphql_schema.validation_errors == []
+    result = schema.execute("{ named { name } }")
+    assert result.data == {"named": {"name": "Alice"}}
+
+
+def test_schema_get_field_names():
+    class PersonInput(InputObjectType):
+        first_name = String()
+        last_name = String(name="surname")
+
+    class Person(ObjectType):
+        first_name = String()
+        last_name = String(name="surname")
+
+    class PersonQuery(ObjectType):
+        person = Field(Person, input=PersonInput())
+
+    schema = Schema(PersonQuery)
+    names = {"first_name": "firstName", "last_name": "surname"}
+    assert schema.get_field_names("Person") == names
+    assert schema.get_field_names("PersonInput") == names
+    assert schema.get_field_names("Person") is schema.get_field_names("Person")
+    assert Schema(PersonQuery, auto_camelcase=False).get_field_names("Person") == {
+        "first_name": "first_name",
+        "last_name": "surname",
+    }
+    with raises(KeyError):
+        schema.get_field_names("Unknown")
+    with raises(TypeError):
+        schema.get_field_names("String")
+
+
+def test_schema_lazy_build_once_across_threads(monkeypatch):
+    from .. import schema as schema_module
+
+    type_maps = []
+    barrier = Barrier(4)
+
+    class CountingTypeMap(schema_module.TypeMap):
+        def __init__(self, *args, **kwargs):
+            type_maps.append(self)
+            sleep(0.05)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(schema_module, "TypeMap", CountingTypeMap)
+    schema = Schema(Query, lazy=True)
+
+    def first_use():
+        barrier.wait()
+        return schema.graphql_schema
+
+    with ThreadPoolExecutor(4) as executor:
+        graphql_schemas = list(executor.map(lambda _: first_use(), range(4)))
+
+    assert len(type_maps) == 1
+    assert all(
+        graphql_schema is graphql_schemas[0] for graphql_schema in graphql_schemas
+    )
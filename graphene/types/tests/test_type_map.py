@@ -20,8 +20,9 @@ from ..inputobjecttype import InputObjectType
 from ..interface import Interface
 from ..objecttype import ObjectType
 from ..scalars import Int, String
-from ..schema import Schema
+from ..schema import Schema, get_field_functions
 from ..structures import List, NonNull
+from .utils import create_big_schema_types
 
 
 def create_type_map(types, auto_camelcase=True):
@@ -331,3 +332,61 @@ def test_interface_with_interfaces():
     assert isinstance(fields["bar"], GraphQLField)
 
     assert list(bar_graphql_type.interfaces) == list([foo_graphql_type])
+
+
+def test_field_functions_from_class_and_interfaces():
+    class FirstInterface(Interface):
+        foo = String()
+        bar = String()
+
+        def resolve_foo(root, info):
+            return "first foo"
+
+        def resolve_bar(root, info):
+            return "first bar"
+
+    class SecondInterface(Interface):
+        bar = String()
+        baz = String()
+
+        def resolve_bar(root, info):
+            return "second bar"
+
+        def resolve_baz(root, info):
+            return "second baz"
+
+        def resolve_qux(root, info):
+            return "not a field of the interface"
+
+    class MyObject(ObjectType):
+        class Meta:
+            interfaces = [FirstInterface, SecondInterface]
+
+        qux = String()
+
+        def resolve_foo(root, info):
+            return "object foo"
+
+        @classmethod
+        def subscribe_qux(cls, root, info):
+            return "object qux"
+
+    functions = get_field_functions(MyObject)
+    assert functions == {
+        "resolve_foo": MyObject.resolve_foo,
+        "resolve_bar": FirstInterface.resolve_bar,
+        "resolve_baz": SecondInterface.resolve_baz,
+        "subscribe_qux": MyObject.subscribe_qux,
+    }
+    # The functions are shared by the schemas built from the same types
+    assert get_field_functions(MyObject) is functions
+
+
+def test_big_interfaces_schema_build_benchmark(benchmark):
+    query, types = create_big_schema_types(2000, interface_count=10)
+    schema = benchmark.pedantic(
+        lambda: Schema(query, types=types), rounds=3, warmup_rounds=1
+    )
+    fields = schema.graphql_schema.get_type("BigType1999").fields
+    assert len(fields) == 53
+    assert fields["interface9Field0"].resolve(None, None) == "interface"
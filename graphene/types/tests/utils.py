@@ -1 +1,42 @@
+from ..field import Field
+from ..interface import Interface
+from ..objecttype import ObjectType
+from ..scalars import Int, String
+from ..structures import List
+
 MyLazyType = object()
+
+
+def create_big_schema_types(type_count, interface_count=0, module=__name__):
+    """Returns a query and `type_count` synthetic ObjectTypes, implementing
+    `interface_count` interfaces of 5 fields each, for the schema benchmarks."""
+    interfaces = tuple(
+        type(
+            f"BigInterface{index}",
+            (Interface,),
+            {
+                "__module__": module,
+                **{f"interface{index}_field{field}": String() for field in range(5)},
+                f"resolve_interface{index}_field0": lambda root, info: "interface",
+            },
+        )
+        for index in range(interface_count)
+    )
+    types = [
+        type(
+            f"BigType{index}",
+            (ObjectType,),
+            {
+                "__module__": module,
+                "Meta": type("Meta", (), {"interfaces": interfaces}),
+                "name": String(),
+                "value": Int(),
+                "items": List(String),
+            },
+        )
+        for index in range(type_count)
+    ]
+    query = type(
+        "BigQuery", (ObjectType,), {"__module__": module, "last": Field(types[-1])}
+    )
+    return query, types
@@ -0,0 +1,117 @@
+import json
+import sys
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class SchemaBuildProfiler(object):
+    """
+    Records the time spent and the memory blocks allocated while building a
+    schema, per phase and per graphene type.
+
+    The phases are ``type_map`` (creating the TypeMap of the root types),
+    ``schema`` (creating the GraphQLSchema, which collects all the types),
+    ``validation`` (validating the schema), and for each type ``create``
+    (creating its GraphQL type) and ``fields`` (evaluating its fields thunk,
+    including its Dynamic fields and string type imports). The measures are
+    exclusive: the time spent building a type is not counted in the phase or
+    type it's built from.
+    """
+
+    def __init__(self, timer=perf_counter):
+        self.timer = timer
+        # Phase -> [time, allocated blocks]
+        self.phases = {}
+        # Type name -> phase -> [time, allocated blocks]
+        self.types = {}
+        self._stack = []
+
+    def _record(self, frame, now, blocks):
+        phase, type_name, start, start_blocks = frame
+        for measures in (
+            self.phases,
+            self.types.setdefault(type_name, {}) if type_name else None,
+        ):
+            if measures is not None:
+                measure = measures.setdefault(phase, [0.0, 0])
+                measure[0] += now - start
+                measure[1] += blocks - start_blocks
+
+    @contextmanager
+    def measure(self, phase, type_name=None):
+        stack = self._stack
+        now, blocks = self.timer(), sys.getallocatedblocks()
+        if stack:
+            self._record(stack[-1], now, blocks)
+        stack.append((phase, type_name, now, blocks))
+        try:
+            yield
+        finally:
+            now, blocks = self.timer(), sys.getallocatedblocks()
+            self._record(stack.pop(), now, blocks)
+            if stack:
+                # Resume the measure of the enclosing phase
+                stack[-1] = stack[-1][:2] + (now, blocks)
+
+    def as_dict(self):
+        """
+        Returns the measures, with the types sorted by decreasing time, as a
+        JSON serializable dict.
+        """
+
+        def measures(phases):
+            return {
+                phase: {"time": time, "allocated_blocks": blocks}
+                for phase, (time, blocks) in phases.items()
+            }
+
+        types = sorted(
+            self.types.items(),
+            key=lambda item: sum(time for time, _blocks in item[1].values()),
+            reverse=True,
+        )
+        return {
+            "total_time": sum(time for time, _blocks in self.phases.values()),
+            "phases": measures(self.phases),
+            "types": [
+                {
+                    "name": name,
+                    "time": sum(time for time, _blocks in phases.values()),
+                    "allocated_blocks": sum(
+                        blocks for _time, blocks in phases.values()
+                    ),
+                    "phases": measures(phases),
+                }
+                for name, phases in types
+            ],
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def report(self, limit=20):
+        """Returns a text report of the phases and of the slowest types."""
+        profile = self.as_dict()
+        lines = [f"Schema build: {profile['total_time'] * 1000:.2f} ms", ""]
+        lines.append(f"{'phase':<30}{'time (ms)':>12}{'blocks':>12}")
+        for phase, measure in profile["phases"].items():
+            lines.append(
+                f"{phase:<30}{measure['time'] * 1000:>12.2f}"
+                f"{measure['allocated_blocks']:>12}"
+            )
+        lines.append("")
+        lines.append(
+            f"{'type':<30}{'time (ms)':>12}{'blocks':>12}"
+            f"{'create (ms)':>14}{'fields (ms)':>14}"
+        )
+        for type_profile in profile["types"][:limit]:
+            phases = type_profile["phases"]
+            create, fields = (
+                phases.get(phase, {}).get("time", 0) * 1000
+                for phase in ("create", "fields")
+            )
+            lines.append(
+                f"{type_profile['name']:<30}{type_profile['time'] * 1000:>12.2f}"
+                f"{type_profile['allocated_blocks']:>12}{create:>14.2f}{fields:>14.2f}"
+            )
+        return "\n".join(lines)
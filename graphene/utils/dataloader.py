@@ -1,18 +1,58 @@
 from asyncio import (
+    Semaphore,
     gather,
     ensure_future,
     get_event_loop,
+    get_running_loop,
     iscoroutine,
     iscoroutinefunction,
+    new_event_loop,
 )
-from collections import namedtuple
-from collections.abc import Iterable
+from collections import OrderedDict, namedtuple
+from datetime import date, datetime
+from decimal import Decimal
+from collections.abc import Iterable, Mapping, Set
+from concurrent.futures import Executor  # noqa: F401
 from functools import partial
+from inspect import isawaitable
+from sys import getsizeof
+from time import monotonic
+from uuid import UUID
+from weakref import WeakKeyDictionary
 
-from typing import List
+from typing import Callable, List  # noqa: F401
 
 Loader = namedtuple("Loader", "key,future")
 
+MISSING = object()
+
+
+# Types of the keys which are their own canonical key
+canonical_key_types = frozenset(
+    (str, int, float, bool, bytes, type(None), UUID, date, datetime, Decimal)
+)
+
+
+def get_canonical_key(key):
+    """
+    Returns a hashable key, equal for keys which are equal: mappings, sequences
+    and sets are converted recursively to frozen equivalents. Useful as the
+    `get_cache_key` of loaders whose keys are compound filters.
+    """
+    key_type = type(key)
+    if key_type in canonical_key_types:
+        return key
+    if isinstance(key, Mapping):
+        return (
+            Mapping,
+            frozenset((name, get_canonical_key(value)) for name, value in key.items()),
+        )
+    if isinstance(key, Set):
+        return (Set, frozenset(map(get_canonical_key, key)))
+    if isinstance(key, (list, tuple)):
+        return tuple(map(get_canonical_key, key))
+    return key
+
 
 def iscoroutinefunctionorpartial(fn):
     return iscoroutinefunction(fn.func if isinstance(fn, partial) else fn)
@@ -22,6 +62,11 @@ class DataLoader(object):
     batch = True
     max_batch_size = None  # type: int
     cache = True
+    scheduler = None  # type: BatchScheduler
+    executor = None  # type: Executor
+    max_concurrent_batches = None  # type: int
+    batch_semaphore = None  # type: BatchSemaphore
+    missing_value = None  # type: Callable
 
     def __init__(
         self,
@@ -32,15 +77,29 @@ class DataLoader(object):
         get_cache_key=None,
         cache_map=None,
         loop=None,
+        scheduler=None,
+        executor=None,
+        max_concurrent_batches=None,
+        batch_semaphore=None,
+        missing_value=None,
     ):
         self._loop = loop
 
         if batch_load_fn is not None:
             self.batch_load_fn = batch_load_fn
 
-        assert iscoroutinefunctionorpartial(
-            self.batch_load_fn
-        ), "batch_load_fn must be coroutine. Received: {}".format(self.batch_load_fn)
+        if executor is not None:
+            self.executor = executor
+
+        if max_concurrent_batches is not None:
+            self.max_concurrent_batches = max_concurrent_batches
+
+        if batch_semaphore is not None:
+            self.batch_semaphore = batch_semaphore
+        elif self.batch_semaphore is None and self.max_concurrent_batches is not None:
+            self.batch_semaphore = BatchSemaphore(self.max_concurrent_batches)
+
+        self.check_batch_load_fn()
 
         if not callable(self.batch_load_fn):
             raise TypeError(  # pragma: no cover
@@ -59,10 +118,98 @@ class DataLoader(object):
         if cache is not None:
             self.cache = cache  # pragma: no cover
 
+        if scheduler is not None:
+            self.scheduler = scheduler
+
+        if missing_value is not None:
+            self.missing_value = missing_value
+
         self.get_cache_key = get_cache_key or (lambda x: x)
 
         self._cache = cache_map if cache_map is not None else {}
         self._queue: List[Loader] = []
+        # The futures of the queued keys, by cache key
+        self._queued = {}
+        # Batches dispatched and not completed yet, and the ones among them
+        # waiting for the batch_semaphore
+        self.pending_batches = 0
+        self.waiting_batches = 0
+
+    def check_batch_load_fn(self):
+        if self.executor is not None:
+            assert not iscoroutinefunctionorpartial(self.batch_load_fn), (
+                "batch_load_fn run in an executor must not be a coroutine. "
+                "Received: {}".format(self.batch_load_fn)
+            )
+            return
+        assert iscoroutinefunctionorpartial(
+            self.batch_load_fn
+        ), "batch_load_fn must be coroutine. Received: {}".format(self.batch_load_fn)
+
+    def call_batch_load_fn(self, keys):
+        if self.executor is None and self.batch_semaphore is None:
+            return self.batch_load_fn(keys)
+        return self.run_batch(keys)
+
+    async def run_batch(self, keys):
+        """
+        Runs a batch in the executor (if any), waiting for a slot of the
+        `batch_semaphore` (if any) first.
+        """
+        semaphore = self.batch_semaphore
+        if semaphore is None:
+            return await self.run_batch_load_fn(keys)
+        self.waiting_batches += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting_batches -= 1
+        try:
+            return await self.run_batch_load_fn(keys)
+        finally:
+            semaphore.release()
+
+    @property
+    def in_flight_batches(self):
+        return self.pending_batches - self.waiting_batches
+
+    def stats(self):
+        """
+        Returns the number of keys queued for the next dispatch, and the number
+        of dispatched batches waiting for a slot or in flight.
+        """
+        return {
+            "queued_keys": len(self._queue),
+            "waiting_batches": self.waiting_batches,
+            "in_flight_batches": self.in_flight_batches,
+        }
+
+    # The attributes holding the runtime state of a loader (its futures, event
+    # loop, executor...), which are not pickled
+    runtime_attributes = (
+        "_loop",
+        "_cache",
+        "_queue",
+        "_queued",
+        "executor",
+        "batch_semaphore",
+        "scheduler",
+        "get_cache_key",
+        "missing_value",
+    )
+
+    def __getstate__(self):
+        # Pickling the bound batch_load_fn of a loader, to run it in a
+        # ProcessPoolExecutor, pickles the loader without its runtime state
+        state = dict(self.__dict__)
+        for name in self.runtime_attributes:
+            state.pop(name, None)
+        return state
+
+    def run_batch_load_fn(self, keys):
+        if self.executor is None:
+            return self.batch_load_fn(keys)
+        return self.loop.run_in_executor(self.executor, self.batch_load_fn, keys)
 
     @property
     def loop(self):
@@ -91,12 +238,27 @@ class DataLoader(object):
             if cached_result:
                 return cached_result
 
+        # If the key is already queued (when not caching, or when the cache
+        # evicted it), share the Future of the queued key.
+        try:
+            queued_result = self._queued.get(cache_key)
+        except TypeError:
+            # Unhashable keys (only loadable without cache) are not deduplicated
+            queued_result = None
+            deduplicate = False
+        else:
+            deduplicate = True
+        if queued_result is not None:
+            return queued_result
+
         # Otherwise, produce a new Future for this value.
         future = self.loop.create_future()
         # If caching, cache this Future.
         if self.cache:
             self._cache[cache_key] = future
 
+        if deduplicate:
+            self._queued[cache_key] = future
         self.do_resolve_reject(key, future)
         return future
 
@@ -109,7 +271,7 @@ class DataLoader(object):
         if len(self._queue) == 1:
             if self.batch:
                 # If batching, schedule a task to dispatch the queue.
-                enqueue_post_future_job(self.loop, self)
+                (self.scheduler or call_soon_scheduler).schedule(self)
             else:
                 # Otherwise dispatch the (queue of one) immediately.
                 dispatch_queue(self)  # pragma: no cover
@@ -177,6 +339,214 @@ class DataLoader(object):
         return self
 
 
+class BatchSemaphore(object):
+    """
+    Bounds the number of batches in flight at the same time, across all the
+    loaders sharing it. The bound applies per event loop, as loaders may be
+    used by several loops (such as the ones of ``run_event_loop``).
+    """
+
+    def __init__(self, max_concurrent_batches):
+        assert (
+            max_concurrent_batches > 0
+        ), "BatchSemaphore max_concurrent_batches must be a positive integer."
+        self.max_concurrent_batches = max_concurrent_batches
+        self.waiting = 0
+        self.in_flight = 0
+        # Event loop -> semaphore, an asyncio semaphore being bound to the
+        # first loop it waits on
+        self._semaphores = WeakKeyDictionary()
+
+    def _get_semaphore(self):
+        loop = get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = Semaphore(self.max_concurrent_batches)
+        return semaphore
+
+    async def acquire(self):
+        semaphore = self._get_semaphore()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+
+    def release(self):
+        self.in_flight -= 1
+        self._get_semaphore().release()
+
+    def stats(self):
+        return {
+            "waiting_batches": self.waiting,
+            "in_flight_batches": self.in_flight,
+            "max_concurrent_batches": self.max_concurrent_batches,
+        }
+
+
+class SyncDataLoader(DataLoader):
+    """
+    A `DataLoader` with a synchronous `batch_load_fn`, for servers executing
+    their queries with `Schema.execute`.
+
+    Resolvers return the futures of ``loader.load(key)``, and the query is run
+    with ``schema.execute(query, run_event_loop=True)``: the execution is driven
+    by a private event loop, which dispatches the loads of every level of the
+    query in a single batch before resolving the next one.
+    """
+
+    def check_batch_load_fn(self):
+        assert not iscoroutinefunctionorpartial(
+            self.batch_load_fn
+        ), "SyncDataLoader batch_load_fn must not be a coroutine. Received: {}".format(
+            self.batch_load_fn
+        )
+
+    def call_batch_load_fn(self, keys):
+        return self.run_batch(keys)
+
+    async def run_batch_load_fn(self, keys):
+        if self.executor is None:
+            return self.batch_load_fn(keys)
+        return await super().run_batch_load_fn(keys)
+
+    def load(self, key=None):
+        if not self._loop:
+            try:
+                get_running_loop()
+            except RuntimeError:
+                raise RuntimeError(
+                    "SyncDataLoader must be used in an execution running an event "
+                    "loop, such as Schema.execute(..., run_event_loop=True)."
+                )
+        return super().load(key)
+
+    def load_many(self, keys):
+        """
+        Loads multiple keys, returning an awaitable of the list of their values.
+        """
+        if not isinstance(keys, Iterable):
+            raise TypeError(  # pragma: no cover
+                (
+                    "The loader.load_many() function must be called with Iterable<key> "
+                    "but got: {}."
+                ).format(keys)
+            )
+        futures = [self.load(key) for key in keys]
+
+        # The primed futures belong to another loop, so they can't be gathered
+        async def get_values():
+            return [await future for future in futures]
+
+        return get_values()
+
+    @property
+    def loop(self):
+        # Every synchronous execution runs its own event loop
+        if self._loop:
+            return self._loop
+        try:
+            return get_running_loop()
+        except RuntimeError:
+            # Outside of an execution (when priming the cache) the futures are
+            # created already done, and are never run by their loop.
+            return get_idle_loop()
+
+
+_idle_loop = None
+
+
+def get_idle_loop():
+    global _idle_loop
+    if _idle_loop is None:
+        _idle_loop = new_event_loop()
+        _idle_loop.close()
+    return _idle_loop
+
+
+def run_in_event_loop(fn, *args, **kwargs):
+    """
+    Calls `fn` on a private event loop, returning its result once awaited if it
+    is awaitable.
+    """
+
+    async def run():
+        result = fn(*args, **kwargs)
+        if isawaitable(result):
+            return await result
+        return result
+
+    loop = new_event_loop()
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+class DataLoaderRegistry(object):
+    """
+    The loaders of a single operation, instantiated by class on first use and
+    shared by all of its resolvers.
+
+    Pass ``dataloaders=True`` to `Schema.execute_async` (or `Schema.execute`) to
+    attach a registry to the context of the operation, as its ``dataloaders``
+    attribute (or key, if the context is a dict), and close it once the
+    operation is done:
+
+    >>> user = await info.context.dataloaders[UserLoader].load(user_id)
+    """
+
+    def __init__(self, **loader_options):
+        # Options passed to every loader instantiated by the registry
+        self.loader_options = loader_options
+        self._loaders = {}
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def __contains__(self, loader_class):
+        return loader_class in self._loaders
+
+    def __getitem__(self, loader_class):
+        return self.get(loader_class)
+
+    def get(self, loader_class):
+        """Returns the loader of `loader_class`, instantiating it if needed."""
+        loader = self._loaders.get(loader_class)
+        if loader is None:
+            loader = self._loaders[loader_class] = loader_class(**self.loader_options)
+        return loader
+
+    def prime_many(self, loader_class, values, get_key):
+        """
+        Primes the loader of `loader_class` with values fetched by another
+        loader, keyed by `get_key(value)`. Returns the values, so it can wrap the
+        result of a batch function:
+
+        >>> users = registry.prime_many(UserLoader, users, attrgetter("id"))
+        """
+        loader = self.get(loader_class)
+        for value in values:
+            if value is not None and not isinstance(value, Exception):
+                loader.prime(get_key(value), value)
+        return values
+
+    def close(self):
+        """
+        Drops the caches and pending queues of all the loaders, cancelling the
+        futures of the keys which were queued but not dispatched.
+        """
+        for loader in self._loaders.values():
+            for queued in loader._queue:
+                if not queued.future.done():
+                    queued.future.cancel()
+            loader._queue = []
+            loader._queued = {}
+            loader.clear_all()
+        self._loaders.clear()
+
+
 def enqueue_post_future_job(loop, loader):
     async def dispatch():
         dispatch_queue(loader)
@@ -184,6 +554,279 @@ def enqueue_post_future_job(loop, loader):
     loop.call_soon(ensure_future, dispatch())
 
 
+class BatchScheduler(object):
+    """
+    Decides when the queue of a `DataLoader` is dispatched. `schedule` is called
+    every time the queue of a loader changes from "empty" to "full".
+    """
+
+    def schedule(self, loader):
+        raise NotImplementedError  # pragma: no cover
+
+
+class CallSoonScheduler(BatchScheduler):
+    """Dispatches the queue on the next iteration of the event loop (the default)."""
+
+    def schedule(self, loader):
+        enqueue_post_future_job(loader.loop, loader)
+
+
+class TickScheduler(BatchScheduler):
+    """
+    Dispatches the queue after `ticks` iterations of the event loop, so loads
+    happening a few iterations apart are still batched together.
+    """
+
+    def __init__(self, ticks=1):
+        assert ticks >= 1, "TickScheduler ticks must be at least 1."
+        self.ticks = ticks
+
+    def schedule(self, loader):
+        loop = loader.loop
+
+        def tick(remaining):
+            if remaining:
+                loop.call_soon(tick, remaining - 1)
+            else:
+                enqueue_post_future_job(loop, loader)
+
+        tick(self.ticks - 1)
+
+
+class TimeWindowScheduler(BatchScheduler):
+    """Dispatches the queue `window` seconds after its first load."""
+
+    def __init__(self, window=0.002):
+        self.window = window
+
+    def schedule(self, loader):
+        loader.loop.call_later(self.window, dispatch_queue, loader)
+
+
+class SharedScheduler(BatchScheduler):
+    """
+    Dispatches the queues of all the loaders sharing this scheduler together,
+    once `idle_ticks` iterations of the event loop went by without any of them
+    getting new loads. When resolving a query this happens when the executor is
+    done with a level of the query, so every loader gets a single batch per level.
+
+    `max_ticks` bounds the number of iterations the dispatch can be delayed.
+    """
+
+    def __init__(self, idle_ticks=1, max_ticks=None):
+        assert idle_ticks >= 1, "SharedScheduler idle_ticks must be at least 1."
+        self.idle_ticks = idle_ticks
+        self.max_ticks = max_ticks
+        self._loaders = []
+
+    def schedule(self, loader):
+        self._loaders.append(loader)
+        if len(self._loaders) == 1:
+            loader.loop.call_soon(self._tick, loader.loop, self._queued(), 1, 0)
+
+    def _queued(self):
+        return sum(len(loader._queue) for loader in self._loaders)
+
+    def _tick(self, loop, queued, ticks, idle):
+        current = self._queued()
+        idle = idle + 1 if current == queued else 0
+        if idle < self.idle_ticks and (
+            self.max_ticks is None or ticks < self.max_ticks
+        ):
+            loop.call_soon(self._tick, loop, current, ticks + 1, idle)
+            return
+        loaders = self._loaders
+        self._loaders = []
+        for loader in loaders:
+            dispatch_queue(loader)
+
+
+call_soon_scheduler = CallSoonScheduler()
+
+
+class CacheMap(object):
+    """
+    Base class for the bounded `cache_map` of a `DataLoader`, mapping cache keys
+    to the futures of their values.
+
+    Entries are kept from the least to the most recently used, and the futures
+    that fail are evicted once they are rejected so the load is retried later.
+    Futures already done when stored (the ones set by `DataLoader.prime`) are
+    kept as they are.
+    """
+
+    def __init__(self):
+        self._futures = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._futures)
+
+    def __contains__(self, key):
+        return key in self._futures
+
+    @property
+    def size(self):
+        return len(self._futures)
+
+    def get(self, key, default=None):
+        future = self._futures.get(key)
+        if future is None or self.is_expired(key):
+            if future is not None:
+                self.evict(key)
+            self.misses += 1
+            return default
+        self._futures.move_to_end(key)
+        self.hits += 1
+        return future
+
+    def __setitem__(self, key, future):
+        self.pop(key, None)
+        self._futures[key] = future
+        self.on_set(key, future)
+        if not future.done():
+            future.add_done_callback(partial(self.on_done, key))
+        self.evict_overflow()
+
+    def pop(self, key, default=None):
+        if key not in self._futures:
+            return default
+        future = self._futures.pop(key)
+        self.on_remove(key, future)
+        return future
+
+    def clear(self):
+        for key in list(self._futures):
+            self.pop(key)
+
+    def evict(self, key):
+        self.pop(key)
+        self.evictions += 1
+
+    def evict_overflow(self):
+        pass
+
+    def is_expired(self, key):
+        return False
+
+    def on_set(self, key, future):
+        pass
+
+    def on_remove(self, key, future):
+        pass
+
+    def on_done(self, key, future):
+        if self._futures.get(key) is not future:
+            return
+        if future.cancelled() or future.exception() is not None:
+            self.evict(key)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+        }
+
+
+class LRUCacheMap(CacheMap):
+    """A `cache_map` holding at most `max_size` entries."""
+
+    def __init__(self, max_size=1024):
+        assert max_size > 0, "LRUCacheMap max_size must be a positive integer."
+        super().__init__()
+        self.max_size = max_size
+
+    def evict_overflow(self):
+        while len(self._futures) > self.max_size:
+            self.evict(next(iter(self._futures)))
+
+    def stats(self):
+        return dict(super().stats(), max_size=self.max_size)
+
+
+class TTLCacheMap(LRUCacheMap):
+    """
+    A `cache_map` where entries expire `ttl` seconds after being stored, holding
+    at most `max_size` entries.
+    """
+
+    def __init__(self, ttl, max_size=1024, timer=monotonic):
+        assert ttl > 0, "TTLCacheMap ttl must be a positive number."
+        super().__init__(max_size)
+        self.ttl = ttl
+        self.timer = timer
+        # As the ttl is constant, the entries expire in the order they are set
+        self._expires = OrderedDict()
+
+    def is_expired(self, key):
+        return self._expires[key] <= self.timer()
+
+    def on_set(self, key, future):
+        self._expires[key] = self.timer() + self.ttl
+
+    def on_remove(self, key, future):
+        del self._expires[key]
+
+    def evict_overflow(self):
+        now = self.timer()
+        while self._expires:
+            key, expires = next(iter(self._expires.items()))
+            if expires > now:
+                break
+            self.evict(key)
+        super().evict_overflow()
+
+
+class SizedCacheMap(CacheMap):
+    """
+    A `cache_map` bounded by the total size of the loaded values, as measured by
+    `get_size` (`sys.getsizeof` by default) once each future is resolved.
+    """
+
+    def __init__(self, max_total_size, get_size=getsizeof):
+        assert max_total_size > 0, "SizedCacheMap max_total_size must be positive."
+        super().__init__()
+        self.max_total_size = max_total_size
+        self.get_size = get_size
+        self.total_size = 0
+        self._sizes = {}
+
+    def on_set(self, key, future):
+        if future.done():
+            self.add_size(key, future.exception() or future.result())
+
+    def on_remove(self, key, future):
+        self.total_size -= self._sizes.pop(key, 0)
+
+    def on_done(self, key, future):
+        if self._futures.get(key) is not future:
+            return
+        if future.cancelled() or future.exception() is not None:
+            self.evict(key)
+        else:
+            self.add_size(key, future.result())
+            self.evict_overflow()
+
+    def add_size(self, key, value):
+        self._sizes[key] = self.get_size(value)
+        self.total_size += self._sizes[key]
+
+    def evict_overflow(self):
+        while self.total_size > self.max_total_size and self._futures:
+            self.evict(next(iter(self._futures)))
+
+    def stats(self):
+        return dict(
+            super().stats(),
+            total_size=self.total_size,
+            max_total_size=self.max_total_size,
+        )
+
+
 def get_chunks(iterable_obj, chunk_size=1):
     chunk_size = max(1, chunk_size)
     return (
@@ -199,7 +842,11 @@ def dispatch_queue(loader):
     """
     # Take the current loader queue, replacing it with an empty queue.
     queue = loader._queue
+    if not queue:
+        # The queue was dropped since the dispatch was scheduled
+        return
     loader._queue = []
+    loader._queued = {}
 
     # If a max_batch_size was provided and the queue is longer, then segment the
     # queue into multiple batches, otherwise treat the queue as a single batch.
@@ -214,11 +861,19 @@ def dispatch_queue(loader):
 
 
 async def dispatch_queue_batch(loader, queue):
+    loader.pending_batches += 1
+    try:
+        return await load_queue_batch(loader, queue)
+    finally:
+        loader.pending_batches -= 1
+
+
+async def load_queue_batch(loader, queue):
     # Collect all keys to be loaded in this dispatch
     keys = [loaded.key for loaded in queue]
 
     # Call the provided batch_load_fn for this loader with the loader queue's keys.
-    batch_future = loader.batch_load_fn(keys)
+    batch_future = loader.call_batch_load_fn(keys)
 
     # Assert the expected response from batch_load_fn
     if not batch_future or not iscoroutine(batch_future):
@@ -236,6 +891,9 @@ async def dispatch_queue_batch(loader, queue):
 
     try:
         values = await batch_future
+        if isinstance(values, Mapping):
+            return resolve_queue_from_mapping(loader, queue, values)
+
         if not isinstance(values, Iterable):
             raise TypeError(  # pragma: no cover
                 (
@@ -270,11 +928,42 @@ async def dispatch_queue_batch(loader, queue):
         return failed_dispatch(loader, queue, e)
 
 
+def resolve_queue_from_mapping(loader, queue, values):
+    """
+    Resolves or rejects each Future in the loaded queue with the value of its
+    key in the mapping returned by batch_load_fn, or `loader.missing_value`
+    if the key is missing.
+    """
+    missing_value = loader.missing_value
+    get_value = values.get
+    for loaded in queue:
+        value = get_value(loaded.key, MISSING)
+        if value is MISSING and missing_value:
+            try:
+                value = missing_value(loaded.key)
+            except Exception as error:
+                value = error
+        elif value is MISSING:
+            value = None
+        if isinstance(value, Exception):
+            loaded.future.set_exception(value)
+        else:
+            loaded.future.set_result(value)
+
+
+def missing_key_error(key):
+    """A `missing_value` rejecting the loads of the keys missing from the batch."""
+    return KeyError(key)
+
+
 def failed_dispatch(loader, queue, error):
     """
     Do not cache individual loads if the entire batch dispatch fails,
-    but still reject each request so they do not hang.
+    but still reject each request so they do not hang. The loads already
+    resolved (or cancelled) are kept.
     """
     for loaded in queue:
+        if loaded.future.done():
+            continue
         loader.clear(loaded.key)
         loaded.future.set_exception(error)
@@ -0,0 +1,80 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+CachedDocument = namedtuple("CachedDocument", "document,errors,plan", defaults=(None,))
+
+
+class DocumentCache(object):
+    """
+    A bounded LRU cache of parsed and validated GraphQL documents.
+
+    Entries are keyed by the query text plus the set of validation rules the
+    document was validated with, so the same query validated with different
+    rules is cached separately. The cache can be shared by the threads
+    executing queries on the same schema.
+    """
+
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        assert max_size > 0, "DocumentCache max_size must be a positive integer."
+        self.max_size = max_size
+        self._documents = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._documents)
+
+    def __contains__(self, key):
+        return key in self._documents
+
+    @property
+    def size(self):
+        return len(self._documents)
+
+    def get(self, key):
+        """
+        Returns the `CachedDocument` stored for `key` (marking it as the most
+        recently used one), or None if there is no such entry.
+        """
+        with self._lock:
+            try:
+                cached = self._documents[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._documents.move_to_end(key)
+            self.hits += 1
+        # The errors are returned to the callers, which may change them
+        return cached._replace(errors=list(cached.errors))
+
+    def set(self, key, document, errors=None, plan=None):
+        """
+        Stores a document, its validation errors and its compiled `QueryPlan`,
+        evicting the least recently used entry if the cache is full.
+        """
+        cached = CachedDocument(document, list(errors or ()), plan)
+        with self._lock:
+            self._documents[key] = cached
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+                self.evictions += 1
+        return cached._replace(errors=list(cached.errors))
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+        return self
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+            "max_size": self.max_size,
+        }
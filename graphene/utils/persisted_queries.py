@@ -0,0 +1,144 @@
+import json
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+
+from graphql import GraphQLError, Source
+
+PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+PERSISTED_QUERY_NOT_SUPPORTED = "PERSISTED_QUERY_NOT_SUPPORTED"
+PERSISTED_QUERY_HASH_MISMATCH = "PERSISTED_QUERY_HASH_MISMATCH"
+
+
+def get_query_hash(query):
+    """Returns the hex-encoded sha256 hash of a query string, as used by APQ."""
+    if isinstance(query, Source):
+        query = query.body
+    return sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryStore(object):
+    """
+    Base class for the stores mapping a query hash to its query string.
+
+    Stores where `can_register` is False only serve the queries they already
+    know about, queries sent by clients are never added to them.
+    """
+
+    can_register = True
+
+    def get(self, query_hash):
+        raise NotImplementedError  # pragma: no cover
+
+    def set(self, query_hash, query):
+        raise NotImplementedError  # pragma: no cover
+
+
+class InMemoryPersistedQueryStore(PersistedQueryStore):
+    """
+    A store keeping at most `max_size` queries (None for no limit), evicting
+    the least recently used one when a query is registered in a full store.
+    """
+
+    DEFAULT_MAX_SIZE = 10000
+
+    def __init__(self, queries=None, max_size=DEFAULT_MAX_SIZE):
+        assert (
+            max_size is None or max_size > 0
+        ), "InMemoryPersistedQueryStore max_size must be a positive integer."
+        self.max_size = max_size
+        self._queries = OrderedDict(queries or {})
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._queries)
+
+    def __contains__(self, query_hash):
+        return query_hash in self._queries
+
+    def get(self, query_hash):
+        with self._lock:
+            query = self._queries.get(query_hash)
+            if query is not None:
+                self._queries.move_to_end(query_hash)
+        return query
+
+    def set(self, query_hash, query):
+        with self._lock:
+            self._queries[query_hash] = query
+            self._queries.move_to_end(query_hash)
+            if self.max_size is not None:
+                while len(self._queries) > self.max_size:
+                    self._queries.popitem(last=False)
+
+
+class FilePersistedQueryStore(InMemoryPersistedQueryStore):
+    """
+    A store loaded from a pre-generated JSON manifest.
+
+    Both the flat ``{"<sha256>": "<query>"}`` format and the Apollo persisted
+    query manifest format (``{"operations": [{"id": ..., "body": ...}]}``) are
+    supported.
+    """
+
+    can_register = False
+
+    def __init__(self, path, can_register=None, max_size=None):
+        self.path = path
+        if can_register is not None:
+            self.can_register = can_register
+        with open(path, encoding="utf-8") as manifest:
+            super().__init__(self.parse_manifest(json.load(manifest)), max_size)
+
+    @staticmethod
+    def parse_manifest(manifest):
+        if "operations" in manifest:
+            return {
+                operation["id"]: operation["body"]
+                for operation in manifest["operations"]
+            }
+        return manifest
+
+
+def get_persisted_query(store, query, extensions):
+    """
+    Resolves the query to execute following the Automatic Persisted Queries
+    protocol: when only a hash is sent the query is looked up in the `store`,
+    when both a hash and a query are sent the query is verified and registered.
+
+    Returns a ``(query, errors)`` tuple.
+    """
+    persisted_query = (extensions or {}).get("persistedQuery")
+    if not persisted_query:
+        return query, []
+
+    if store is None or persisted_query.get("version") != 1:
+        return None, [
+            GraphQLError(
+                "PersistedQueryNotSupported",
+                extensions={"code": PERSISTED_QUERY_NOT_SUPPORTED},
+            )
+        ]
+
+    query_hash = persisted_query.get("sha256Hash")
+    if query is None:
+        query = store.get(query_hash)
+        if query is None:
+            return None, [
+                GraphQLError(
+                    "PersistedQueryNotFound",
+                    extensions={"code": PERSISTED_QUERY_NOT_FOUND},
+                )
+            ]
+        return query, []
+
+    if get_query_hash(query) != query_hash:
+        return None, [
+            GraphQLError(
+                "provided sha does not match query",
+                extensions={"code": PERSISTED_QUERY_HASH_MISMATCH},
+            )
+        ]
+    if store.can_register:
+        store.set(query_hash, query.body if isinstance(query, Source) else query)
+    return query, []
@@ -0,0 +1,251 @@
+import copyreg
+import io
+import os
+import pickle
+import sys
+from hashlib import sha256
+from importlib.util import find_spec
+from operator import attrgetter
+from types import FunctionType
+
+from graphql import GraphQLField, GraphQLNamedType
+
+from ..types.definitions import GrapheneGraphQLType
+from ..types.field import Field
+
+SNAPSHOT_FORMAT = 1
+
+# The attributes of the GraphQL types holding the thunks of their fields,
+# interfaces or union types, with the attributes caching their values.
+THUNK_ATTRIBUTES = {"_fields": "fields", "_interfaces": "interfaces", "_types": "types"}
+
+# The resolver attributes of the fields which are rebuilt on load when they
+# can't be pickled (lambdas, closures...).
+RESOLVER_ATTRIBUTES = ("resolve", "subscribe", "extensions")
+
+
+class SnapshotHeader(object):
+    """
+    The first object of a snapshot file, read to check if the snapshot can be
+    loaded before unpickling the schema.
+    """
+
+    def __init__(self, sources, rebuild_fields):
+        self.format = SNAPSHOT_FORMAT
+        self.python = sys.version_info[:2]
+        # Module name -> sha256 of its source file
+        self.sources = sources
+        # (type name, field name) of the fields whose resolvers are rebuilt
+        self.rebuild_fields = rebuild_fields
+
+    def is_stale(self):
+        if self.format != SNAPSHOT_FORMAT or self.python != sys.version_info[:2]:
+            return True
+        return any(
+            get_source_hash(module) != source_hash
+            for module, source_hash in self.sources.items()
+        )
+
+
+def get_source_hash(module):
+    """Returns the sha256 of the source file of a module, or None."""
+    loaded = sys.modules.get(module)
+    path = getattr(loaded, "__file__", None) if loaded else None
+    if path is None:
+        try:
+            spec = find_spec(module)
+        except (ImportError, ValueError):
+            return None
+        path = spec.origin if spec and spec.has_location else None
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as source:
+            return sha256(source.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def get_graphene_field(graphene_type, name):
+    return graphene_type._meta.fields[name]
+
+
+def is_importable(obj):
+    """Check if pickle can find obj by its module and qualified name."""
+    module = sys.modules.get(getattr(obj, "__module__", None))
+    qualname = getattr(obj, "__qualname__", "")
+    if module is None or "<locals>" in qualname:
+        return False
+    found = module
+    for name in qualname.split("."):
+        found = getattr(found, name, None)
+    return found is obj
+
+
+def get_class_recipes(graphene_types):
+    """
+    Returns how to find the classes created by Graphene (connection edges,
+    input object containers, enums...) which can't be found by their
+    qualified name, from the types defining them.
+    """
+    recipes = {}
+    for graphene_type in graphene_types:
+        meta = graphene_type._meta
+        for path in ("_meta.container", "_meta.enum"):
+            value = getattr(meta, path.split(".")[1], None)
+            if isinstance(value, type) and not is_importable(value):
+                recipes[value] = attrgetter(path), (graphene_type,)
+        for name, value in vars(graphene_type).items():
+            if (
+                isinstance(value, type)
+                and value in graphene_types
+                and not is_importable(value)
+            ):
+                recipes.setdefault(value, (attrgetter(name), (graphene_type,)))
+    return recipes
+
+
+def get_graphene_fields(graphene_types):
+    """Returns the type and name of the Graphene fields of the types, by id."""
+    graphene_fields = {}
+    for graphene_type in graphene_types:
+        fields = getattr(graphene_type._meta, "fields", None) or {}
+        for name, field in fields.items():
+            if isinstance(field, Field):
+                graphene_fields.setdefault(id(field), (graphene_type, name))
+    return graphene_fields
+
+
+class SchemaPickler(pickle.Pickler):
+    """
+    Pickles a GraphQL schema built by Graphene.
+
+    Functions and classes are pickled by reference (their import path), and
+    the modules defining them are collected to detect stale snapshots.
+    Graphene fields are pickled by reference to the type defining them, and
+    the rebuild_fields (whose resolvers can't be pickled) without resolvers.
+    """
+
+    def __init__(self, file, class_recipes, graphene_fields, rebuild_fields=()):
+        super(SchemaPickler, self).__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.class_recipes = class_recipes
+        self.graphene_fields = graphene_fields
+        self.rebuild_fields = {id(field) for field in rebuild_fields}
+        self.modules = set()
+
+    def reducer_override(self, obj):
+        if isinstance(obj, (type, FunctionType)):
+            recipe = self.class_recipes.get(obj) if isinstance(obj, type) else None
+            if recipe:
+                return recipe
+            self.modules.add(obj.__module__)
+            return NotImplemented
+        if isinstance(obj, GraphQLNamedType):
+            if obj.name in GraphQLNamedType.reserved_types:
+                return NotImplemented
+            # Restore the state of the type as is, without calling __new__ (which
+            # looks up the reserved types) or __init__
+            state = dict(obj.__dict__)
+            for thunk, cached in THUNK_ATTRIBUTES.items():
+                if thunk in state and cached in state:
+                    state[thunk] = state[cached]
+            return object.__new__, (type(obj),), state
+        if isinstance(obj, GraphQLField) and id(obj) in self.rebuild_fields:
+            state = dict(obj.__dict__)
+            for attribute in RESOLVER_ATTRIBUTES:
+                state[attribute] = None
+            return copyreg.__newobj__, (type(obj),), state
+        if isinstance(obj, Field):
+            graphene_field = self.graphene_fields.get(id(obj))
+            if graphene_field:
+                return get_graphene_field, graphene_field
+        return NotImplemented
+
+
+def find_rebuild_fields(graphql_schema, class_recipes, graphene_fields):
+    """
+    Returns the type name, field name and field of the fields of the schema
+    whose resolvers can't be pickled.
+    """
+    rebuild_fields = []
+    for type_name, graphql_type in graphql_schema.type_map.items():
+        if not isinstance(graphql_type, GrapheneGraphQLType):
+            continue
+        for field_name, field in (getattr(graphql_type, "fields", None) or {}).items():
+            if not isinstance(field, GraphQLField):
+                continue
+            resolvers = tuple(getattr(field, name) for name in RESOLVER_ATTRIBUTES)
+            try:
+                SchemaPickler(io.BytesIO(), class_recipes, graphene_fields).dump(
+                    resolvers
+                )
+            except (pickle.PicklingError, AttributeError, TypeError):
+                rebuild_fields.append((type_name, field_name, field))
+    return rebuild_fields
+
+
+def save_schema_snapshot(path, graphql_schema, options):
+    """
+    Saves a snapshot of a GraphQL schema built by Graphene, and the options
+    of the Graphene schema, to path.
+    """
+    graphene_types = {
+        graphql_type.graphene_type
+        for graphql_type in graphql_schema.type_map.values()
+        if isinstance(graphql_type, GrapheneGraphQLType)
+    }
+    class_recipes = get_class_recipes(graphene_types)
+    graphene_fields = get_graphene_fields(graphene_types)
+    rebuild_fields = find_rebuild_fields(graphql_schema, class_recipes, graphene_fields)
+
+    body = io.BytesIO()
+    pickler = SchemaPickler(
+        body,
+        class_recipes,
+        graphene_fields,
+        [field for _type_name, _field_name, field in rebuild_fields],
+    )
+    pickler.dump((graphql_schema, options))
+    sources = {
+        module: source_hash
+        for module, source_hash in (
+            (module, get_source_hash(module)) for module in sorted(pickler.modules)
+        )
+        if source_hash
+    }
+    header = SnapshotHeader(
+        sources,
+        [(type_name, field_name) for type_name, field_name, _field in rebuild_fields],
+    )
+
+    # Write to a temporary file first, so processes loading the snapshot
+    # never read a partial one.
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as snapshot:
+        pickle.dump(header, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        snapshot.write(body.getbuffer())
+    os.replace(temporary_path, path)
+
+
+def load_schema_snapshot(path):
+    """
+    Loads a snapshot saved by save_schema_snapshot.
+
+    Returns:
+        A ``(graphql_schema, options, rebuild_fields)`` tuple, or None if there
+        is no snapshot at path or if it is stale (one of the modules it
+        references changed since it was saved).
+    """
+    try:
+        snapshot = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with snapshot:
+        try:
+            header = pickle.load(snapshot)
+        except Exception:
+            return None
+        if not isinstance(header, SnapshotHeader) or header.is_stale():
+            return None
+        graphql_schema, options = pickle.load(snapshot)
+    return graphql_schema, options, header.rebuild_fields
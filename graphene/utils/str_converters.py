@@ -1,17 +1,79 @@
 import re
+import sys
+from typing import Dict
+
+# The converted names, shared by all the schemas built in the process. As the
+# converters are also used on the keys of input data, the number of cached
+# names is bounded.
+MAX_CACHED_NAMES = 16384
+camel_case_names: Dict[str, str] = {}
+snake_case_names: Dict[str, str] = {}
+
+FIRST_CAP_RE = re.compile("(.)([A-Z][a-z]+)")
+ALL_CAP_RE = re.compile("([a-z0-9])([A-Z])")
+
+
+def cache_name(names, name, converted_name):
+    converted_name = sys.intern(converted_name)
+    if len(names) < MAX_CACHED_NAMES:
+        names[name] = converted_name
+    return converted_name
 
 
 # Adapted from this response in Stackoverflow
 # http://stackoverflow.com/a/19053800/1072990
 def to_camel_case(snake_str):
+    try:
+        return camel_case_names[snake_str]
+    except KeyError:
+        pass
     components = snake_str.split("_")
     # We capitalize the first letter of each component except the first one
     # with the 'capitalize' method and join them together.
-    return components[0] + "".join(x.capitalize() if x else "_" for x in components[1:])
+    return cache_name(
+        camel_case_names,
+        snake_str,
+        components[0] + "".join(x.capitalize() if x else "_" for x in components[1:]),
+    )
 
 
 # From this response in Stackoverflow
 # http://stackoverflow.com/a/1176023/1072990
 def to_snake_case(name):
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    try:
+        return snake_case_names[name]
+    except KeyError:
+        pass
+    s1 = FIRST_CAP_RE.sub(r"\1_\2", name)
+    return cache_name(snake_case_names, name, ALL_CAP_RE.sub(r"\1_\2", s1).lower())
+
+
+def convert_keys(data, convert):
+    """
+    Returns a copy of data (nested dicts and lists), with the keys of its dicts
+    converted by convert.
+    """
+    if isinstance(data, dict):
+        return {
+            convert(key): convert_keys(value, convert) for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [convert_keys(value, convert) for value in data]
+    return data
+
+
+def to_camel_case_keys(data):
+    return convert_keys(data, to_camel_case)
+
+
+def to_snake_case_keys(data):
+    return convert_keys(data, to_snake_case)
+
+
+def rename_keys(data, names):
+    """
+    Returns a copy of the data dict with its keys renamed by the names mapping
+    (such as the one returned by Schema.get_field_names), in one pass. The
+    keys missing from names are kept.
+    """
+    return {names.get(key, key): value for key, value in data.items()}
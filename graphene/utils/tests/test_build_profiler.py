@@ -0,0 +1,75 @@
+import json
+from itertools import count
+
+from graphene import Dynamic, Field, Int, ObjectType, Schema, String
+
+from ..build_profiler import SchemaBuildProfiler
+
+
+class Author(ObjectType):
+    name = String()
+
+
+class Book(ObjectType):
+    title = String()
+    pages = Int()
+    author = Dynamic(lambda: Field(Author))
+
+
+class Query(ObjectType):
+    book = Field(Book)
+
+
+def test_build_profiler_measures_are_exclusive():
+    profiler = SchemaBuildProfiler(timer=count().__next__)
+    with profiler.measure("schema"):  # 0
+        with profiler.measure("fields", "Query"):  # 1
+            with profiler.measure("create", "Book"):  # 2
+                pass  # 3
+        # 4
+        with profiler.measure("fields", "Book"):  # 5
+            pass  # 6
+    # 7
+
+    assert {phase: time for phase, (time, _) in profiler.phases.items()} == {
+        "schema": 3,
+        "fields": 3,
+        "create": 1,
+    }
+    assert {
+        name: {phase: time for phase, (time, _) in phases.items()}
+        for name, phases in profiler.types.items()
+    } == {"Query": {"fields": 2}, "Book": {"create": 1, "fields": 1}}
+
+
+def test_build_profiler_schema():
+    profiler = SchemaBuildProfiler()
+    Schema(Query, build_profiler=profiler)
+
+    profile = json.loads(profiler.to_json())
+    assert set(profile["phases"]) == {
+        "type_map",
+        "create",
+        "schema",
+        "fields",
+        "validation",
+    }
+    types = {type_profile["name"]: type_profile for type_profile in profile["types"]}
+    assert {"Query", "Book", "Author", "String", "Int"} <= set(types)
+    assert set(types["Book"]["phases"]) == {"create", "fields"}
+    times = [type_profile["time"] for type_profile in profile["types"]]
+    assert times == sorted(times, reverse=True)
+    assert profile["total_time"] >= sum(times)
+
+    report = profiler.report(limit=2)
+    assert report.startswith("Schema build: ")
+    assert "validation" in report
+    assert len(report.splitlines()) == 2 + 6 + 1 + 1 + 2
+
+
+def test_build_profiler_lazy_schema():
+    profiler = SchemaBuildProfiler()
+    schema = Schema(Query, build_profiler=profiler, lazy=True)
+    assert profiler.phases == {}
+    schema.build()
+    assert "Book" in profiler.types
@@ -1,9 +1,25 @@
-from asyncio import gather
+from asyncio import gather, sleep, wait_for
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
+from time import sleep as blocking_sleep
 from functools import partial
 from unittest.mock import Mock
 
-from graphene.utils.dataloader import DataLoader
+from graphene.utils.dataloader import (
+    BatchSemaphore,
+    DataLoader,
+    DataLoaderRegistry,
+    LRUCacheMap,
+    SharedScheduler,
+    SizedCacheMap,
+    SyncDataLoader,
+    TickScheduler,
+    TimeWindowScheduler,
+    TTLCacheMap,
+    get_canonical_key,
+    missing_key_error,
+)
 from pytest import mark, raises
 
 from graphene import ObjectType, String, Schema, Field, List
@@ -450,3 +466,661 @@ async def test_dataloader_clear_with_missing_key_works():
 
     a_loader, a_load_calls = id_loader(resolve=do_resolve)
     assert a_loader.clear("A1") == a_loader
+
+
+async def load_after_ticks(loader, key, ticks):
+    for _ in range(ticks):
+        await sleep(0)
+    return await loader.load(key)
+
+
+@mark.asyncio
+async def test_splits_batches_of_loads_several_ticks_apart():
+    identity_loader, load_calls = id_loader()
+
+    values = await gather(
+        load_after_ticks(identity_loader, "A", 0),
+        load_after_ticks(identity_loader, "B", 4),
+    )
+
+    assert values == ["A", "B"]
+    assert load_calls == [["A"], ["B"]]
+
+
+@mark.asyncio
+@mark.parametrize(
+    "scheduler",
+    [
+        TickScheduler(ticks=5),
+        TimeWindowScheduler(window=0.01),
+        SharedScheduler(idle_ticks=3),
+    ],
+)
+async def test_schedulers_batch_loads_several_ticks_apart(scheduler):
+    identity_loader, load_calls = id_loader(scheduler=scheduler)
+
+    values = await gather(
+        load_after_ticks(identity_loader, "A", 0),
+        load_after_ticks(identity_loader, "B", 2),
+        load_after_ticks(identity_loader, "C", 4),
+    )
+
+    assert values == ["A", "B", "C"]
+    assert load_calls == [["A", "B", "C"]]
+
+
+@mark.asyncio
+async def test_shared_scheduler_dispatches_loaders_together():
+    scheduler = SharedScheduler(idle_ticks=3)
+    dispatched = []
+
+    def loader(name):
+        async def resolve(keys):
+            dispatched.append((name, keys))
+            return keys
+
+        return id_loader(resolve=resolve, scheduler=scheduler)[0]
+
+    a_loader = loader("a")
+    b_loader = loader("b")
+
+    values = await gather(
+        load_after_ticks(a_loader, "A1", 0),
+        load_after_ticks(b_loader, "B1", 1),
+        load_after_ticks(a_loader, "A2", 3),
+    )
+    assert values == ["A1", "B1", "A2"]
+    assert dispatched == [("a", ["A1", "A2"]), ("b", ["B1"])]
+
+    # The next loads are dispatched in a new round
+    assert await gather(a_loader.load("A3"), b_loader.load("B3")) == ["A3", "B3"]
+    assert dispatched[2:] == [("a", ["A3"]), ("b", ["B3"])]
+
+
+@mark.asyncio
+async def test_shared_scheduler_max_ticks():
+    scheduler = SharedScheduler(idle_ticks=3, max_ticks=2)
+    identity_loader, load_calls = id_loader(scheduler=scheduler)
+
+    values = await gather(
+        load_after_ticks(identity_loader, "A", 0),
+        load_after_ticks(identity_loader, "B", 1),
+        load_after_ticks(identity_loader, "C", 6),
+    )
+
+    assert values == ["A", "B", "C"]
+    assert load_calls == [["A", "B"], ["C"]]
+
+
+@mark.asyncio
+async def test_lru_cache_map():
+    cache_map = LRUCacheMap(max_size=2)
+    identity_loader, load_calls = id_loader(cache_map=cache_map)
+
+    assert await identity_loader.load_many(["A", "B"]) == ["A", "B"]
+    assert await identity_loader.load("A") == "A"
+    # B is the least recently used
+    assert await identity_loader.load("C") == "C"
+    assert "B" not in cache_map and "A" in cache_map
+
+    assert await identity_loader.load("B") == "B"
+    assert load_calls == [["A", "B"], ["C"], ["B"]]
+    assert cache_map.stats() == {
+        "hits": 1,
+        "misses": 4,
+        "evictions": 2,
+        "size": 2,
+        "max_size": 2,
+    }
+
+
+@mark.asyncio
+async def test_ttl_cache_map():
+    now = [0]
+    cache_map = TTLCacheMap(ttl=10, timer=lambda: now[0])
+    identity_loader, load_calls = id_loader(cache_map=cache_map)
+
+    assert await identity_loader.load("A") == "A"
+    now[0] = 5
+    assert await identity_loader.load("B") == "B"
+    assert await identity_loader.load("A") == "A"
+    assert load_calls == [["A"], ["B"]]
+
+    now[0] = 12
+    assert await identity_loader.load("A") == "A"
+    assert await identity_loader.load("B") == "B"
+    assert load_calls == [["A"], ["B"], ["A"]]
+    assert cache_map.evictions == 1
+
+    # Expired entries are evicted when new ones are stored
+    now[0] = 30
+    assert await identity_loader.load("C") == "C"
+    assert len(cache_map) == 1
+
+
+@mark.asyncio
+async def test_sized_cache_map():
+    cache_map = SizedCacheMap(max_total_size=10, get_size=len)
+    identity_loader, load_calls = id_loader(cache_map=cache_map)
+
+    assert await identity_loader.load_many(["aaaa", "bbbb"]) == ["aaaa", "bbbb"]
+    assert cache_map.total_size == 8
+    assert await identity_loader.load("cccc") == "cccc"
+    assert "aaaa" not in cache_map
+    assert cache_map.stats() == {
+        "hits": 0,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "total_size": 8,
+        "max_total_size": 10,
+    }
+
+    cache_map.clear()
+    assert cache_map.total_size == 0
+
+
+@mark.asyncio
+@mark.parametrize(
+    "cache_map",
+    [LRUCacheMap(), TTLCacheMap(ttl=60), SizedCacheMap(max_total_size=1024)],
+)
+async def test_cache_maps_evict_failed_futures(cache_map):
+    async def resolve(keys):
+        return [ValueError(key) if key == "bad" else key for key in keys]
+
+    identity_loader, load_calls = id_loader(resolve=resolve, cache_map=cache_map)
+    identity_loader.prime("primed", ValueError("primed"))
+
+    with raises(ValueError):
+        await identity_loader.load("bad")
+    assert await identity_loader.load("good") == "good"
+    assert "bad" not in cache_map
+    assert "good" in cache_map
+    # Primed errors are kept
+    assert "primed" in cache_map
+
+    with raises(ValueError):
+        await identity_loader.load("bad")
+    assert load_calls == [["bad"], ["good"], ["bad"]]
+
+
+class SyncCharacterType(ObjectType):
+    name = String()
+    sibling = Field(lambda: SyncCharacterType)
+
+    def resolve_sibling(character, info):
+        if character["sibling"]:
+            return info.context.character_loader.load(character["sibling"])
+        return None
+
+
+class SyncQuery(ObjectType):
+    skywalker_family = List(SyncCharacterType)
+
+    def resolve_skywalker_family(_, info):
+        return info.context.character_loader.load_many(["1", "2", "3"])
+
+
+def test_sync_dataloader():
+    load_calls = []
+
+    def batch_load_fn(character_ids):
+        load_calls.append(character_ids)
+        return [CHARACTERS[character_id] for character_id in character_ids]
+
+    schema = Schema(query=SyncQuery)
+    character_loader = SyncDataLoader(batch_load_fn)
+    character_loader.prime("2", CHARACTERS["2"])
+    context = Context(character_loader=character_loader)
+
+    query = "{ skywalkerFamily { name sibling { name sibling { name } } } }"
+    result = schema.execute(query, context=context, run_event_loop=True)
+
+    assert not result.errors
+    assert result.data == {
+        "skywalkerFamily": [
+            {
+                "name": "Luke Skywalker",
+                "sibling": {
+                    "name": "Leia Organa",
+                    "sibling": {"name": "Luke Skywalker"},
+                },
+            },
+            {"name": "Darth Vader", "sibling": None},
+            {
+                "name": "Leia Organa",
+                "sibling": {
+                    "name": "Luke Skywalker",
+                    "sibling": {"name": "Leia Organa"},
+                },
+            },
+        ]
+    }
+    # The loads are cached across executions
+    assert load_calls == [["1", "3"]]
+    assert schema.execute(query, context=context, run_event_loop=True) == result
+    assert load_calls == [["1", "3"]]
+
+    character_loader.clear("1")
+    assert schema.execute(query, context=context, run_event_loop=True) == result
+    assert load_calls == [["1", "3"], ["1"]]
+
+
+def test_sync_dataloader_requires_run_event_loop():
+    schema = Schema(query=SyncQuery)
+    context = Context(character_loader=SyncDataLoader(lambda keys: keys))
+
+    result = schema.execute("{ skywalkerFamily { name } }", context=context)
+    assert result.errors[0].message == (
+        "SyncDataLoader must be used in an execution running an event loop,"
+        " such as Schema.execute(..., run_event_loop=True)."
+    )
+
+
+def test_sync_dataloader_batch_load_fn_must_be_sync():
+    async def batch_load_fn(keys):
+        return keys
+
+    with raises(AssertionError):
+        SyncDataLoader(batch_load_fn)
+
+
+def upper_keys(keys):
+    return [key.upper() for key in keys]
+
+
+@mark.asyncio
+async def test_executor_runs_batches_off_the_loop():
+    ticks = []
+    ticks_during_batch = []
+
+    def blocking_batch_load_fn(keys):
+        blocking_sleep(0.1)
+        ticks_during_batch.append(len(ticks))
+        return keys
+
+    async def tick():
+        while len(ticks) < 5:
+            ticks.append(len(ticks))
+            await sleep(0.001)
+
+    with ThreadPoolExecutor() as executor:
+        loader = DataLoader(blocking_batch_load_fn, executor=executor)
+        values = await gather(loader.load_many(["A", "B"]), tick())
+
+    assert values[0] == ["A", "B"]
+    # The loop kept running while the batch was blocked
+    assert ticks_during_batch == [5]
+
+
+@mark.asyncio
+async def test_executor_max_concurrent_batches():
+    lock = Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+
+    def batch_load_fn(keys):
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        blocking_sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return keys
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        loader = DataLoader(
+            batch_load_fn,
+            executor=executor,
+            max_batch_size=1,
+            max_concurrent_batches=2,
+        )
+        values = await loader.load_many(["A", "B", "C", "D", "E"])
+
+    assert values == ["A", "B", "C", "D", "E"]
+    assert max_in_flight[0] == 2
+
+
+def test_executor_max_concurrent_batches_across_event_loops():
+    def batch_load_fn(character_ids):
+        blocking_sleep(0.001)
+        return [CHARACTERS[character_id] for character_id in character_ids]
+
+    schema = Schema(query=SyncQuery)
+    query = "{ skywalkerFamily { name } }"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        character_loader = SyncDataLoader(
+            batch_load_fn,
+            cache=False,
+            executor=executor,
+            max_batch_size=1,
+            max_concurrent_batches=1,
+        )
+        context = Context(character_loader=character_loader)
+        # Each execution runs its own event loop
+        for _ in range(2):
+            result = schema.execute(query, context=context, run_event_loop=True)
+            assert not result.errors
+            assert result.data == {
+                "skywalkerFamily": [
+                    {"name": "Luke Skywalker"},
+                    {"name": "Darth Vader"},
+                    {"name": "Leia Organa"},
+                ]
+            }
+
+
+@mark.asyncio
+async def test_process_pool_executor():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        loader = DataLoader(upper_keys, executor=executor)
+        assert await loader.load_many(["a", "b"]) == ["A", "B"]
+
+
+class SuffixLoader(DataLoader):
+    def __init__(self, suffix, **options):
+        self.suffix = suffix
+        super().__init__(**options)
+
+    def batch_load_fn(self, keys):
+        return [key + self.suffix for key in keys]
+
+
+@mark.asyncio
+async def test_process_pool_executor_loader_method():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        loader = SuffixLoader("!", executor=executor, max_concurrent_batches=1)
+        assert await loader.load_many(["a", "b"]) == ["a!", "b!"]
+        assert await loader.load("c") == "c!"
+
+
+def test_executor_batch_load_fn_must_be_sync():
+    async def batch_load_fn(keys):
+        return keys
+
+    with ThreadPoolExecutor() as executor:
+        with raises(AssertionError):
+            DataLoader(batch_load_fn, executor=executor)
+
+
+@mark.asyncio
+async def test_shared_batch_semaphore():
+    semaphore = BatchSemaphore(2)
+    in_flight = [0]
+    max_in_flight = [0]
+    observed_stats = []
+
+    async def batch_load_fn(keys):
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        await sleep(0.001)
+        observed_stats.append(semaphore.stats())
+        in_flight[0] -= 1
+        return keys
+
+    a_loader = DataLoader(batch_load_fn, max_batch_size=1, batch_semaphore=semaphore)
+    b_loader = DataLoader(batch_load_fn, max_batch_size=1, batch_semaphore=semaphore)
+
+    values = await gather(
+        a_loader.load_many(["A1", "A2", "A3"]), b_loader.load_many(["B1", "B2"])
+    )
+
+    assert values == [["A1", "A2", "A3"], ["B1", "B2"]]
+    assert max_in_flight[0] == 2
+    assert observed_stats[0] == {
+        "waiting_batches": 3,
+        "in_flight_batches": 2,
+        "max_concurrent_batches": 2,
+    }
+    assert semaphore.stats()["in_flight_batches"] == 0
+
+
+@mark.asyncio
+async def test_dataloader_stats():
+    observed_stats = []
+
+    async def batch_load_fn(keys):
+        await sleep(0)
+        observed_stats.append(loader.stats())
+        return keys
+
+    loader = DataLoader(batch_load_fn, max_batch_size=2, max_concurrent_batches=1)
+    futures = [loader.load(key) for key in "ABCDE"]
+    assert loader.stats() == {
+        "queued_keys": 5,
+        "waiting_batches": 0,
+        "in_flight_batches": 0,
+    }
+
+    assert await gather(*futures) == list("ABCDE")
+    assert observed_stats == [
+        {"queued_keys": 0, "waiting_batches": 2, "in_flight_batches": 1},
+        {"queued_keys": 0, "waiting_batches": 1, "in_flight_batches": 1},
+        {"queued_keys": 0, "waiting_batches": 0, "in_flight_batches": 1},
+    ]
+    assert loader.stats()["in_flight_batches"] == 0
+
+
+@mark.asyncio
+async def test_deduplicates_keys_without_cache():
+    identity_loader, load_calls = id_loader(cache=False)
+
+    a1, b, a2 = (
+        identity_loader.load("A"),
+        identity_loader.load("B"),
+        identity_loader.load("A"),
+    )
+    assert a1 is a2
+    assert await gather(a1, b, a2) == ["A", "B", "A"]
+    assert load_calls == [["A", "B"]]
+
+    # Without caching, later loads are loaded again
+    assert await identity_loader.load("A") == "A"
+    assert load_calls == [["A", "B"], ["A"]]
+
+
+def test_get_canonical_key():
+    assert get_canonical_key("A") == "A"
+    assert get_canonical_key(1) == 1
+    assert get_canonical_key({"a": [1, 2], "b": {"c": {3}}}) == get_canonical_key(
+        {"b": {"c": {3}}, "a": (1, 2)}
+    )
+    assert get_canonical_key({"a": 1}) != get_canonical_key({"a": 2})
+    assert get_canonical_key({"a": 1}) != get_canonical_key({("a", 1)})
+    assert hash(get_canonical_key([{"a": [1]}, {2}]))
+
+
+@mark.asyncio
+async def test_deduplicates_unhashable_keys():
+    async def resolve(filters):
+        return [sum(f["ids"]) for f in filters]
+
+    loader, load_calls = id_loader(resolve=resolve, get_cache_key=get_canonical_key)
+
+    values = await gather(
+        loader.load({"ids": [1, 2], "active": True}),
+        loader.load({"active": True, "ids": [1, 2]}),
+        loader.load({"ids": [3]}),
+    )
+    assert values == [3, 3, 3]
+    assert load_calls == [[{"ids": [1, 2], "active": True}, {"ids": [3]}]]
+
+
+@mark.asyncio
+async def test_loads_unhashable_keys_without_cache():
+    async def resolve(filters):
+        return [sum(f["ids"]) for f in filters]
+
+    loader, load_calls = id_loader(resolve=resolve, cache=False)
+
+    values = await gather(loader.load({"ids": [1, 2]}), loader.load({"ids": [1, 2]}))
+    assert values == [3, 3]
+    # Unhashable keys can't be deduplicated
+    assert load_calls == [[{"ids": [1, 2]}, {"ids": [1, 2]}]]
+
+
+class RegistryCharacterLoader(DataLoader):
+    load_calls: list = []
+
+    async def batch_load_fn(self, character_ids):
+        self.load_calls.append(character_ids)
+        return [CHARACTERS[character_id] for character_id in character_ids]
+
+
+class RegistryCharacterType(ObjectType):
+    name = String()
+    sibling = Field(lambda: RegistryCharacterType)
+
+    async def resolve_sibling(character, info):
+        if character["sibling"]:
+            loader = info.context.dataloaders[RegistryCharacterLoader]
+            return await loader.load(character["sibling"])
+        return None
+
+
+class RegistryQuery(ObjectType):
+    skywalker_family = List(RegistryCharacterType)
+
+    async def resolve_skywalker_family(_, info):
+        loader = info.context.dataloaders.get(RegistryCharacterLoader)
+        return await loader.load_many(["1", "2"])
+
+
+@mark.asyncio
+async def test_dataloader_registry_in_execute_async():
+    RegistryCharacterLoader.load_calls.clear()
+    schema = Schema(query=RegistryQuery)
+    query = "{ skywalkerFamily { name sibling { name } } }"
+
+    registry = DataLoaderRegistry()
+    result = await schema.execute_async(query, dataloaders=registry)
+    assert not result.errors
+    assert result.data == {
+        "skywalkerFamily": [
+            {"name": "Luke Skywalker", "sibling": {"name": "Leia Organa"}},
+            {"name": "Darth Vader", "sibling": None},
+        ]
+    }
+    assert RegistryCharacterLoader.load_calls == [["1", "2"], ["3"]]
+    # The registry is closed once the operation is done
+    assert len(registry) == 0
+
+    # Every operation gets its own loaders
+    assert await schema.execute_async(query, dataloaders=True) == result
+    assert RegistryCharacterLoader.load_calls == [["1", "2"], ["3"]] * 2
+
+
+@mark.asyncio
+async def test_dataloader_registry_attaches_to_context():
+    class Context:
+        pass
+
+    schema = Schema(query=RegistryQuery)
+    query = "{ skywalkerFamily { name } }"
+
+    context = Context()
+    result = await schema.execute_async(query, context=context, dataloaders=True)
+    assert not result.errors
+    assert isinstance(context.dataloaders, DataLoaderRegistry)
+
+    seen = []
+
+    class DictQuery(ObjectType):
+        name = String()
+
+        def resolve_name(_, info):
+            seen.append(info.context["dataloaders"])
+            return "name"
+
+    context = {}
+    result = await Schema(query=DictQuery).execute_async(
+        "{ name }", context=context, dataloaders=True
+    )
+    assert result.data == {"name": "name"}
+    assert seen == [context["dataloaders"]]
+
+
+@mark.asyncio
+async def test_dataloader_registry_prime_many_and_close():
+    registry = DataLoaderRegistry()
+    loader = registry[RegistryCharacterLoader]
+    assert registry.get(RegistryCharacterLoader) is loader
+    assert RegistryCharacterLoader in registry
+
+    characters = [{"id": "1", "name": "Luke"}, None, ValueError("Not found")]
+    assert (
+        registry.prime_many(
+            RegistryCharacterLoader, characters, lambda character: character["id"]
+        )
+        is characters
+    )
+    assert await loader.load("1") == {"id": "1", "name": "Luke"}
+
+    pending = loader.load("3")
+    registry.close()
+    assert len(registry) == 0
+    assert not loader._queue and not loader._cache
+    assert pending.cancelled()
+    # The dispatch scheduled for the dropped queue does nothing
+    await sleep(0)
+    await sleep(0)
+    assert pending.cancelled()
+
+
+@mark.asyncio
+async def test_batch_load_fn_returning_mapping():
+    async def batch_load_fn(character_ids):
+        return {
+            character_id: CHARACTERS[character_id]["name"]
+            for character_id in character_ids
+            if character_id in CHARACTERS
+        }
+
+    loader = DataLoader(batch_load_fn)
+    assert await loader.load_many(["3", "4", "1"]) == [
+        "Leia Organa",
+        None,
+        "Luke Skywalker",
+    ]
+
+
+@mark.asyncio
+async def test_batch_load_fn_returning_mapping_missing_value():
+    async def batch_load_fn(keys):
+        return {"A": "a", "B": ValueError("B")}
+
+    loader = DataLoader(batch_load_fn, missing_value=missing_key_error)
+    a, b, c = await gather(
+        loader.load("A"), loader.load("B"), loader.load("C"), return_exceptions=True
+    )
+    assert a == "a"
+    assert isinstance(b, ValueError)
+    assert isinstance(c, KeyError) and c.args == ("C",)
+
+    class DefaultLoader(DataLoader):
+        async def batch_load_fn(self, keys):
+            return {}
+
+        def missing_value(self, key):
+            return "default " + key
+
+    assert await DefaultLoader().load("A") == "default A"
+
+
+@mark.asyncio
+async def test_batch_load_fn_returning_mapping_raising_missing_value():
+    async def batch_load_fn(keys):
+        return {}
+
+    def missing_value(key):
+        if key == "b":
+            raise LookupError(key)
+        return key.upper()
+
+    loader = DataLoader(batch_load_fn, missing_value=missing_value)
+    with raises(LookupError):
+        await wait_for(loader.load_many(["a", "b", "c"]), 1)
+    # Only the load of "b" is rejected
+    assert await wait_for(loader.load("a"), 1) == "A"
+    assert await wait_for(loader.load("c"), 1) == "C"
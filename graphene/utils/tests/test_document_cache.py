@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from ..document_cache import DocumentCache
+
+
+def test_document_cache_lru():
+    cache = DocumentCache(max_size=2)
+    cache.set("a", "document a")
+    cache.set("b", "document b")
+    assert cache.get("a").document == "document a"
+
+    cache.set("c", "document c")
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.get("b") is None
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "size": 2,
+        "max_size": 2,
+    }
+
+
+def test_document_cache_errors():
+    cache = DocumentCache()
+    cached = cache.set("a", "document a", ["error"])
+    assert cached.errors == ["error"]
+    assert cache.set("b", "document b").errors == []
+    assert len(cache.clear()) == 0
+
+
+def test_document_cache_errors_are_copied():
+    cache = DocumentCache()
+    cache.set("a", "document a", ["error"]).errors.append("other error")
+    cache.get("a").errors.append("other error")
+    assert cache.get("a").errors == ["error"]
+
+
+def test_document_cache_threads():
+    cache = DocumentCache(max_size=4)
+
+    def use_cache(offset):
+        for index in range(1000):
+            key = (index + offset) % 8
+            if cache.get(key) is None:
+                cache.set(key, f"document {key}")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(use_cache, range(4)))
+    assert cache.size == 4
+    assert cache.hits + cache.misses == 4000
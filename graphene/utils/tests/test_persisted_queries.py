@@ -0,0 +1,167 @@
+import json
+
+from graphql import Source
+from pytest import mark
+
+from graphene import Int, ObjectType, Schema, String
+from graphene.test import Client
+
+from ..persisted_queries import (
+    FilePersistedQueryStore,
+    InMemoryPersistedQueryStore,
+    get_query_hash,
+)
+
+
+class Query(ObjectType):
+    hello = String(name=String(default_value="world"))
+
+    def resolve_hello(root, info, name):
+        return f"Hello, {name}!"
+
+
+class Subscription(ObjectType):
+    count_to_three = Int()
+
+    async def subscribe_count_to_three(root, info):
+        for count in range(1, 4):
+            yield count
+
+
+QUERY = "{ hello }"
+QUERY_HASH = get_query_hash(QUERY)
+
+
+def persisted_query(query_hash=QUERY_HASH, version=1):
+    return {"persistedQuery": {"version": version, "sha256Hash": query_hash}}
+
+
+def test_get_query_hash():
+    assert (
+        QUERY_HASH == "001c3174e099bd72b729d0c0a529ba9f5a740c446e2a6e1d71b283cb84ec3065"
+    )
+
+
+def test_get_query_hash_source():
+    assert get_query_hash(Source(QUERY)) == QUERY_HASH
+
+
+def test_persisted_query_source():
+    store = InMemoryPersistedQueryStore()
+    schema = Schema(Query, persisted_queries=store)
+
+    result = schema.execute(Source(QUERY), extensions=persisted_query())
+    assert result.data == {"hello": "Hello, world!"}
+    assert store.get(QUERY_HASH) == QUERY
+
+
+def test_in_memory_persisted_query_store_lru():
+    store = InMemoryPersistedQueryStore(max_size=2)
+    store.set("a", "query a")
+    store.set("b", "query b")
+    assert store.get("a") == "query a"
+
+    store.set("c", "query c")
+    assert "b" not in store
+    assert store.get("a") == "query a"
+    assert len(store) == 2
+    assert InMemoryPersistedQueryStore().max_size == 10000
+
+
+def test_automatic_persisted_query():
+    store = InMemoryPersistedQueryStore()
+    schema = Schema(Query, persisted_queries=store)
+
+    # The client first sends only the hash
+    result = schema.execute(extensions=persisted_query())
+    assert result.data is None
+    assert result.errors[0].message == "PersistedQueryNotFound"
+    assert result.errors[0].extensions == {"code": "PERSISTED_QUERY_NOT_FOUND"}
+
+    # Then registers the query along with its hash
+    result = schema.execute(QUERY, extensions=persisted_query())
+    assert not result.errors
+    assert result.data == {"hello": "Hello, world!"}
+    assert QUERY_HASH in store
+
+    # Next requests only send the hash, and skip parsing and validation
+    result = schema.execute(extensions=persisted_query())
+    assert not result.errors
+    assert result.data == {"hello": "Hello, world!"}
+    assert schema.document_cache.hits == 1
+
+
+def test_persisted_query_hash_mismatch():
+    store = InMemoryPersistedQueryStore()
+    schema = Schema(Query, persisted_queries=store)
+
+    result = schema.execute("{ __typename }", extensions=persisted_query())
+    assert result.errors[0].message == "provided sha does not match query"
+    assert len(store) == 0
+
+
+def test_persisted_query_not_supported():
+    schema = Schema(Query)
+    result = schema.execute(extensions=persisted_query())
+    assert result.errors[0].message == "PersistedQueryNotSupported"
+
+    schema = Schema(Query, persisted_queries=InMemoryPersistedQueryStore())
+    result = schema.execute(QUERY, extensions=persisted_query(version=2))
+    assert result.errors[0].message == "PersistedQueryNotSupported"
+
+
+def test_persisted_query_with_client():
+    schema = Schema(
+        Query, persisted_queries=InMemoryPersistedQueryStore({QUERY_HASH: QUERY})
+    )
+    client = Client(schema)
+    assert client.execute(extensions=persisted_query()) == {
+        "data": {"hello": "Hello, world!"}
+    }
+
+
+@mark.parametrize(
+    "manifest",
+    [
+        {QUERY_HASH: QUERY},
+        {
+            "format": "apollo-persisted-query-manifest",
+            "version": 1,
+            "operations": [{"id": QUERY_HASH, "name": None, "body": QUERY}],
+        },
+    ],
+)
+def test_file_persisted_query_store(tmp_path, manifest):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest))
+    store = FilePersistedQueryStore(str(path))
+    schema = Schema(Query, persisted_queries=store)
+
+    result = schema.execute(extensions=persisted_query())
+    assert result.data == {"hello": "Hello, world!"}
+
+    # Queries sent by clients are executed but not registered in the manifest
+    other_query = '{ hello(name: "you") }'
+    result = schema.execute(
+        other_query, extensions=persisted_query(get_query_hash(other_query))
+    )
+    assert result.data == {"hello": "Hello, you!"}
+    assert get_query_hash(other_query) not in store
+
+
+@mark.asyncio
+async def test_persisted_query_async_and_subscribe():
+    subscription = "subscription { countToThree }"
+    store = InMemoryPersistedQueryStore(
+        {QUERY_HASH: QUERY, get_query_hash(subscription): subscription}
+    )
+    schema = Schema(Query, subscription=Subscription, persisted_queries=store)
+
+    result = await schema.execute_async(extensions=persisted_query())
+    assert result.data == {"hello": "Hello, world!"}
+
+    result = await schema.subscribe(
+        extensions=persisted_query(get_query_hash(subscription))
+    )
+    counts = [item.data["countToThree"] async for item in result]
+    assert counts == [1, 2, 3]
@@ -0,0 +1,189 @@
+import importlib
+import sys
+
+from pytest import fixture, mark
+
+from graphene import (
+    DateTime,
+    Enum,
+    Field,
+    InputObjectType,
+    Int,
+    Interface,
+    List,
+    ObjectType,
+    Schema,
+    String,
+    Union,
+)
+from graphene.relay import Connection, ConnectionField, Node
+
+from ...types.tests.utils import create_big_schema_types
+from ..schema_snapshot import load_schema_snapshot
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+
+
+class Named(Interface):
+    name = String()
+
+
+class Pet(ObjectType):
+    class Meta:
+        interfaces = (Named, Node)
+
+    color = Field(Color)
+    nickname = String(resolver=lambda root, info: f"Little {root.name}")
+
+    @staticmethod
+    def get_node(info, id):
+        return Pet(id=id, name=f"Pet {id}", color=Color.GREEN)
+
+
+class Owner(ObjectType):
+    class Meta:
+        interfaces = (Named,)
+        root_kind = "dict"
+
+    pets = List(Pet)
+
+
+class Anything(Union):
+    class Meta:
+        types = (Pet, Owner)
+
+
+class PetFilter(InputObjectType):
+    color = Color(default_value=Color.RED)
+    limit = Int(default_value=2)
+
+
+class PetConnection(Connection):
+    class Meta:
+        node = Pet
+
+
+PETS = [Pet(id=index, name=f"Pet {index}", color=Color.RED) for index in range(3)]
+
+
+class Query(ObjectType):
+    node = Node.Field()
+    pets = List(Pet, filter=PetFilter())
+    pet_connection = ConnectionField(PetConnection)
+    owner = Field(Owner)
+    anything = List(Anything)
+    now = DateTime()
+
+    def resolve_pets(root, info, filter=None):
+        return [pet for pet in PETS if pet.color == filter.color][: filter.limit]
+
+    def resolve_pet_connection(root, info, **args):
+        return PETS
+
+    def resolve_owner(root, info):
+        return {"name": "Owner", "pets": PETS[:1]}
+
+    def resolve_anything(root, info):
+        return PETS[:2]
+
+
+QUERY = """
+{
+    node(id: "UGV0OjE=") { id ... on Pet { name color nickname } }
+    pets(filter: { limit: 1 }) { name color }
+    petConnection(first: 2) { edges { cursor node { name } } pageInfo { hasNextPage } }
+    owner { name pets { id nickname } }
+    anything { __typename ... on Named { name } }
+}
+"""
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "schema.snapshot"
+    schema = Schema(Query, types=[Pet])
+    schema.save_snapshot(path)
+
+    loaded_schema = Schema.load_snapshot(path)
+    assert isinstance(loaded_schema, Schema)
+    assert loaded_schema.query is Query
+    assert str(loaded_schema) == str(schema)
+    assert loaded_schema.Pet is Pet
+    assert loaded_schema.PetEdge is PetConnection.Edge
+    expected = schema.execute(QUERY)
+    assert not expected.errors
+    assert loaded_schema.execute(QUERY) == expected
+
+
+def test_snapshot_rebuilds_unpicklable_resolvers(tmp_path):
+    path = tmp_path / "schema.snapshot"
+    Schema(Query).save_snapshot(path)
+    _graphql_schema, _options, rebuild_fields = load_schema_snapshot(path)
+    # Lambdas and the closures of the dict root_kind resolvers can't be pickled
+    assert ("Pet", "nickname") in rebuild_fields
+    assert ("Owner", "name") in rebuild_fields
+    assert ("Query", "pets") not in rebuild_fields
+
+
+def test_snapshot_options(tmp_path):
+    path = tmp_path / "schema.snapshot"
+    Schema(Query, auto_camelcase=False).save_snapshot(path)
+    loaded_schema = Schema.load_snapshot(path, document_cache_size=10)
+    assert loaded_schema.document_cache.max_size == 10
+    assert "pet_connection" in loaded_schema.graphql_schema.query_type.fields
+
+
+def test_snapshot_missing(tmp_path):
+    assert Schema.load_snapshot(tmp_path / "missing.snapshot") is None
+
+
+def test_snapshot_stale(tmp_path, monkeypatch):
+    module_path = tmp_path / "snapshot_schema.py"
+    module_path.write_text(
+        "from graphene import ObjectType, String\n"
+        "class Query(ObjectType):\n"
+        "    hello = String(default_value='world')\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "snapshot_schema", raising=False)
+    snapshot_schema = importlib.import_module("snapshot_schema")
+
+    path = tmp_path / "schema.snapshot"
+    Schema(snapshot_schema.Query).save_snapshot(path)
+    loaded_schema = Schema.load_snapshot(path)
+    assert loaded_schema.execute("{ hello }").data == {"hello": "world"}
+
+    module_path.write_text(module_path.read_text().replace("world", "snapshot"))
+    assert Schema.load_snapshot(path) is None
+
+
+@fixture(scope="module")
+def big_schema_types():
+    query, types = create_big_schema_types(1000, module=__name__)
+    # Make the types importable, so the snapshot can reference them
+    module_globals = globals()
+    for type_ in (query, *types):
+        module_globals[type_.__name__] = type_
+    yield query, types
+    for type_ in (query, *types):
+        del module_globals[type_.__name__]
+
+
+@mark.parametrize("boot", ["build", "snapshot"])
+def test_big_schema_boot_benchmark(benchmark, tmp_path, big_schema_types, boot):
+    query, types = big_schema_types
+    path = tmp_path / "schema.snapshot"
+    Schema(query, types=types).save_snapshot(path)
+
+    def build():
+        return Schema(query, types=types)
+
+    def load_snapshot():
+        return Schema.load_snapshot(path)
+
+    schema = benchmark.pedantic(
+        build if boot == "build" else load_snapshot, rounds=5, warmup_rounds=1
+    )
+    assert len(schema.graphql_schema.type_map) > len(types)
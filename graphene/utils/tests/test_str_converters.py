@@ -1,5 +1,12 @@
 # coding: utf-8
-from ..str_converters import to_camel_case, to_snake_case
+from .. import str_converters
+from ..str_converters import (
+    rename_keys,
+    to_camel_case,
+    to_camel_case_keys,
+    to_snake_case,
+    to_snake_case_keys,
+)
 
 
 def test_snake_case():
@@ -17,3 +24,33 @@ def test_camel_case():
     assert to_camel_case("snakes_on_a__plane") == "snakesOnA_Plane"
     assert to_camel_case("i_phone_hysteria") == "iPhoneHysteria"
     assert to_camel_case("field_i18n") == "fieldI18n"
+
+
+def test_converted_names_are_cached():
+    assert to_camel_case("cached_snake_name") is to_camel_case("cached_snake_name")
+    assert to_snake_case("cachedCamelName") is to_snake_case("cachedCamelName")
+
+
+def test_converted_names_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(str_converters, "snake_case_names", {})
+    monkeypatch.setattr(str_converters, "MAX_CACHED_NAMES", 2)
+    for name in ("firstName", "secondName", "thirdName"):
+        assert to_snake_case(name) == name.replace("N", "_n")
+    assert str_converters.snake_case_names == {
+        "firstName": "first_name",
+        "secondName": "second_name",
+    }
+
+
+def test_convert_keys():
+    data = {"firstName": "Ann", "pets": [{"petName": "Rex"}], "tags": ["someTag"]}
+    assert to_snake_case_keys(data) == {
+        "first_name": "Ann",
+        "pets": [{"pet_name": "Rex"}],
+        "tags": ["someTag"],
+    }
+    assert to_camel_case_keys(to_snake_case_keys(data)) == data
+    assert rename_keys({"firstName": "Ann", "other": 1}, {"firstName": "name"}) == {
+        "name": "Ann",
+        "other": 1,
+    }
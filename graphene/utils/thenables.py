@@ -7,7 +7,12 @@ from inspect import isawaitable
 
 def await_and_execute(obj, on_resolve):
     async def build_resolve_async():
-        return on_resolve(await obj)
+        result = on_resolve(await obj)
+        # on_resolve may itself return an awaitable (such as a page fetched
+        # asynchronously), which the executor wouldn't await
+        if isawaitable(result):
+            return await result
+        return result
 
     return build_resolve_async()
 
@@ -56,6 +56,15 @@ def depth_limit_validator(
     callback: Optional[Callable[[Dict[str, int]], None]] = None,
 ):
     class DepthLimitValidator(ValidationRule):
+        # Rules built with the same arguments share their cached documents,
+        # even when the rule is built on each request
+        document_cache_key = (
+            depth_limit_validator,
+            max_depth,
+            tuple(ignore) if ignore else (),
+            callback,
+        )
+
         def __init__(self, validation_context: ValidationContext):
             document = validation_context.document
             definitions = document.definitions